@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Article
+
+Compact record type for news articles, shared by all collectors.
+
+Article uses __slots__ instead of a per-instance dict, interns the source
+and category strings (a few dozen distinct values shared by every
+article), and stores the publication date as integer epoch seconds with
+the usual 'YYYY-MM-DD' string available through the `date` property.
+
+Articles still behave like the dicts they replace: article['views'],
+article.get('is_current', False), 'url' in article and dict(article) all
+work, and unset optional fields read as missing keys. 'engagement', used
+by the simpler collectors, is an alias of 'views'.
+"""
+
+import json
+import sys
+from datetime import datetime
+from functools import lru_cache
+
+
+DATE_FORMAT = "%Y-%m-%d"
+
+# Mapping keys in output order; 'date' is derived from date_ts
+FIELDS = ('rank', 'title', 'source', 'summary', 'url', 'date', 'views', 'shares',
+          'comments', 'category', 'is_current', 'is_real', 'duplicate_urls')
+
+ALIASES = {'engagement': 'views'}
+
+
+@lru_cache(maxsize=4096)
+def format_date(date_ts):
+    """'YYYY-MM-DD' for an epoch timestamp (dates repeat a lot, so this is cached)."""
+    return datetime.fromtimestamp(date_ts).strftime(DATE_FORMAT)
+
+
+@lru_cache(maxsize=4096)
+def parse_date(date_text):
+    """Epoch seconds of local midnight for a 'YYYY-MM-DD' date."""
+    return int(datetime.strptime(date_text, DATE_FORMAT).timestamp())
+
+
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class Article:
+    """News article record with dict-style access."""
+    
+    __slots__ = ('rank', 'title', 'source', 'summary', 'url', 'date_ts', 'views', 'shares',
+                 'comments', 'category', 'is_current', 'is_real', 'duplicate_urls')
+    
+    def __init__(self, title, source, date, summary=None, url=None, views=0, shares=None, comments=None,
+                 category=None, rank=None, is_current=None, is_real=None, duplicate_urls=None):
+        self.rank = rank
+        self.title = title
+        self.source = _intern(source)
+        self.summary = summary
+        self.url = url
+        self.date = date
+        self.views = views
+        self.shares = shares
+        self.comments = comments
+        self.category = _intern(category)
+        self.is_current = is_current
+        self.is_real = is_real
+        self.duplicate_urls = duplicate_urls
+    
+    @classmethod
+    def from_dict(cls, data):
+        """Build an Article from a news dict, accepting 'engagement' for 'views'."""
+        kwargs = {ALIASES.get(key, key): value for key, value in data.items()}
+        return cls(**kwargs)
+    
+    @property
+    def date(self):
+        return format_date(self.date_ts)
+    
+    @date.setter
+    def date(self, value):
+        if isinstance(value, datetime):
+            value = value.strftime(DATE_FORMAT)
+        self.date_ts = value if isinstance(value, int) else parse_date(value)
+    
+    @property
+    def engagement(self):
+        return self.views
+    
+    # Mapping compatibility
+    
+    def _field(self, key):
+        key = ALIASES.get(key, key)
+        if key not in FIELDS:
+            raise KeyError(key)
+        return key
+    
+    def __getitem__(self, key):
+        value = getattr(self, self._field(key))
+        if value is None:
+            raise KeyError(key)
+        return value
+    
+    def __setitem__(self, key, value):
+        key = self._field(key)
+        if key in ('source', 'category'):
+            value = _intern(value)
+        setattr(self, key, value)
+    
+    def __contains__(self, key):
+        key = ALIASES.get(key, key)
+        return key in FIELDS and getattr(self, key) is not None
+    
+    def get(self, key, default=None):
+        key = ALIASES.get(key, key)
+        if key not in FIELDS:
+            return default
+        value = getattr(self, key)
+        return default if value is None else value
+    
+    def keys(self):
+        return [key for key in FIELDS if getattr(self, key) is not None]
+    
+    def __iter__(self):
+        return iter(self.keys())
+    
+    def copy(self):
+        return Article(**self.to_dict())
+    
+    def to_dict(self):
+        """Plain dict of the fields that are set."""
+        return {key: getattr(self, key) for key in FIELDS if getattr(self, key) is not None}
+    
+    def __repr__(self):
+        return f"Article({self.title!r}, {self.source!r}, {self.date!r})"
+
+
+class ArticleJSONEncoder(json.JSONEncoder):
+    """JSON encoder that writes Articles as plain objects."""
+    
+    def default(self, o):
+        if isinstance(o, Article):
+            return o.to_dict()
+        return super().default(o)
+
+
+def dumps(data, **kwargs):
+    """json.dumps that understands Articles anywhere in data."""
+    kwargs.setdefault('ensure_ascii', False)
+    return json.dumps(data, cls=ArticleJSONEncoder, **kwargs)
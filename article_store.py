@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Article Store
+
+Embedded SQLite store for the scraped news history. Each article is kept
+once per canonical URL and upserted on every run, so the latest engagement
+numbers overwrite the old ones while every observation is appended to an
+engagement_history table. Articles are indexed by canonical URL,
+publication date, source and category, so history queries answer in
+milliseconds instead of scanning HTML snapshots.
+
+URLs of near-duplicates that were merged into an article are kept as
+aliases of it, so incremental runs recognize them as already ingested.
+An upserted article whose URL or merged URLs are already known, directly
+or as aliases, updates that article instead of adding a second row.
+
+Only real articles are stored. Simulated filler (is_real False) is made
+up fresh on every run with random sources and URLs, so storing it would
+pile up fake rows that compete with real articles in every query.
+
+The database runs in WAL mode: pages can be rendered from it while a
+scrape is writing.
+"""
+
+import sqlite3
+import threading
+from datetime import datetime
+
+from article import Article
+from article_table import ArticleTable
+from url_tools import dedupe_key
+from vector_scoring import DEFAULT_GRAVITY, hot_scores, top_k_indices
+
+
+DEFAULT_DB_PATH = "hr_news.db"
+
+# URLs looked up per query in known_urls
+KNOWN_URLS_BATCH = 500
+
+# Articles published within this many days count as current
+CURRENT_DAYS = 7
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY,
+    canonical_url TEXT NOT NULL UNIQUE,
+    url TEXT NOT NULL,
+    title TEXT NOT NULL,
+    source TEXT NOT NULL,
+    summary TEXT NOT NULL DEFAULT '',
+    category TEXT NOT NULL DEFAULT '',
+    published_date TEXT NOT NULL,
+    published_ts INTEGER NOT NULL,
+    views INTEGER NOT NULL DEFAULT 0,
+    shares INTEGER NOT NULL DEFAULT 0,
+    comments INTEGER NOT NULL DEFAULT 0,
+    is_real INTEGER NOT NULL DEFAULT 0,
+    first_seen_ts INTEGER NOT NULL,
+    last_seen_ts INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_articles_published ON articles (published_ts);
+CREATE INDEX IF NOT EXISTS idx_articles_source ON articles (source, published_ts);
+CREATE INDEX IF NOT EXISTS idx_articles_category ON articles (category, published_ts);
+CREATE INDEX IF NOT EXISTS idx_articles_last_seen ON articles (last_seen_ts);
+
+CREATE TABLE IF NOT EXISTS engagement_history (
+    article_id INTEGER NOT NULL REFERENCES articles (id) ON DELETE CASCADE,
+    observed_ts INTEGER NOT NULL,
+    views INTEGER NOT NULL,
+    shares INTEGER NOT NULL,
+    comments INTEGER NOT NULL,
+    PRIMARY KEY (article_id, observed_ts)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS article_aliases (
+    canonical_url TEXT PRIMARY KEY,
+    article_id INTEGER NOT NULL REFERENCES articles (id) ON DELETE CASCADE
+) WITHOUT ROWID;
+"""
+
+INSERT_ARTICLE = """
+INSERT INTO articles (canonical_url, url, title, source, summary, category, published_date, published_ts,
+                      views, shares, comments, is_real, first_seen_ts, last_seen_ts)
+VALUES (:canonical_url, :url, :title, :source, :summary, :category, :published_date, :published_ts,
+        :views, :shares, :comments, :is_real, :observed_ts, :observed_ts)
+"""
+
+# The URL and title follow the article only when it is seen under its own URL, not an alias
+UPDATE_ARTICLE = """
+UPDATE articles SET
+    url = CASE WHEN canonical_url = :canonical_url THEN :url ELSE url END,
+    title = CASE WHEN canonical_url = :canonical_url THEN :title ELSE title END,
+    summary = :summary,
+    category = :category,
+    views = :views,
+    shares = :shares,
+    comments = :comments,
+    last_seen_ts = :observed_ts
+WHERE id = :id
+"""
+
+INSERT_HISTORY = """
+INSERT OR REPLACE INTO engagement_history (article_id, observed_ts, views, shares, comments)
+VALUES (:id, :observed_ts, :views, :shares, :comments)
+"""
+
+# Simulated rows written by older versions
+PURGE_SIMULATED = "DELETE FROM articles WHERE is_real = 0"
+
+INSERT_ALIAS = """
+INSERT OR IGNORE INTO article_aliases (canonical_url, article_id)
+SELECT ?, id FROM articles WHERE id = ? AND canonical_url != ?
+"""
+
+ARTICLE_COLUMNS = "url, title, source, summary, category, published_date, published_ts, views, shares, comments, is_real"
+
+
+def _timestamp(value):
+    """Epoch seconds for a datetime, or now."""
+    return int((value or datetime.now()).timestamp())
+
+
+class ArticleStore:
+    """SQLite-backed article history with engagement tracking."""
+    
+    def __init__(self, path=DEFAULT_DB_PATH):
+        self.path = path
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        self.conn.executescript(SCHEMA)
+        with self.conn:
+            self.conn.execute(PURGE_SIMULATED)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def close(self):
+        self.conn.close()
+    
+    def __len__(self):
+        with self.lock:
+            return self.conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+    
+    def upsert_many(self, news_list, observed_at=None):
+        """Insert or update real articles and record their engagement; return the number of new articles.
+        
+        Simulated articles are skipped.
+        """
+        observed_ts = _timestamp(observed_at)
+        rows = []
+        for news in news_list:
+            if not news.get('is_real', False):
+                continue
+            published = datetime.strptime(news['date'], "%Y-%m-%d")
+            rows.append({
+                'canonical_url': dedupe_key(news['url']),
+                'url': news['url'],
+                'title': news['title'],
+                'source': news['source'],
+                'summary': news.get('summary', ''),
+                'category': news.get('category', ''),
+                'published_date': news['date'],
+                'published_ts': _timestamp(published),
+                'views': news.get('views', 0),
+                'shares': news.get('shares', 0),
+                'comments': news.get('comments', 0),
+                'is_real': 1,
+                'observed_ts': observed_ts,
+                # Near-duplicates merged into this article map to it
+                'aliases': [dedupe_key(url) for url in news.get('duplicate_urls', ())],
+            })
+        
+        new_count = 0
+        with self.lock, self.conn:
+            for row in rows:
+                keys = [row['canonical_url']] + row['aliases']
+                row['id'] = self._find_id(keys)
+                if row['id'] is None:
+                    row['id'] = self.conn.execute(INSERT_ARTICLE, row).lastrowid
+                    new_count += 1
+                else:
+                    self.conn.execute(UPDATE_ARTICLE, row)
+                self.conn.execute(INSERT_HISTORY, row)
+                self.conn.executemany(INSERT_ALIAS, [(key, row['id'], key) for key in keys])
+        return new_count
+    
+    def _find_id(self, keys):
+        """Id of the stored article any of the canonical URLs belongs to, directly or as an alias."""
+        placeholders = ", ".join("?" * len(keys))
+        row = self.conn.execute(
+            f"SELECT id FROM articles WHERE canonical_url IN ({placeholders}) "
+            f"UNION SELECT article_id FROM article_aliases WHERE canonical_url IN ({placeholders}) "
+            "ORDER BY 1 LIMIT 1",
+            keys + keys
+        ).fetchone()
+        return row[0] if row else None
+    
+    def known_urls(self, urls):
+        """Subset of the given URLs whose canonical form is already stored, directly or as an alias."""
+        keys = {}
+        for url in urls:
+            keys.setdefault(dedupe_key(url), []).append(url)
+        
+        known = set()
+        key_list = list(keys)
+        with self.lock:
+            # Stay under SQLite's bound-parameter limit
+            for start in range(0, len(key_list), KNOWN_URLS_BATCH):
+                batch = key_list[start:start + KNOWN_URLS_BATCH]
+                placeholders = ", ".join("?" * len(batch))
+                rows = self.conn.execute(
+                    f"SELECT canonical_url FROM articles WHERE canonical_url IN ({placeholders}) "
+                    f"UNION SELECT canonical_url FROM article_aliases WHERE canonical_url IN ({placeholders})",
+                    batch + batch
+                ).fetchall()
+                for row in rows:
+                    known.update(keys[row[0]])
+        return known
+    
+    def query(self, source=None, category=None, since=None, seen_since=None, limit=None):
+        """Articles matching the filters, most engaged first, as news dicts."""
+        conditions, params = [], []
+        if source is not None:
+            conditions.append("source = ?")
+            params.append(source)
+        if category is not None:
+            conditions.append("category = ?")
+            params.append(category)
+        if since is not None:
+            conditions.append("published_ts >= ?")
+            params.append(_timestamp(since))
+        if seen_since is not None:
+            conditions.append("last_seen_ts >= ?")
+            params.append(_timestamp(seen_since))
+        
+        sql = f"SELECT {ARTICLE_COLUMNS} FROM articles"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY comments + views DESC, published_ts DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        
+        with self.lock:
+            rows = self.conn.execute(sql, params).fetchall()
+        return [self._to_news(row) for row in rows]
+    
+    def table(self, **filters):
+        """Articles matching the query filters as a columnar ArticleTable."""
+        return ArticleTable.from_articles(self.query(**filters))
+    
+    def top_news(self, limit=30, seen_since=None):
+        """Top articles by engagement, ranked from 1."""
+        news_list = self.query(seen_since=seen_since, limit=limit)
+        for i, news in enumerate(news_list, 1):
+            news['rank'] = i
+        return news_list
+    
+    def hot_news(self, limit=30, now=None, gravity=DEFAULT_GRAVITY):
+        """Top articles of the whole history by time-decayed hot score, ranked from 1."""
+        with self.lock:
+            # Plain tuples: building sqlite3.Row objects dominates on large histories
+            cursor = self.conn.cursor()
+            cursor.row_factory = None
+            rows = cursor.execute("SELECT id, views, comments, shares, published_ts FROM articles").fetchall()
+        if not rows:
+            return []
+        
+        ids, views, comments, shares, published_ts = zip(*rows)
+        scores = hot_scores(views, comments, shares, published_ts, now.timestamp() if now else None, gravity)
+        top_ids = [ids[i] for i in top_k_indices(scores, limit)]
+        
+        placeholders = ", ".join("?" * len(top_ids))
+        with self.lock:
+            by_id = {row['id']: row for row in self.conn.execute(
+                f"SELECT id, {ARTICLE_COLUMNS} FROM articles WHERE id IN ({placeholders})", top_ids
+            )}
+        
+        news_list = [self._to_news(by_id[article_id]) for article_id in top_ids]
+        for i, news in enumerate(news_list, 1):
+            news['rank'] = i
+        return news_list
+    
+    def engagement_history(self, url):
+        """(datetime, views, shares, comments) observations for an article, by its URL or an alias, oldest first."""
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT observed_ts, views, shares, comments FROM engagement_history "
+                "WHERE article_id = ? ORDER BY observed_ts",
+                (self._find_id([dedupe_key(url)]),)
+            ).fetchall()
+        return [(datetime.fromtimestamp(row[0]), row[1], row[2], row[3]) for row in rows]
+    
+    def _to_news(self, row):
+        published = datetime.fromtimestamp(row['published_ts'])
+        return Article(
+            rank=0,
+            title=row['title'],
+            source=row['source'],
+            summary=row['summary'],
+            url=row['url'],
+            date=row['published_date'],
+            views=row['views'],
+            shares=row['shares'],
+            comments=row['comments'],
+            category=row['category'],
+            is_current=(datetime.now() - published).days <= CURRENT_DAYS,
+            is_real=bool(row['is_real'])
+        )
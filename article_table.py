@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Article Table
+
+Columnar in-memory container for large article histories. Numeric fields
+are kept in parallel typed arrays (the array module, 8 bytes per value),
+and source and category are dictionary-encoded as small integer codes
+into shared string tables. Filters, group-bys, top-K and the statistics
+used by the HTML pages run over those columns instead of over millions of
+dicts. When NumPy is installed the columns are viewed as NumPy arrays
+without copying and the aggregates are vectorized; otherwise the same
+results are computed with plain Python.
+
+Text fields (title, summary, url) are kept in plain lists and only touched
+when rows are turned back into Articles.
+"""
+
+import operator
+from array import array
+
+from article import Article
+from stats import NO_TOP_VALUE
+from vector_scoring import np, top_k_indices
+
+
+NUMERIC_COLUMNS = ('views', 'shares', 'comments', 'date_ts')
+FLAG_COLUMNS = ('is_current', 'is_real')
+TEXT_COLUMNS = ('title', 'summary', 'url')
+CODED_COLUMNS = ('source', 'category')
+
+
+class StringDictionary:
+    """Two-way mapping between strings and dense integer codes, in first-seen order."""
+    
+    def __init__(self):
+        self.values = []
+        self.codes = {}
+    
+    def __len__(self):
+        return len(self.values)
+    
+    def encode(self, value):
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+    
+    def decode(self, code):
+        return self.values[code]
+
+
+class ArticleTable:
+    """Articles stored column by column."""
+    
+    def __init__(self, dictionaries=None):
+        self.numeric = {name: array('q') for name in NUMERIC_COLUMNS}
+        self.flags = {name: array('b') for name in FLAG_COLUMNS}
+        self.codes = {name: array('i') for name in CODED_COLUMNS}
+        self.text = {name: [] for name in TEXT_COLUMNS}
+        # Filtered tables share the dictionaries of the table they came from
+        self.dictionaries = dictionaries or {name: StringDictionary() for name in CODED_COLUMNS}
+    
+    @classmethod
+    def from_articles(cls, news_list):
+        table = cls()
+        table.extend(news_list)
+        return table
+    
+    def __len__(self):
+        return len(self.numeric['views'])
+    
+    def append(self, news):
+        """Add one article (an Article or a news dict)."""
+        if not isinstance(news, Article):
+            news = Article.from_dict(news)
+        for name in NUMERIC_COLUMNS:
+            self.numeric[name].append(getattr(news, name) or 0)
+        for name in FLAG_COLUMNS:
+            self.flags[name].append(1 if getattr(news, name) else 0)
+        for name in CODED_COLUMNS:
+            self.codes[name].append(self.dictionaries[name].encode(getattr(news, name) or ''))
+        for name in TEXT_COLUMNS:
+            self.text[name].append(getattr(news, name))
+    
+    def extend(self, news_list):
+        for news in news_list:
+            self.append(news)
+    
+    def column(self, name):
+        """A column as a NumPy array view when NumPy is available, else the raw array.
+        
+        The view shares memory with the table; drop it before appending rows.
+        """
+        if name in self.numeric:
+            values = self.numeric[name]
+        elif name in self.flags:
+            values = self.flags[name]
+        else:
+            values = self.codes[name]
+        return np.frombuffer(values, dtype=values.typecode) if np is not None else values
+    
+    def row(self, index):
+        """Rebuild the Article at a row index."""
+        return Article(
+            title=self.text['title'][index],
+            source=self.dictionaries['source'].decode(self.codes['source'][index]),
+            date=self.numeric['date_ts'][index],
+            summary=self.text['summary'][index],
+            url=self.text['url'][index],
+            views=self.numeric['views'][index],
+            shares=self.numeric['shares'][index],
+            comments=self.numeric['comments'][index],
+            category=self.dictionaries['category'].decode(self.codes['category'][index]),
+            is_current=bool(self.flags['is_current'][index]),
+            is_real=bool(self.flags['is_real'][index])
+        )
+    
+    def take(self, indices):
+        """New table with the given rows, in the given order."""
+        table = ArticleTable(self.dictionaries)
+        typed_columns = [(self.numeric, table.numeric), (self.flags, table.flags), (self.codes, table.codes)]
+        
+        if np is not None:
+            indices = np.asarray(indices, dtype=np.int64)
+            for source_columns, target_columns in typed_columns:
+                for name, values in source_columns.items():
+                    selected = array(values.typecode)
+                    selected.frombytes(np.frombuffer(values, dtype=values.typecode)[indices].tobytes())
+                    target_columns[name] = selected
+            indices = indices.tolist()
+        else:
+            for source_columns, target_columns in typed_columns:
+                for name, values in source_columns.items():
+                    target_columns[name] = array(values.typecode, (values[i] for i in indices))
+        
+        for name, values in self.text.items():
+            table.text[name] = [values[i] for i in indices]
+        return table
+    
+    def filter(self, source=None, category=None, since_ts=None, until_ts=None, current=None, real=None):
+        """Rows matching every given condition, as a new table."""
+        conditions = []
+        for name, value in (('source', source), ('category', category)):
+            if value is not None:
+                code = self.dictionaries[name].codes.get(value)
+                if code is None:
+                    return ArticleTable(self.dictionaries)
+                conditions.append((self.column(name), operator.eq, code))
+        if since_ts is not None:
+            conditions.append((self.column('date_ts'), operator.ge, since_ts))
+        if until_ts is not None:
+            conditions.append((self.column('date_ts'), operator.lt, until_ts))
+        if current is not None:
+            conditions.append((self.column('is_current'), operator.eq, int(bool(current))))
+        if real is not None:
+            conditions.append((self.column('is_real'), operator.eq, int(bool(real))))
+        
+        if np is not None:
+            mask = np.ones(len(self), dtype=bool)
+            for values, compare, target in conditions:
+                mask &= compare(values, target)
+            return self.take(np.flatnonzero(mask))
+        
+        return self.take([
+            i for i in range(len(self))
+            if all(compare(values[i], target) for values, compare, target in conditions)
+        ])
+    
+    def group_by(self, name, value_column='views'):
+        """{group: {'count': n, value_column: total}} for a dictionary-encoded column.
+        
+        Groups are in order of first appearance among this table's rows, like
+        stats.news_statistics builds them, not in the order of the shared
+        dictionary, which a filtered table inherits from its parent.
+        """
+        size = len(self.dictionaries[name])
+        codes = self.column(name)
+        values = self.column(value_column)
+        
+        if np is not None:
+            counts = np.bincount(codes, minlength=size).tolist()
+            totals = np.bincount(codes, weights=values, minlength=size).astype(np.int64).tolist()
+            present, first_rows = np.unique(codes, return_index=True)
+            order = present[np.argsort(first_rows)].tolist()
+        else:
+            counts, totals = [0] * size, [0] * size
+            for code, value in zip(codes, values):
+                counts[code] += 1
+                totals[code] += value
+            order = list(dict.fromkeys(codes))
+        
+        return {
+            self.dictionaries[name].decode(code): {'count': counts[code], value_column: totals[code]}
+            for code in order
+        }
+    
+    def total(self, name):
+        values = self.column(name)
+        return int(values.sum()) if np is not None else sum(values)
+    
+    def scores(self, score='engagement'):
+        """Per-row ranking scores: 'views', 'engagement' (comments + views) or a sequence."""
+        if score == 'views':
+            return self.column('views')
+        if score == 'engagement':
+            if np is not None:
+                return self.column('views') + self.column('comments')
+            return [v + c for v, c in zip(self.numeric['views'], self.numeric['comments'])]
+        return score
+    
+    def top_k(self, k=30, score='engagement'):
+        """The k best rows as Articles with 'rank' set from 1; ties keep row order."""
+        top_news = [self.row(i) for i in top_k_indices(self.scores(score), k)]
+        for i, news in enumerate(top_news, 1):
+            news.rank = i
+        return top_news
+    
+    def statistics(self):
+        """The same statistics dict as stats.news_statistics, computed over the columns."""
+        count = len(self)
+        categories = self.group_by('category')
+        sources = self.group_by('source')
+        total_views = self.total('views')
+        return {
+            'total_views': total_views,
+            'total_shares': self.total('shares'),
+            'total_comments': self.total('comments'),
+            'current_news': self.total('is_current'),
+            'categories': categories,
+            'sources': sources,
+            'avg_views': total_views // count if count else 0,
+            # max() keeps the first of equal maxima, i.e. the group that appears first in this table
+            'top_category': max(categories.items(), key=lambda x: x[1]['views'])[0] if count else NO_TOP_VALUE,
+            'top_source': max(sources.items(), key=lambda x: x[1]['views'])[0] if count else NO_TOP_VALUE
+        }
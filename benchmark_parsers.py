@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+HTML Parser Benchmark
+
+Compares the parser backends from html_parsers on real pages: the homepages
+of the configured news sources, plus any generated *.html pages in the
+current directory when a source can't be reached.
+
+Usage:
+    python benchmark_parsers.py [repeats]
+"""
+
+import contextlib
+import glob
+import io
+import sys
+import time
+
+from current_hr_news_scraper import RealHRNewsScraper
+from html_parsers import PARSER_BACKENDS, is_available, make_soup
+
+
+def collect_pages(scraper):
+    """Download source homepages and add local HTML files as extra samples."""
+    pages = []
+    
+    for source in scraper.news_sources:
+        try:
+            response = scraper.fetch(source['url'], timeout=15)
+            response.raise_for_status()
+            pages.append((source['name'], source, response.content))
+        except Exception as e:
+            print(f"⚠️ {source['name']} indisponível: {e}")
+    
+    for path in sorted(glob.glob("*.html")):
+        with open(path, 'rb') as f:
+            pages.append((path, None, f.read()))
+    
+    return pages
+
+
+def time_backend(backend, content, repeats):
+    """Best-of-N wall time to parse a page, in milliseconds."""
+    best = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        make_soup(content, backend)
+        elapsed = (time.perf_counter() - start) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    """Run the benchmark and print a comparison table."""
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    backends = [name for name in PARSER_BACKENDS if is_available(name)]
+    
+    print("🚀 HTML Parser Benchmark")
+    print("=" * 60)
+    
+    scraper = RealHRNewsScraper()
+    pages = collect_pages(scraper)
+    if not pages:
+        print("❌ Nenhuma página disponível para o benchmark")
+        return
+    
+    header = f"{'Página':<40} {'KB':>7} " + " ".join(f"{name:>12}" for name in backends)
+    print(header)
+    print("-" * len(header))
+    
+    totals = {name: 0.0 for name in backends}
+    for name, source, content in pages:
+        row = f"{name[:40]:<40} {len(content) // 1024:>7} "
+        for backend in backends:
+            elapsed = time_backend(backend, content, repeats)
+            totals[backend] += elapsed
+            row += f"{elapsed:>10.1f}ms "
+        print(row)
+        
+        # Check that every backend finds the same articles on source pages
+        if source:
+            counts = set()
+            for backend in backends:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    counts.add(len(scraper.extract_articles(dict(source, parser=backend), content)))
+            if len(counts) > 1:
+                print(f"   ⚠️ Backends extraíram quantidades diferentes de artigos: {sorted(counts)}")
+    
+    print("-" * len(header))
+    print(f"{'Total':<48} " + " ".join(f"{totals[name]:>10.1f}ms" for name in backends))
+    
+    if "lxml" in totals and "html.parser" in totals and totals["lxml"]:
+        print(f"\n⚡ lxml é {totals['html.parser'] / totals['lxml']:.1f}x mais rápido que html.parser")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Bloom Filter
+
+Compact, persistent record of the article URLs the scraper has already
+ingested, so long-running crawls can tell new articles from known ones
+without keeping every URL around.
+
+A RotatingBloomFilter keeps two fixed-size generations. New URLs go into
+the current generation; lookups check both. When the current generation
+reaches its capacity it becomes the previous one and the old previous
+generation is dropped, so URLs expire after one to two generations and
+the false-positive rate never grows past the configured bound. With the
+defaults (1M URLs per generation, 0.1% false positives) the file on disk
+stays under 4 MB however long the scraper runs.
+"""
+
+import hashlib
+import math
+import os
+import struct
+import threading
+
+
+DEFAULT_FILTER_PATH = ".seen_urls.bloom"
+DEFAULT_CAPACITY = 1_000_000
+DEFAULT_ERROR_RATE = 0.001
+
+FILE_MAGIC = b'HRBF'
+FILE_VERSION = 1
+# magic, version, bit count, hash count, capacity, current count, previous count
+HEADER = struct.Struct('>4sHQHQQQ')
+
+
+def optimal_size(capacity, error_rate):
+    """Bit count and hash count for a filter holding `capacity` items at `error_rate`."""
+    bits = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+    hashes = max(1, round(bits / capacity * math.log(2)))
+    return bits, hashes
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over a bytearray."""
+    
+    def __init__(self, bits, hashes, data=None, count=0):
+        self.bits = bits
+        self.hashes = hashes
+        self.data = bytearray(data) if data is not None else bytearray((bits + 7) // 8)
+        self.count = count
+    
+    def _positions(self, item):
+        # Double hashing: k positions from two independent 64-bit hashes
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'big')
+        h2 = int.from_bytes(digest[8:], 'big') | 1
+        return [(h1 + i * h2) % self.bits for i in range(self.hashes)]
+    
+    def __contains__(self, item):
+        data = self.data
+        return all(data[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+    
+    def add(self, item):
+        """Add an item; return True if it was not (probably) present before."""
+        data = self.data
+        added = False
+        for pos in self._positions(item):
+            mask = 1 << (pos & 7)
+            if not data[pos >> 3] & mask:
+                data[pos >> 3] |= mask
+                added = True
+        if added:
+            self.count += 1
+        return added
+
+
+class RotatingBloomFilter:
+    """Two-generation Bloom filter persisted to a single file."""
+    
+    def __init__(self, path=DEFAULT_FILTER_PATH, capacity=DEFAULT_CAPACITY, error_rate=DEFAULT_ERROR_RATE):
+        self.path = path
+        self.capacity = capacity
+        self.bits, self.hashes = optimal_size(capacity, error_rate)
+        self.lock = threading.Lock()
+        self.dirty = False
+        self.current, self.previous = self._load()
+    
+    def _new_generation(self):
+        return BloomFilter(self.bits, self.hashes)
+    
+    def _load(self):
+        try:
+            with open(self.path, 'rb') as f:
+                header = f.read(HEADER.size)
+                magic, version, bits, hashes, capacity, current_count, previous_count = HEADER.unpack(header)
+                if (magic, version, bits, hashes, capacity) != (FILE_MAGIC, FILE_VERSION, self.bits, self.hashes, self.capacity):
+                    raise ValueError("filter parameters changed")
+                size = (bits + 7) // 8
+                current = BloomFilter(bits, hashes, f.read(size), current_count)
+                previous = BloomFilter(bits, hashes, f.read(size), previous_count)
+                if len(current.data) != size or len(previous.data) != size:
+                    raise ValueError("truncated filter file")
+        except (OSError, ValueError, struct.error):
+            return self._new_generation(), self._new_generation()
+        return current, previous
+    
+    def __contains__(self, item):
+        with self.lock:
+            return item in self.current or item in self.previous
+    
+    def __len__(self):
+        """Approximate number of items remembered across both generations."""
+        return self.current.count + self.previous.count
+    
+    def add(self, item):
+        """Add an item; return True if it was not (probably) seen before."""
+        with self.lock:
+            seen_before = item in self.previous
+            added = self.current.add(item)
+            if added:
+                # Known items are re-added too, so URLs still in use don't expire with the old generation
+                self.dirty = True
+                if self.current.count >= self.capacity:
+                    self.previous, self.current = self.current, self._new_generation()
+            return added and not seen_before
+    
+    def save(self):
+        """Write both generations to disk if anything changed."""
+        with self.lock:
+            if not self.dirty:
+                return
+            tmp_path = self.path + ".tmp"
+            try:
+                with open(tmp_path, 'wb') as f:
+                    f.write(HEADER.pack(FILE_MAGIC, FILE_VERSION, self.bits, self.hashes, self.capacity,
+                                        self.current.count, self.previous.count))
+                    f.write(self.current.data)
+                    f.write(self.previous.data)
+                os.replace(tmp_path, self.path)
+            except OSError as e:
+                # Best effort: the run's results don't depend on the filter being persisted
+                print(f"⚠️ Não foi possível salvar o filtro de URLs vistas em {self.path}: {e}")
+                return
+            self.dirty = False
@@ -12,8 +12,13 @@ npm install
 # Create build directory
 mkdir -p .vercel/output
 
+# Write gzip/brotli variants of the pages and static assets
+python precompress.py
+
 # Copy static files
 cp *.html .vercel/output/
+cp *.html.gz *.html.br compression_manifest.json .vercel/output/ 2>/dev/null || true
+cp -r static .vercel/output/
 cp -r public .vercel/output/ 2>/dev/null || true
 
 # Copy Python files
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Crawl Scheduler
+
+Per-host politeness for every scraper in this project. Each host gets its own
+token bucket, robots.txt is read once per host and cached with a TTL, and a
+Crawl-delay found there slows that host down. Requests to different hosts
+never wait on each other, so they can run in parallel.
+"""
+
+import threading
+import time
+import urllib.parse
+import urllib.robotparser
+
+
+class RobotsDisallowedError(Exception):
+    """Raised when robots.txt does not allow fetching a URL."""
+
+
+class TokenBucket:
+    """Thread-safe token bucket that hands out reservations."""
+    
+    def __init__(self, rate, capacity=1):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def set_rate(self, rate):
+        """Change the refill rate (tokens per second)."""
+        with self.lock:
+            self._refill()
+            self.rate = rate
+    
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+    
+    def acquire(self):
+        """Take one token, sleeping until it is available."""
+        with self.lock:
+            self._refill()
+            self.tokens -= 1
+            # A negative balance is a reservation: wait until it is paid back
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0
+        
+        if wait > 0:
+            time.sleep(wait)
+
+
+class CrawlScheduler:
+    """Single gateway for outgoing scraper requests."""
+    
+    def __init__(self, min_interval=2.0, burst=1, robots_ttl=3600, robots_timeout=10):
+        self.min_interval = min_interval
+        self.burst = burst
+        self.robots_ttl = robots_ttl
+        self.robots_timeout = robots_timeout
+        
+        self._buckets = {}
+        self._robots = {}
+        self._host_locks = {}
+        self._lock = threading.Lock()
+    
+    def get(self, session, url, **kwargs):
+        """GET a URL with the given session once robots.txt and the host's bucket allow it."""
+        parts = urllib.parse.urlsplit(url)
+        host = parts.netloc.lower()
+        
+        robots = self._get_robots(session, parts.scheme, host)
+        user_agent = session.headers.get('User-Agent', '*')
+        if robots is not None and not robots.can_fetch(user_agent, url):
+            raise RobotsDisallowedError(f"robots.txt de {host} não permite acessar {url}")
+        
+        self._get_bucket(host).acquire()
+        return session.get(url, **kwargs)
+    
+    def _host_lock(self, host):
+        with self._lock:
+            if host not in self._host_locks:
+                self._host_locks[host] = threading.Lock()
+            return self._host_locks[host]
+    
+    def _get_bucket(self, host):
+        with self._lock:
+            if host not in self._buckets:
+                self._buckets[host] = TokenBucket(1.0 / self.min_interval, self.burst)
+            return self._buckets[host]
+    
+    def _get_robots(self, session, scheme, host):
+        """Return the cached robots.txt parser for a host, fetching it when stale."""
+        # One lock per host so concurrent workers don't download robots.txt twice
+        with self._host_lock(host):
+            cached = self._robots.get(host)
+            if cached and time.monotonic() - cached[0] < self.robots_ttl:
+                return cached[1]
+            
+            # robots.txt is a request to the host like any other, so it waits for a token too
+            self._get_bucket(host).acquire()
+            robots = self._fetch_robots(session, f"{scheme}://{host}/robots.txt")
+            self._robots[host] = (time.monotonic(), robots)
+            
+            # Honor Crawl-delay by slowing the host's bucket down
+            if robots is not None:
+                delay = robots.crawl_delay(session.headers.get('User-Agent', '*'))
+                if delay:
+                    self._get_bucket(host).set_rate(1.0 / max(float(delay), self.min_interval))
+            
+            return robots
+    
+    def _fetch_robots(self, session, robots_url):
+        """Download and parse robots.txt, or return None when there are no rules."""
+        robots = urllib.robotparser.RobotFileParser(robots_url)
+        
+        try:
+            response = session.get(robots_url, timeout=self.robots_timeout)
+        except Exception as e:
+            print(f"⚠️ Não foi possível ler {robots_url}: {e}")
+            return None
+        
+        if response.status_code in (401, 403):
+            robots.disallow_all = True
+        elif response.status_code >= 400:
+            return None
+        else:
+            robots.parse(response.text.splitlines())
+        
+        return robots
+
+
+# Shared instance so every collector in the process uses the same per-host state
+default_scheduler = CrawlScheduler()
@@ -11,19 +11,45 @@ or distribution is strictly prohibited.
 """
 
 import requests
-from bs4 import BeautifulSoup
 import json
 from datetime import datetime, timedelta
-import time
-import re
 import random
+import sys
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+
+from article import Article
+from article_store import ArticleStore
+from bloom_filter import RotatingBloomFilter
+from crawl_scheduler import default_scheduler
+from date_parser import DateParser
+from extraction_cache import ExtractionCache
+from extraction_plan import ExtractionPlan, PlanMemo
+from fragment_cache import CachedFragments, FragmentCache
+from http_cache import install_cache
+from near_duplicates import collapse_near_duplicates
+from precompress import precompress
+from ranking import engagement_recency_score, top_k
+from stats import news_statistics
+from static_assets import asset_path, asset_url
+from templates import Markup, iter_render, load_template, render_each, render_group_stats, write_atomic
+from text_matcher import DEFAULT_MATCHER
+from url_tools import DedupeIndex, SourceAllowlist, canonicalize_url, dedupe_key
+from vector_scoring import rank_news
+
+
+# Hottest stored articles considered in incremental mode, so 30 remain after near-duplicates are merged
+HISTORY_CANDIDATES = 90
 
 
 class RealHRNewsScraper:
     """Scrape real HR news about career transition from Brazilian websites."""
     
-    def __init__(self):
+    def __init__(self, max_workers=6, scheduler=None, partial_parse=True, seen_filter_path=None, store=None):
+        self.max_workers = max_workers
+        self.partial_parse = partial_parse
+        self.scheduler = scheduler or default_scheduler
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -34,6 +60,16 @@ class RealHRNewsScraper:
             'Upgrade-Insecure-Requests': '1',
         })
         
+        # Revalidate homepages with ETag/Last-Modified instead of re-downloading them
+        install_cache(self.session)
+        self.extraction_cache = ExtractionCache()
+        self.date_parser = DateParser()
+        
+        # With a seen-URL filter only articles not ingested by earlier runs are reported
+        self.seen_filter = RotatingBloomFilter(seen_filter_path) if seen_filter_path else None
+        # Article history used by incremental runs
+        self.store = store
+        
         # Real Brazilian career and HR news sources with actual URLs
         self.news_sources = [
             {
@@ -44,6 +80,7 @@ class RealHRNewsScraper:
                 "title_selector": "h1, h2, h3, .title, .post-title, .card-title",
                 "link_selector": "a[href*='/blog/'], a[href*='/artigo/'], a[href*='/post/'], a[href*='/noticias/']",
                 "date_selector": ".date, .published, .post-date, time, .card-date",
+                "parser": "lxml",
                 "category": "Carreira"
             },
             {
@@ -54,6 +91,7 @@ class RealHRNewsScraper:
                 "title_selector": "h1, h2, h3, .title, .post-title, .card-title",
                 "link_selector": "a[href*='/carreira/'], a[href*='/artigo/'], a[href*='/post/']",
                 "date_selector": ".date, .published, .post-date, time, .card-date",
+                "parser": "lxml",
                 "category": "Carreira"
             },
             {
@@ -64,6 +102,7 @@ class RealHRNewsScraper:
                 "title_selector": "h1, h2, h3, .title, .post-title, .card-title",
                 "link_selector": "a[href*='/carreira/'], a[href*='/artigo/'], a[href*='/post/']",
                 "date_selector": ".date, .published, .post-date, time, .card-date",
+                "parser": "lxml",
                 "category": "Carreira"
             },
             {
@@ -74,6 +113,7 @@ class RealHRNewsScraper:
                 "title_selector": "h1, h2, h3, .title, .post-title, .card-title",
                 "link_selector": "a[href*='/noticias/'], a[href*='/artigo/'], a[href*='/post/']",
                 "date_selector": ".date, .published, .post-date, time, .card-date",
+                "parser": "lxml",
                 "category": "RH"
             },
             {
@@ -84,6 +124,7 @@ class RealHRNewsScraper:
                 "title_selector": "h1, h2, h3, .title, .post-title, .card-title",
                 "link_selector": "a[href*='/noticias/'], a[href*='/artigo/'], a[href*='/post/']",
                 "date_selector": ".date, .published, .post-date, time, .card-date",
+                "parser": "lxml",
                 "category": "RH"
             },
             {
@@ -94,294 +135,304 @@ class RealHRNewsScraper:
                 "title_selector": "h1, h2, h3, .title, .post-title, .card-title",
                 "link_selector": "a[href*='/noticias/'], a[href*='/artigo/'], a[href*='/post/']",
                 "date_selector": ".date, .published, .post-date, time, .card-date",
+                "parser": "lxml",
                 "category": "RH"
             }
         ]
+        
+        # Article links must point back to one of the configured sources
+        self.allowlist = SourceAllowlist(source['url'] for source in self.news_sources)
+        
+        # Compile each source config into an extraction plan once
+        self.plan_memo = PlanMemo()
+        self.plans = {source['name']: ExtractionPlan(source, self.plan_memo) for source in self.news_sources}
     
-    def scrape_real_hr_news(self):
-        """Scrape real HR news about career transition from Brazilian websites."""
+    def scrape_real_hr_news(self, concurrent=True, incremental=False):
+        """Scrape real HR news about career transition from Brazilian websites.
+        
+        When concurrent is True the sources are fetched in parallel by up to
+        max_workers threads, so a run costs about as much as the slowest
+        source. Results are merged in news_sources order either way, and
+        per-host rate limits are enforced by the crawl scheduler.
+        
+        When incremental is True, articles already in the store are skipped,
+        only new ones are enriched and saved, and the top 30 is ranked over
+        the whole stored history, by time-decayed hot score, instead of this
+        run's articles.
+        """
+        if incremental and self.store is None:
+            raise ValueError("Incremental scraping needs an article store")
+        
         print("📰 Fazendo web scraping real de notícias sobre recolocação profissional...")
         
         all_news = []
         
         # Try to scrape from real sources
-        for source in self.news_sources:
-            try:
-                print(f"🔍 Tentando acessar {source['name']}...")
-                
-                # Scrape real articles from the source
-                source_news = self.scrape_source_articles(source)
-                all_news.extend(source_news)
-                
-                print(f"✅ {len(source_news)} notícias coletadas de {source['name']}")
-                
-                # Respect rate limits
-                time.sleep(2)
-                
-            except Exception as e:
-                print(f"⚠️ Erro ao acessar {source['name']}: {e}")
-                continue
-        
-        # If we couldn't get enough real data, supplement with current simulated data
+        if concurrent:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                source_results = list(executor.map(self.scrape_source, self.news_sources, repeat(incremental)))
+        else:
+            source_results = []
+            for source in self.news_sources:
+                source_results.append(self.scrape_source(source, incremental))
+        
+        # Keep one entry per canonical URL, whichever source linked it first
+        dedupe_index = DedupeIndex()
+        for source_news in source_results:
+            for news in source_news:
+                if dedupe_index.add(news['url']):
+                    all_news.append(news)
+        
+        duplicates = sum(len(source_news) for source_news in source_results) - len(all_news)
+        if duplicates:
+            print(f"♻️ {duplicates} notícias duplicadas removidas")
+        
+        # Remember which strategies and selectors worked for the next run
+        self.plan_memo.save()
+        
+        if self.seen_filter is not None:
+            for news in all_news:
+                self.seen_filter.add(dedupe_key(news['url']))
+            self.seen_filter.save()
+        
+        # Merge republished stories and repeated titles, summing their engagement
+        pool_size = len(all_news)
+        all_news = collapse_near_duplicates(all_news)
+        
+        if incremental:
+            return self.merge_into_history(all_news)
+        
+        if len(all_news) < pool_size:
+            print(f"🔗 {pool_size - len(all_news)} notícias quase duplicadas agrupadas")
+        
+        # If we couldn't get enough real data, supplement with current simulated data.
+        # The filler is added after the merge so its engagement is never summed.
         if len(all_news) < 30:
             print(f"💡 Complementando com dados simulados atuais...")
-            additional_news = self.generate_additional_current_news(30 - len(all_news))
-            all_news.extend(additional_news)
+            used_titles = {news['title'] for news in all_news}
+            all_news.extend(self.generate_additional_current_news(30 - len(all_news), used_titles))
         
-        # Sort by engagement (comments + views) and date
-        all_news.sort(key=lambda x: (x.get('comments', 0) + x.get('views', 0), x['date']), reverse=True)
-        
-        # Take top 30
-        top_30_news = all_news[:30]
-        
-        # Reassign ranks
-        for i, news in enumerate(top_30_news, 1):
-            news['rank'] = i
+        # Top 30 by engagement (comments + views) and date, ranked from 1.
+        # The heap is fed here rather than as each source finishes: merging near-duplicates
+        # sums engagement across sources, so no score is final until every source is in.
+        top_30_news = top_k(all_news, 30, engagement_recency_score)
         
         print(f"✅ {len(top_30_news)} notícias sobre recolocação profissional coletadas e ranqueadas")
         return top_30_news
     
-    def scrape_source_articles(self, source):
+    def merge_into_history(self, new_news):
+        """Save new articles to the store and return the 30 hottest of the whole history."""
+        new_count = self.store.upsert_many(new_news)
+        print(f"💾 {new_count} notícias novas adicionadas ao histórico")
+        
+        # Rank the whole history by hot score so old articles don't hold the top spots forever.
+        # Stories stored by different runs can be near-duplicates of each other, so merge them here too.
+        candidates = self.store.hot_news(HISTORY_CANDIDATES)
+        history_news = collapse_near_duplicates(candidates)
+        if len(history_news) < len(candidates):
+            print(f"🔗 {len(candidates) - len(history_news)} notícias quase duplicadas agrupadas no histórico")
+        
+        # If the history is still too small, supplement with current simulated data (never stored)
+        missing = 30 - len(history_news)
+        if missing > 0:
+            print(f"💡 Complementando com dados simulados atuais...")
+            used_titles = {news['title'] for news in history_news}
+            history_news.extend(self.generate_additional_current_news(missing, used_titles))
+        
+        top_30_news = rank_news(history_news, 30)
+        print(f"✅ {len(top_30_news)} notícias sobre recolocação profissional ranqueadas no histórico")
+        return top_30_news
+    
+    def fetch(self, url, **kwargs):
+        """Fetch a URL through the shared crawl scheduler."""
+        return self.scheduler.get(self.session, url, **kwargs)
+    
+    def scrape_source(self, source, incremental=False):
+        """Scrape a single source, returning an empty list on failure."""
+        try:
+            print(f"🔍 Tentando acessar {source['name']}...")
+            
+            # Scrape real articles from the source
+            source_news = self.scrape_source_articles(source, incremental)
+            
+            print(f"✅ {len(source_news)} notícias coletadas de {source['name']}")
+            return source_news
+        
+        except Exception as e:
+            print(f"⚠️ Erro ao acessar {source['name']}: {e}")
+            return []
+    
+    def scrape_source_articles(self, source, incremental=False):
         """Scrape real articles from a specific source."""
         news_list = []
         
         try:
             # Make request to the source
-            response = self.session.get(source['url'], timeout=15)
+            response = self.fetch(source['url'], timeout=15)
             response.raise_for_status()
             
-            # Parse HTML
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Try multiple strategies to find articles
-            articles = []
-            
-            # Strategy 1: Use the specified selector
-            articles = soup.select(source['article_selector'])
+            # Reuse the previous extraction when the page is byte-identical
+            records = self.extraction_cache.get(response.content, source)
+            if records is None:
+                records = self.extract_articles(source, response.content)
+                self.extraction_cache.put(response.content, source, records)
+            else:
+                print(f"♻️ Página de {source['name']} sem alterações, reutilizando extração")
             
-            # Strategy 2: If no articles found, try alternative selectors
-            if not articles:
-                alternative_selectors = [
-                    '.article', '.post', '.news', '.blog-post', '.content-item',
-                    '[class*="article"]', '[class*="post"]', '[class*="news"]',
-                    '.card', '.item', '.entry'
-                ]
-                
-                for selector in alternative_selectors:
-                    articles = soup.select(selector)
-                    if articles:
-                        print(f"✅ Encontrados {len(articles)} artigos usando selector: {selector}")
-                        break
-            
-            # Strategy 3: If still no articles, look for any div with links
-            if not articles:
-                articles = soup.find_all(['div', 'article'], class_=re.compile(r'post|article|news|blog|card|item'))
-            
-            # Strategy 4: Last resort - find any div with links that might be articles
-            if not articles:
-                articles = soup.find_all('div', class_=True)
-                articles = [a for a in articles if a.find('a') and a.find(['h1', 'h2', 'h3'])]
-            
-            print(f"🔍 Encontrados {len(articles)} possíveis artigos em {source['name']}")
-            
-            for article in articles[:15]:  # Limit to 15 articles per source
-                try:
-                    # Extract title
-                    title_elem = article.select_one(source['title_selector'])
-                    if not title_elem:
-                        # Try alternative title selectors
-                        for selector in ['h1', 'h2', 'h3', '.title', '.post-title', '.card-title', '[class*="title"]']:
-                            title_elem = article.select_one(selector)
-                            if title_elem:
-                                break
-                    
-                    if not title_elem:
-                        continue
-                    
-                    title = title_elem.get_text(strip=True)
-                    
-                    # Skip if title is too short or too long
-                    if len(title) < 10 or len(title) > 200:
-                        continue
-                    
-                    # Check if title contains relevant keywords
-                    title_lower = title.lower()
-                    relevant_keywords = source['search_terms'] + ['emprego', 'trabalho', 'profissional', 'mercado']
-                    
-                    if not any(term.lower() in title_lower for term in relevant_keywords):
-                        continue
-                    
-                    # Extract link
-                    link_elem = article.select_one(source['link_selector'])
-                    if not link_elem:
-                        # Try to find any link in the article
-                        link_elem = article.find('a')
-                    
-                    if not link_elem:
-                        continue
-                    
-                    link = link_elem.get('href')
-                    if not link:
-                        continue
-                    
-                    # Make absolute URL
-                    if link.startswith('/'):
-                        link = urllib.parse.urljoin(source['url'], link)
-                    elif not link.startswith('http'):
-                        link = urllib.parse.urljoin(source['url'], link)
-                    
-                    # Skip external links
-                    if not any(domain in link for domain in ['vagas.com.br', 'exame.com', 'vocesa.abril.com.br', 'portalrh.com.br', 'revistarh.com.br', 'hrbrasil.com.br']):
-                        continue
-                    
-                    # Extract date
-                    date_elem = article.select_one(source['date_selector'])
-                    if not date_elem:
-                        # Try alternative date selectors
-                        for selector in ['.date', '.published', '.post-date', 'time', '.card-date', '[class*="date"]']:
-                            date_elem = article.select_one(selector)
-                            if date_elem:
-                                break
-                    
-                    if date_elem:
-                        date_text = date_elem.get_text(strip=True)
-                        # Try to parse date
-                        try:
-                            # Common date formats
-                            date_formats = [
-                                '%d/%m/%Y', '%Y-%m-%d', '%d-%m-%Y',
-                                '%d de %B de %Y', '%d/%m/%y', '%d/%m/%Y %H:%M',
-                                '%Y-%m-%d %H:%M:%S', '%d/%m/%Y às %H:%M'
-                            ]
-                            
-                            article_date = None
-                            for fmt in date_formats:
-                                try:
-                                    article_date = datetime.strptime(date_text, fmt)
-                                    break
-                                except:
-                                    continue
-                            
-                            if not article_date:
-                                # If we can't parse, use current date
-                                article_date = datetime.now()
-                        except:
-                            article_date = datetime.now()
-                    else:
-                        article_date = datetime.now()
-                    
-                    # Generate realistic engagement metrics based on recency
-                    days_ago = (datetime.now() - article_date).days
-                    base_views = max(1000, 50000 - (days_ago * 500))
-                    views = base_views + random.randint(0, 2000)
-                    comments = max(5, views // 100) + random.randint(0, 20)
-                    shares = max(10, views // 200) + random.randint(0, 10)
-                    
-                    # Extract summary (first paragraph or meta description)
-                    summary_elem = article.select_one('p, .summary, .excerpt, .description')
-                    if not summary_elem:
-                        # Try to find first paragraph
-                        summary_elem = article.find('p')
-                    
-                    if summary_elem:
-                        summary = summary_elem.get_text(strip=True)
-                        if len(summary) > 200:
-                            summary = summary[:200] + "..."
-                    else:
-                        summary = f"Artigo sobre {title.lower()} com dicas valiosas para profissionais em busca de recolocação."
-                    
-                    # Determine category
-                    category = self.get_category_from_title(title)
-                    
-                    news_list.append({
-                        "rank": 0,  # Will be assigned later
-                        "title": title,
-                        "source": source['name'],
-                        "summary": summary,
-                        "url": link,
-                        "date": article_date.strftime("%Y-%m-%d"),
-                        "views": views,
-                        "shares": shares,
-                        "comments": comments,
-                        "category": category,
-                        "is_current": days_ago <= 7,
-                        "is_real": True
-                    })
-                    
-                    print(f"✅ Artigo encontrado: {title[:50]}...")
-                    
-                except Exception as e:
-                    print(f"⚠️ Erro ao processar artigo: {e}")
-                    continue
+            # Articles ingested by an earlier run are not enriched again
+            known = self.known_urls(records, incremental)
+            if known:
+                print(f"⏭️ {len(known)} artigos de {source['name']} já processados")
+                records = [r for r in records if r['url'] not in known]
             
+            for record in records:
+                news_list.append(self.enrich_article(record))
+        
         except Exception as e:
             print(f"⚠️ Erro ao acessar {source['name']}: {e}")
         
         return news_list
     
-    def get_category_from_title(self, title):
-        """Get category from article title."""
-        title_lower = title.lower()
+    def known_urls(self, records, incremental=False):
+        """URLs of records already ingested, per the seen filter and, in incremental mode, the store."""
+        known = set()
+        if self.seen_filter is not None:
+            known.update(r['url'] for r in records if dedupe_key(r['url']) in self.seen_filter)
+        if incremental:
+            known.update(self.store.known_urls(r['url'] for r in records))
+        return known
+    
+    def extract_articles(self, source, content):
+        """Parse a source page and extract article records without engagement data."""
+        records = []
+        
+        # Try multiple strategies to find articles, starting with the one that worked last time
+        plan = self.get_plan(source)
+        articles = plan.find_articles(content, self.partial_parse)
         
-        category_mapping = {
-            "entrevista": "Entrevistas",
-            "entrevistas": "Entrevistas",
-            "processo seletivo": "Processos Seletivos",
-            "processos seletivos": "Processos Seletivos",
-            "currículo": "Currículo",
-            "curriculo": "Currículo",
-            "cv": "Currículo",
-            "networking": "Networking",
-            "comportamental": "Entrevistas Comportamentais",
-            "comportamentais": "Entrevistas Comportamentais",
-            "perguntas": "Entrevistas",
-            "linkedin": "LinkedIn",
-            "mudança de carreira": "Transição de Carreira",
-            "mudanca de carreira": "Transição de Carreira",
-            "videoconferência": "Entrevistas Remotas",
-            "videoconferencia": "Entrevistas Remotas",
-            "negociar": "Negociação",
-            "negociação": "Negociação",
-            "psicológica": "Preparação Psicológica",
-            "psicologica": "Preparação Psicológica",
-            "segunda entrevista": "Entrevistas",
-            "rejeição": "Resiliência",
-            "rejeicao": "Resiliência",
-            "recrutamento": "Recrutamento",
-            "remoto": "Processos Remotos",
-            "dinâmica": "Dinâmicas de Grupo",
-            "dinamica": "Dinâmicas de Grupo",
-            "teste": "Testes",
-            "gestor": "Entrevistas Sênior",
-            "soft skill": "Soft Skills",
-            "soft skills": "Soft Skills",
-            "técnica": "Entrevistas Técnicas",
-            "tecnica": "Entrevistas Técnicas",
-            "follow-up": "Follow-up",
-            "inglês": "Entrevistas em Inglês",
-            "ingles": "Entrevistas em Inglês",
-            "vestir": "Imagem Profissional",
-            "estágio": "Primeira Oportunidade",
-            "estagio": "Primeira Oportunidade",
-            "demissão": "Explicar Demissão",
-            "demissao": "Explicar Demissão",
-            "primeira oportunidade": "Primeira Oportunidade",
-            "liderança": "Liderança",
-            "lideranca": "Liderança",
-            "sênior": "Cargos Sênior",
-            "senior": "Cargos Sênior",
-            "resultado": "Resultados",
-            "startup": "Startups"
-        }
+        print(f"🔍 Encontrados {len(articles)} possíveis artigos em {source['name']}")
         
-        for key, value in category_mapping.items():
-            if key in title_lower:
-                return value
+        for article in articles[:15]:  # Limit to 15 articles per source
+            try:
+                # Title, link, date and summary elements in one pass over the article
+                fields = plan.extract_fields(article)
+                
+                # Extract title
+                title_elem = fields['title']
+                
+                if not title_elem:
+                    continue
+                
+                title = title_elem.get_text(strip=True)
+                
+                # Skip if title is too short or too long
+                if len(title) < 10 or len(title) > 200:
+                    continue
+                
+                # Check relevance and pick the category in one keyword scan
+                is_relevant, category = plan.matcher.analyze(title)
+                if not is_relevant:
+                    continue
+                
+                # Extract link
+                link_elem = fields['link']
+                
+                if not link_elem:
+                    continue
+                
+                link = link_elem.get('href')
+                if not link:
+                    continue
+                
+                # Make absolute URL and skip external links
+                link = urllib.parse.urljoin(source['url'], link)
+                if not self.allowlist.allows(link):
+                    continue
+                
+                # Drop tracking params, fragments and trailing slashes
+                link = canonicalize_url(link)
+                
+                # Extract date
+                date_elem = fields['date']
+                
+                # Prefer a machine-readable <time datetime>, then the visible date text.
+                # Unparseable or missing dates stay None and become "today" at enrichment time
+                date_text = date_elem.get_text(strip=True) if date_elem else None
+                datetime_attr = (date_elem.get('datetime') if date_elem else None) or fields['datetime']
+                article_date = self.date_parser.parse(date_text, datetime_attr, source['name'])
+                
+                # Extract summary (first paragraph or meta description)
+                summary_elem = fields['summary']
+                
+                if summary_elem:
+                    summary = summary_elem.get_text(strip=True)
+                    if len(summary) > 200:
+                        summary = summary[:200] + "..."
+                else:
+                    summary = f"Artigo sobre {title.lower()} com dicas valiosas para profissionais em busca de recolocação."
+                
+                records.append({
+                    "title": title,
+                    "source": source['name'],
+                    "summary": summary,
+                    "url": link,
+                    "date": article_date.strftime("%Y-%m-%d %H:%M:%S") if article_date else None,
+                    "category": category
+                })
+                
+                print(f"✅ Artigo encontrado: {title[:50]}...")
+            
+            except Exception as e:
+                print(f"⚠️ Erro ao processar artigo: {e}")
+                continue
         
-        return "Carreira"
+        return records
+    
+    def get_plan(self, source):
+        """Return the compiled extraction plan for a source."""
+        plan = self.plans.get(source['name'])
+        if plan is None or plan.source != source:
+            plan = ExtractionPlan(source, self.plan_memo)
+        return plan
+    
+    def enrich_article(self, record):
+        """Build a ranked news entry from an extracted record, with fresh engagement metrics."""
+        if record['date']:
+            article_date = datetime.strptime(record['date'], "%Y-%m-%d %H:%M:%S")
+        else:
+            article_date = datetime.now()
+        
+        # Generate realistic engagement metrics based on recency
+        days_ago = (datetime.now() - article_date).days
+        base_views = max(1000, 50000 - (days_ago * 500))
+        views = base_views + random.randint(0, 2000)
+        comments = max(5, views // 100) + random.randint(0, 20)
+        shares = max(10, views // 200) + random.randint(0, 10)
+        
+        return Article(
+            rank=0,  # Will be assigned later
+            title=record['title'],
+            source=record['source'],
+            summary=record['summary'],
+            url=record['url'],
+            date=article_date.strftime("%Y-%m-%d"),
+            views=views,
+            shares=shares,
+            comments=comments,
+            category=record['category'],
+            is_current=days_ago <= 7,
+            is_real=True
+        )
     
-    def generate_additional_current_news(self, count):
-        """Generate additional current news about career transition to reach 30 articles."""
+    def get_category_from_title(self, title):
+        """Get category from article title."""
+        return DEFAULT_MATCHER.category(title)
+    
+    def generate_additional_current_news(self, count, used_titles=()):
+        """Generate additional current news about career transition to reach 30 articles.
+        
+        Titles in used_titles are skipped, and no title repeats until every one has been used.
+        """
         additional_news = []
         current_date = datetime.now()
         
@@ -424,16 +475,21 @@ class RealHRNewsScraper:
             "Como demonstrar resultados em entrevistas",
             "Startups: prepare-se para processos ágeis",
             "LinkedIn para busca de emprego: otimize seu perfil",
-            "Primeira oportunidade: como entrar no mercado"
+            "Primeira oportunidade: como entrar no mercado",
+            "Recolocação após os 50: como valorizar sua experiência"
         ]
         
+        # Draw titles without replacement so a batch doesn't repeat itself
+        available_titles = [title for title in real_titles if title not in used_titles] or real_titles
+        title_order = random.sample(available_titles, len(available_titles))
+        
         for i in range(count):
             days_ago = random.randint(0, 30)
             article_date = current_date - timedelta(days=days_ago)
             
             category = random.choice(categories)
             source = random.choice(sources)
-            title = random.choice(real_titles)
+            title = title_order[i % len(title_order)]
             
             # Generate realistic engagement based on recency
             base_views = max(2000, 80000 - (days_ago * 1000))
@@ -444,697 +500,127 @@ class RealHRNewsScraper:
             # Generate realistic URL
             url = f"https://{source.lower().replace(' ', '').replace('.', '').replace('/', '')}.com.br/blog/{title.lower().replace(' ', '-').replace(':', '').replace(',', '')}"
             
-            additional_news.append({
-                "rank": 0,
-                "title": title,
-                "source": source,
-                "summary": f"Artigo completo sobre {title.lower()} com estratégias práticas para profissionais em busca de recolocação. Inclui dicas valiosas e casos reais.",
-                "url": url,
-                "date": article_date.strftime("%Y-%m-%d"),
-                "views": views,
-                "shares": shares,
-                "comments": comments,
-                "category": category,
-                "is_current": days_ago <= 7,
-                "is_real": False
-            })
+            additional_news.append(Article(
+                rank=0,
+                title=title,
+                source=source,
+                summary=f"Artigo completo sobre {title.lower()} com estratégias práticas para profissionais em busca de recolocação. Inclui dicas valiosas e casos reais.",
+                url=url,
+                date=article_date.strftime("%Y-%m-%d"),
+                views=views,
+                shares=shares,
+                comments=comments,
+                category=category,
+                is_current=days_ago <= 7,
+                is_real=False
+            ))
         
         return additional_news
     
     def get_news_statistics(self, news_list):
         """Generate statistics from the current news data."""
-        total_views = sum(news['views'] for news in news_list)
-        total_shares = sum(news['shares'] for news in news_list)
-        total_comments = sum(news['comments'] for news in news_list)
-        current_news = sum(1 for news in news_list if news.get('is_current', False))
-        
-        categories = {}
-        for news in news_list:
-            cat = news['category']
-            if cat not in categories:
-                categories[cat] = {'count': 0, 'views': 0}
-            categories[cat]['count'] += 1
-            categories[cat]['views'] += news['views']
-        
-        sources = {}
-        for news in news_list:
-            source = news['source']
-            if source not in sources:
-                sources[source] = {'count': 0, 'views': 0}
-            sources[source]['count'] += 1
-            sources[source]['views'] += news['views']
-        
-        return {
-            'total_views': total_views,
-            'total_shares': total_shares,
-            'total_comments': total_comments,
-            'current_news': current_news,
-            'categories': categories,
-            'sources': sources,
-            'avg_views': total_views // len(news_list),
-            'top_category': max(categories.items(), key=lambda x: x[1]['views'])[0],
-            'top_source': max(sources.items(), key=lambda x: x[1]['views'])[0]
-        }
+        return news_statistics(news_list)
 
 
-def generate_current_news_html(news_list, stats):
-    """Generate HTML page for current HR news with animated background and HR4ALL.com logo."""
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    
-    # Generate news HTML
-    news_html = ""
-    for news in news_list:
-        rank_class = "top-10" if news['rank'] <= 10 else "top-50" if news['rank'] <= 50 else "top-100"
-        current_class = "current" if news.get('is_current', False) else ""
-        
-        news_html += f"""
-        <div class="news-item {rank_class} {current_class}">
-            <div class="rank-badge">#{news['rank']}</div>
-            <div class="news-content">
-                <div class="news-header">
-                    <span class="source">{news['source']}</span>
-                    <span class="category">{news['category']}</span>
-                    <span class="date">{news['date']}</span>
-                    {f'<span class="current-badge">🔥 Atual</span>' if news.get('is_current', False) else ''}
-                </div>
-                <h3 class="title">{news['title']}</h3>
-                <p class="summary">{news['summary']}</p>
-                <div class="engagement">
-                    <span class="views">👁️ {news['views']:,} visualizações</span>
-                    <span class="shares">📤 {news['shares']:,} compartilhamentos</span>
-                    <span class="comments">💬 {news['comments']:,} comentários</span>
-                    <a href="https://www.google.com/search?q={news['title'].replace(' ', '+')}+{news['source'].replace(' ', '+')}+RH" target="_blank" rel="noopener noreferrer" class="search-google">
-                        🔍 Buscar no Google
-                    </a>
-                </div>
-            </div>
-        </div>
-        """
-    
-    # Generate category stats HTML
-    category_html = ""
-    for category, data in sorted(stats['categories'].items(), key=lambda x: x[1]['views'], reverse=True):
-        category_html += f"""
-        <div class="stat-item">
-            <div class="stat-label">{category}</div>
-            <div class="stat-number">{data['count']} artigos</div>
-            <div class="stat-views">{data['views']:,} visualizações</div>
-        </div>
-        """
-    
-    # Generate source stats HTML
-    source_html = ""
-    for source, data in sorted(stats['sources'].items(), key=lambda x: x[1]['views'], reverse=True):
-        source_html += f"""
-        <div class="stat-item">
-            <div class="stat-label">{source}</div>
-            <div class="stat-number">{data['count']} artigos</div>
-            <div class="stat-views">{data['views']:,} visualizações</div>
-        </div>
-        """
-    
-    html_content = f"""
-<!DOCTYPE html>
-<html lang="pt-BR">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>30 Notícias sobre Recolocação Profissional - HR4AL.co</title>
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            background: #0a0a0a;
-            min-height: 100vh;
-            padding: 20px;
-            position: relative;
-            overflow-x: hidden;
-        }}
-        
-        /* Animated Background */
-        .animated-background {{
-            position: fixed;
-            top: 0;
-            left: 0;
-            width: 100%;
-            height: 100%;
-            z-index: -1;
-            background: linear-gradient(45deg, #0a0a0a, #1a1a2e, #16213e, #0f3460);
-            background-size: 400% 400%;
-            animation: gradientShift 15s ease infinite;
-        }}
-        
-        @keyframes gradientShift {{
-            0% {{ background-position: 0% 50%; }}
-            50% {{ background-position: 100% 50%; }}
-            100% {{ background-position: 0% 50%; }}
-        }}
-        
-        /* Floating Particles */
-        .particles {{
-            position: fixed;
-            top: 0;
-            left: 0;
-            width: 100%;
-            height: 100%;
-            z-index: -1;
-            pointer-events: none;
-        }}
-        
-        .particle {{
-            position: absolute;
-            width: 4px;
-            height: 4px;
-            background: rgba(255, 255, 255, 0.1);
-            border-radius: 50%;
-            animation: float 20s infinite linear;
-        }}
-        
-        .particle:nth-child(1) {{ left: 10%; animation-delay: 0s; animation-duration: 25s; }}
-        .particle:nth-child(2) {{ left: 20%; animation-delay: 2s; animation-duration: 30s; }}
-        .particle:nth-child(3) {{ left: 30%; animation-delay: 4s; animation-duration: 22s; }}
-        .particle:nth-child(4) {{ left: 40%; animation-delay: 6s; animation-duration: 28s; }}
-        .particle:nth-child(5) {{ left: 50%; animation-delay: 8s; animation-duration: 35s; }}
-        .particle:nth-child(6) {{ left: 60%; animation-delay: 10s; animation-duration: 26s; }}
-        .particle:nth-child(7) {{ left: 70%; animation-delay: 12s; animation-duration: 32s; }}
-        .particle:nth-child(8) {{ left: 80%; animation-delay: 14s; animation-duration: 24s; }}
-        .particle:nth-child(9) {{ left: 90%; animation-delay: 16s; animation-duration: 29s; }}
-        .particle:nth-child(10) {{ left: 95%; animation-delay: 18s; animation-duration: 27s; }}
-        
-        @keyframes float {{
-            0% {{
-                transform: translateY(100vh) rotate(0deg);
-                opacity: 0;
-            }}
-            10% {{
-                opacity: 1;
-            }}
-            90% {{
-                opacity: 1;
-            }}
-            100% {{
-                transform: translateY(-100px) rotate(360deg);
-                opacity: 0;
-            }}
-        }}
-        
-        /* HR4AL Logo */
-        .hr4al-logo {{
-            position: fixed;
-            top: 20px;
-            left: 20px;
-            z-index: 1000;
-            background: rgba(255, 255, 255, 0.1);
-            backdrop-filter: blur(10px);
-            border-radius: 15px;
-            padding: 15px 25px;
-            border: 1px solid rgba(255, 255, 255, 0.2);
-            animation: logoGlow 3s ease-in-out infinite alternate;
-        }}
-        
-        .hr4al-logo h2 {{
-            color: #fff;
-            font-size: 1.8em;
-            font-weight: bold;
-            text-shadow: 0 0 20px rgba(255, 255, 255, 0.5);
-            margin: 0;
-        }}
-        
-        .hr4al-logo .tagline {{
-            color: #ccc;
-            font-size: 0.9em;
-            margin-top: 5px;
-            opacity: 0.8;
-        }}
-        
-        @keyframes logoGlow {{
-            0% {{ box-shadow: 0 0 20px rgba(255, 255, 255, 0.1); }}
-            100% {{ box-shadow: 0 0 30px rgba(255, 255, 255, 0.3); }}
-        }}
-        
-        .container {{
-            max-width: 1400px;
-            margin: 0 auto;
-            background: rgba(255, 255, 255, 0.95);
-            backdrop-filter: blur(20px);
-            border-radius: 20px;
-            box-shadow: 0 25px 50px rgba(0,0,0,0.3);
-            overflow: hidden;
-            border: 1px solid rgba(255, 255, 255, 0.2);
-        }}
-        
-        .header {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 40px;
-            text-align: center;
-            position: relative;
-            overflow: hidden;
-        }}
-        
-        .header::before {{
-            content: '';
-            position: absolute;
-            top: 0;
-            left: 0;
-            right: 0;
-            bottom: 0;
-            background: url('data:image/svg+xml,<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 100 100"><defs><pattern id="grain" width="100" height="100" patternUnits="userSpaceOnUse"><circle cx="25" cy="25" r="1" fill="rgba(255,255,255,0.1)"/><circle cx="75" cy="75" r="1" fill="rgba(255,255,255,0.1)"/><circle cx="50" cy="10" r="0.5" fill="rgba(255,255,255,0.1)"/><circle cx="10" cy="60" r="0.5" fill="rgba(255,255,255,0.1)"/><circle cx="90" cy="40" r="0.5" fill="rgba(255,255,255,0.1)"/></pattern></defs><rect width="100" height="100" fill="url(%23grain)"/></svg>');
-            opacity: 0.3;
-        }}
-        
-        .developer-credit {{
-            position: absolute;
-            top: 15px;
-            right: 20px;
-            color: #FFD700;
-            font-size: 1.1em;
-            font-weight: bold;
-            text-shadow: 1px 1px 2px rgba(0,0,0,0.3);
-            z-index: 10;
-        }}
-        
-        .developer-credit a {{
-            color: #FFD700;
-            text-decoration: none;
-            transition: color 0.2s;
-        }}
-        
-        .developer-credit a:hover {{
-            color: #FFA500;
-            text-decoration: underline;
-        }}
-        
-        .header h1 {{
-            font-size: 3em;
-            margin-bottom: 15px;
-            font-weight: 300;
-            position: relative;
-            z-index: 1;
-        }}
-        
-        .header p {{
-            font-size: 1.3em;
-            opacity: 0.9;
-            margin-bottom: 20px;
-            position: relative;
-            z-index: 1;
-        }}
-        
-        .stats-overview {{
-            background: rgba(248, 249, 250, 0.9);
-            padding: 30px;
-            border-bottom: 1px solid rgba(233, 236, 239, 0.5);
-        }}
-        
-        .stats-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-            gap: 20px;
-            text-align: center;
-        }}
-        
-        .stat-card {{
-            background: rgba(255, 255, 255, 0.9);
-            padding: 25px;
-            border-radius: 12px;
-            box-shadow: 0 4px 8px rgba(0,0,0,0.1);
-            transition: transform 0.3s ease;
-        }}
-        
-        .stat-card:hover {{
-            transform: translateY(-5px);
-        }}
-        
-        .stat-number {{
-            font-size: 2.5em;
-            font-weight: bold;
-            color: #667eea;
-            margin-bottom: 10px;
-        }}
-        
-        .stat-label {{
-            color: #6c757d;
-            font-size: 1.1em;
-            font-weight: 500;
-        }}
-        
-        .content {{
-            display: grid;
-            grid-template-columns: 2fr 1fr;
-            gap: 30px;
-            padding: 30px;
-        }}
-        
-        .news-section {{
-            background: rgba(255, 255, 255, 0.9);
-        }}
-        
-        .news-section h2 {{
-            color: #333;
-            margin-bottom: 25px;
-            font-size: 2em;
-            border-bottom: 3px solid #667eea;
-            padding-bottom: 10px;
-        }}
-        
-        .news-item {{
-            border: 1px solid rgba(233, 236, 239, 0.5);
-            border-radius: 12px;
-            padding: 25px;
-            margin-bottom: 20px;
-            background: rgba(255, 255, 255, 0.9);
-            transition: transform 0.2s, box-shadow 0.2s;
-            position: relative;
-        }}
-        
-        .news-item:hover {{
-            transform: translateY(-3px);
-            box-shadow: 0 12px 30px rgba(0,0,0,0.15);
-        }}
-        
-        .news-item.top-10 {{
-            border-left: 5px solid #28a745;
-            background: linear-gradient(135deg, rgba(248, 255, 249, 0.9) 0%, rgba(255, 255, 255, 0.9) 100%);
-        }}
-        
-        .news-item.top-50 {{
-            border-left: 5px solid #ffc107;
-        }}
-        
-        .news-item.top-100 {{
-            border-left: 5px solid #6c757d;
-        }}
-        
-        .news-item.current {{
-            border: 2px solid #dc3545;
-            background: linear-gradient(135deg, rgba(255, 245, 245, 0.9) 0%, rgba(255, 255, 255, 0.9) 100%);
-        }}
-        
-        .rank-badge {{
-            position: absolute;
-            top: 15px;
-            right: 15px;
-            background: #667eea;
-            color: white;
-            padding: 8px 12px;
-            border-radius: 20px;
-            font-weight: bold;
-            font-size: 1.1em;
-        }}
-        
-        .current-badge {{
-            background: #dc3545;
-            color: white;
-            padding: 5px 10px;
-            border-radius: 15px;
-            font-size: 0.8em;
-            font-weight: bold;
-            animation: pulse 2s infinite;
-        }}
-        
-        @keyframes pulse {{
-            0% {{ opacity: 1; }}
-            50% {{ opacity: 0.7; }}
-            100% {{ opacity: 1; }}
-        }}
-        
-        .news-header {{
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 15px;
-            flex-wrap: wrap;
-            gap: 10px;
-        }}
-        
-        .source {{
-            font-weight: bold;
-            color: #667eea;
-            font-size: 1.1em;
-        }}
-        
-        .category {{
-            background: #e9ecef;
-            color: #495057;
-            padding: 5px 12px;
-            border-radius: 20px;
-            font-size: 0.9em;
-            font-weight: 500;
-        }}
-        
-        .date {{
-            color: #6c757d;
-            font-size: 0.9em;
-        }}
-        
-        .title {{
-            font-weight: bold;
-            color: #333;
-            font-size: 1.4em;
-            margin-bottom: 15px;
-            line-height: 1.4;
-        }}
-        
-        .search-google {{
-            background: #4285f4;
-            color: white;
-            padding: 8px 15px;
-            border-radius: 20px;
-            text-decoration: none;
-            font-weight: 500;
-            transition: background-color 0.2s;
-            display: inline-flex;
-            align-items: center;
-            gap: 5px;
-        }}
-        
-        .search-google:hover {{
-            background: #3367d6;
-            text-decoration: none;
-            transform: translateY(-1px);
-            box-shadow: 0 4px 8px rgba(66, 133, 244, 0.3);
-        }}
-        
-        .summary {{
-            color: #555;
-            line-height: 1.6;
-            font-size: 1.1em;
-            margin-bottom: 20px;
-        }}
-        
-        .engagement {{
-            display: flex;
-            gap: 20px;
-            flex-wrap: wrap;
-        }}
-        
-        .engagement span {{
-            font-size: 0.95em;
-            color: #6c757d;
-            background: #f8f9fa;
-            padding: 8px 15px;
-            border-radius: 20px;
-            font-weight: 500;
-        }}
-        
-        .sidebar {{
-            background: rgba(248, 249, 250, 0.9);
-            padding: 25px;
-            border-radius: 12px;
-            height: fit-content;
-        }}
-        
-        .sidebar h3 {{
-            color: #333;
-            margin-bottom: 20px;
-            font-size: 1.5em;
-            border-bottom: 2px solid #667eea;
-            padding-bottom: 10px;
-        }}
-        
-        .stat-item {{
-            background: rgba(255, 255, 255, 0.9);
-            padding: 15px;
-            border-radius: 8px;
-            margin-bottom: 15px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            transition: transform 0.2s ease;
-        }}
-        
-        .stat-item:hover {{
-            transform: translateX(5px);
-        }}
-        
-        .stat-label {{
-            font-weight: bold;
-            color: #333;
-            font-size: 1.1em;
-            margin-bottom: 5px;
-        }}
-        
-        .stat-number {{
-            color: #667eea;
-            font-weight: bold;
-            font-size: 1.2em;
-        }}
-        
-        .stat-views {{
-            color: #6c757d;
-            font-size: 0.9em;
-            margin-top: 5px;
-        }}
-        
-        .footer {{
-            background: rgba(248, 249, 250, 0.9);
-            padding: 25px;
-            text-align: center;
-            color: #6c757d;
-            border-top: 1px solid rgba(233, 236, 239, 0.5);
-        }}
-        
-        @media (max-width: 1200px) {{
-            .content {{
-                grid-template-columns: 1fr;
-            }}
-        }}
-        
-        @media (max-width: 768px) {{
-            .header h1 {{
-                font-size: 2.5em;
-            }}
-            
-            .news-header {{
-                flex-direction: column;
-                align-items: flex-start;
-            }}
-            
-            .engagement {{
-                flex-direction: column;
-                gap: 10px;
-            }}
-            
-            .stats-grid {{
-                grid-template-columns: 1fr;
-            }}
-            
-            .hr4al-logo {{
-                position: relative;
-                top: auto;
-                left: auto;
-                margin-bottom: 20px;
-            }}
-        }}
-    </style>
-</head>
-<body>
-    <!-- Animated Background -->
-    <div class="animated-background"></div>
-    
-    <!-- Floating Particles -->
-    <div class="particles">
-        <div class="particle"></div>
-        <div class="particle"></div>
-        <div class="particle"></div>
-        <div class="particle"></div>
-        <div class="particle"></div>
-        <div class="particle"></div>
-        <div class="particle"></div>
-        <div class="particle"></div>
-        <div class="particle"></div>
-        <div class="particle"></div>
-    </div>
-    
-    <!-- HR4AL Logo -->
-    <div class="hr4al-logo">
-        <h2>HR4AL.co</h2>
-        <div class="tagline">Recolocação Profissional</div>
-    </div>
+CURRENT_BADGE = Markup('<span class="current-badge">🔥 Atual</span>')
+
+
+def news_card_context(news):
+    """Template context of one news card."""
+    is_current = news.get('is_current', False)
+    return {
+        'news': news,
+        'rank_class': "top-10" if news['rank'] <= 10 else "top-50" if news['rank'] <= 50 else "top-100",
+        'current_class': "current" if is_current else "",
+        'current_badge': CURRENT_BADGE if is_current else "",
+        'search_query': f"{news['title']} {news['source']} RH"
+    }
+
+
+# Card placeholders that change from run to run; everything else is cached per article
+DYNAMIC_CARD_FIELDS = ('rank_class', 'news.rank', 'news.views', 'news.shares', 'news.comments')
+
+
+def news_card(news):
+    """Identity, display fields and template context of a news card, for the fragment cache."""
+    identity = news.get('url') or f"{news['title']}|{news['source']}"
+    display = (news['title'], news['source'], news['category'], news['date'],
+               news.get('summary'), news.get('is_current', False))
+    return identity, display, news_card_context(news)
+
+
+def iter_current_news_html(news_list, stats, fragment_cache=None):
+    """Chunks of the current HR news page, with each news card rendered as it is reached.
     
-    <div class="container">
-        <div class="header">
-            <div class="developer-credit">Desenvolvido por <a href="https://workitu.com" target="_blank" rel="noopener noreferrer">Workitu TecH</a></div>
-            <h1>🔥 100 Notícias sobre Recolocação Profissional</h1>
-            <p>As notícias mais recentes sobre entrevistas, processos seletivos e carreira no Brasil</p>
-            <p>Coletadas de fontes especializadas em carreira e atualizadas diariamente</p>
-            <p>Rankeadas por popularidade e relevância</p>
-        </div>
-        
-        <div class="stats-overview">
-            <div class="stats-grid">
-                <div class="stat-card">
-                    <div class="stat-number">{stats['total_views']:,}</div>
-                    <div class="stat-label">Total de Visualizações</div>
-                </div>
-                <div class="stat-card">
-                    <div class="stat-number">{stats['total_shares']:,}</div>
-                    <div class="stat-label">Total de Compartilhamentos</div>
-                </div>
-                <div class="stat-card">
-                    <div class="stat-number">{stats['total_comments']:,}</div>
-                    <div class="stat-label">Total de Comentários</div>
-                </div>
-                <div class="stat-card">
-                    <div class="stat-number">{stats['current_news']}</div>
-                    <div class="stat-label">Notícias da Semana</div>
-                </div>
-            </div>
-        </div>
-        
-        <div class="content">
-            <div class="news-section">
-                <h2>📰 Notícias sobre Recolocação Profissional</h2>
-                {news_html}
-            </div>
-            
-            <div class="sidebar">
-                <h3>📈 Estatísticas por Categoria</h3>
-                {category_html}
-                
-                <h3>📰 Estatísticas por Fonte</h3>
-                {source_html}
-            </div>
-        </div>
-        
-        <div class="footer">
-            <p>Dados coletados em {datetime.now().strftime("%Y-%m-%d %H:%M:%S")} | HR4AL.co - Recolocação Profissional</p>
-            <p>Notícias coletadas de fontes especializadas em carreira e processos seletivos</p>
-        </div>
-    </div>
-</body>
-</html>
+    With a FragmentCache, cards of articles already rendered in earlier
+    runs are reused and only their rank and engagement are filled in.
     """
+    if fragment_cache is not None:
+        news_html = CachedFragments(load_template('current_news_card.html'), news_list,
+                                    fragment_cache, news_card, DYNAMIC_CARD_FIELDS)
+    else:
+        news_html = render_each('current_news_card.html', map(news_card_context, news_list), key=None)
     
+    return iter_render(
+        'current_news.html',
+        stylesheet=asset_url('current_news.css'),
+        stats=stats,
+        news_html=news_html,
+        category_html=render_group_stats(stats['categories']),
+        source_html=render_group_stats(stats['sources']),
+        generated_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    )
+
+
+def generate_current_news_html(news_list, stats, fragment_cache=None):
+    """Generate HTML page for current HR news with animated background and HR4ALL.com logo."""
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    html_content = ''.join(iter_current_news_html(news_list, stats, fragment_cache))
     return html_content, timestamp
 
 
-def main():
-    """Main function to scrape and display current HR news."""
+def main(incremental=False):
+    """Main function to scrape and display current HR news.
+    
+    With incremental=True (--incremental on the command line) only new
+    articles are processed and the page ranks the whole stored history.
+    """
     print("🚀 Current HR News Scraper")
     print("=" * 60)
     
-    # Initialize scraper
-    scraper = RealHRNewsScraper()
-    
-    # Collect current news
-    news_list = scraper.scrape_real_hr_news()
+    with ArticleStore() as store:
+        # Initialize scraper
+        scraper = RealHRNewsScraper(store=store)
+        
+        # Collect current news
+        run_started = datetime.now()
+        news_list = scraper.scrape_real_hr_news(incremental=incremental)
+        
+        if not incremental:
+            # Persist the run's real articles, then render this run's ranking back from the store,
+            # topped up with the simulated filler, which is never stored
+            new_count = store.upsert_many(news_list, observed_at=run_started)
+            print(f"💾 {new_count} notícias novas salvas no histórico ({len(store)} no total)")
+            filler = [news for news in news_list if not news.get('is_real', False)]
+            news_list = top_k(store.top_news(30, seen_since=run_started) + filler, 30, engagement_recency_score)
+        
+        # Figures for the whole stored history, computed over columns instead of one dict per article
+        history = store.table().statistics()
+        print(f"📚 Histórico: {len(store)} notícias, {history['total_views']:,} visualizações, "
+              f"fonte mais popular: {history['top_source']}")
     
     # Generate statistics
     stats = scraper.get_news_statistics(news_list)
     
-    # Generate HTML
-    html_content, timestamp = generate_current_news_html(news_list, stats)
-    filename = f"current_hr_news_{timestamp}.html"
+    filename = "current_hr_news.html"
     
     try:
-        # Save HTML file
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        # Stream the page to disk card by card; the file is replaced only once it is complete
+        fragment_cache = FragmentCache()
+        write_atomic(filename, iter_current_news_html(news_list, stats, fragment_cache))
+        fragment_cache.save()
+        precompress([filename, asset_path('current_news.css')])
+        print(f"🧩 {fragment_cache.hits} cartões reaproveitados do cache, {fragment_cache.misses} renderizados")
         
         print(f"✅ 100 notícias atuais coletadas e página HTML gerada!")
         print(f"📁 Arquivo: {filename}")
@@ -1160,10 +646,10 @@ def main():
         current_news = [n for n in news_list if n.get('is_current', False)]
         for i, news in enumerate(current_news[:5], 1):
             print(f"   {i}. {news['title'][:60]}... ({news['date']})")
-        
+    
     except Exception as e:
         print(f"❌ Erro: {e}")
 
 
 if __name__ == "__main__":
-    main()
+    main(incremental="--incremental" in sys.argv[1:])
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Date Parser
+
+Fast, locale-independent parsing of the publication dates found on
+Brazilian news pages:
+
+- ISO 8601 values from <time datetime="..."> attributes (fast path)
+- numeric dates such as 14/08/2025, 14/08/25 às 10:30, 2025-08-14 10:30:00, 2025/08/14
+- written dates with Portuguese (or English) month names, e.g. 14 de agosto de 2025
+- relative dates such as "há 2 horas", "3 dias atrás", "ontem"
+
+Formats are matched with precompiled regular expressions instead of
+probing strptime inside try/except, and the parser remembers per source
+which format succeeded last so it is tried first next time.
+"""
+
+import re
+import threading
+from datetime import datetime, timedelta
+
+
+PORTUGUESE_MONTHS = {
+    'janeiro': 1, 'fevereiro': 2, 'março': 3, 'marco': 3, 'abril': 4,
+    'maio': 5, 'junho': 6, 'julho': 7, 'agosto': 8, 'setembro': 9,
+    'outubro': 10, 'novembro': 11, 'dezembro': 12,
+    'jan': 1, 'fev': 2, 'mar': 3, 'abr': 4, 'mai': 5, 'jun': 6,
+    'jul': 7, 'ago': 8, 'set': 9, 'out': 10, 'nov': 11, 'dez': 12
+}
+
+ENGLISH_MONTHS = {
+    'january': 1, 'february': 2, 'march': 3, 'april': 4, 'may': 5, 'june': 6,
+    'july': 7, 'august': 8, 'september': 9, 'october': 10, 'november': 11, 'december': 12,
+    'feb': 2, 'apr': 4, 'aug': 8, 'sep': 9, 'oct': 10, 'dec': 12
+}
+
+MONTHS = {**ENGLISH_MONTHS, **PORTUGUESE_MONTHS}
+
+RELATIVE_UNITS = {
+    'segundo': 'seconds', 'segundos': 'seconds',
+    'minuto': 'minutes', 'minutos': 'minutes', 'min': 'minutes',
+    'hora': 'hours', 'horas': 'hours', 'h': 'hours',
+    'dia': 'days', 'dias': 'days',
+    'semana': 'weeks', 'semanas': 'weeks',
+    'mês': 'months', 'mes': 'months', 'meses': 'months',
+    'ano': 'years', 'anos': 'years'
+}
+
+RELATIVE_DAYS = {'hoje': 0, 'ontem': 1, 'anteontem': 2}
+
+TIME_SUFFIX = r'(?:\s*(?:às|as|,|-)?\s*(?P<hour>\d{1,2})[:h](?P<minute>\d{2})(?::(?P<second>\d{2}))?)?'
+
+
+def _year(value):
+    year = int(value)
+    return year + 2000 if year < 100 else year
+
+
+def _build(match, year, month, day):
+    hour = int(match.group('hour') or 0)
+    minute = int(match.group('minute') or 0)
+    second = int(match.group('second') or 0)
+    return datetime(year, month, day, hour, minute, second)
+
+
+def _numeric_dmy(match, now):
+    return _build(match, _year(match.group('year')), int(match.group('month')), int(match.group('day')))
+
+
+def _numeric_ymd(match, now):
+    return _build(match, int(match.group('year')), int(match.group('month')), int(match.group('day')))
+
+
+def _written(match, now):
+    month = MONTHS.get(match.group('month').lower().rstrip('.'))
+    if month is None:
+        return None
+    return _build(match, int(match.group('year')), month, int(match.group('day')))
+
+
+def _relative(match, now):
+    # A bare "10 h" is not a relative date; require "há ..." or "... atrás"
+    if not match.group('prefix') and not match.group('suffix'):
+        return None
+    amount = int(match.group('amount'))
+    unit = RELATIVE_UNITS[match.group('unit').lower()]
+    # timedelta has no months or years; approximate them in days
+    if unit == 'months':
+        return now - timedelta(days=30 * amount)
+    if unit == 'years':
+        return now - timedelta(days=365 * amount)
+    return now - timedelta(**{unit: amount})
+
+
+def _relative_day(match, now):
+    days = RELATIVE_DAYS[match.group('word').lower()]
+    day = (now - timedelta(days=days)).replace(hour=0, minute=0, second=0, microsecond=0)
+    if match.group('hour'):
+        return day.replace(hour=int(match.group('hour')), minute=int(match.group('minute')))
+    return day
+
+
+_UNIT_PATTERN = '|'.join(sorted((re.escape(u) for u in RELATIVE_UNITS), key=len, reverse=True))
+
+# (name, pattern, builder) in default try order
+DATE_FORMATS = [
+    # The lookbehinds keep a match from starting inside a longer number, such as the year of 2025/08/14
+    ('dmy', re.compile(r'(?<![/\d])(?P<day>\d{1,2})/(?P<month>\d{1,2})/(?P<year>\d{4}|\d{2})(?!\d)' + TIME_SUFFIX), _numeric_dmy),
+    ('ymd', re.compile(r'(?<!\d)(?P<year>\d{4})(?P<separator>[-/])(?P<month>\d{1,2})(?P=separator)(?P<day>\d{1,2})(?!\d)(?:[T\s]+(?P<hour>\d{1,2}):(?P<minute>\d{2})(?::(?P<second>\d{2}))?)?'), _numeric_ymd),
+    ('dmy-dash', re.compile(r'(?<![-.\d])(?P<day>\d{1,2})[-.](?P<month>\d{1,2})[-.](?P<year>\d{4})(?!\d)' + TIME_SUFFIX), _numeric_dmy),
+    ('written', re.compile(r'(?<!\d)(?P<day>\d{1,2})(?:º)?\s*(?:de\s+)?(?P<month>[a-zA-Zç]+\.?)\s*(?:de\s+)?(?P<year>\d{4})' + TIME_SUFFIX, re.IGNORECASE), _written),
+    ('relative', re.compile(r'(?:(?P<prefix>\bh[áa])\s+)?(?P<amount>\d+)\s*(?P<unit>' + _UNIT_PATTERN + r')\b(?P<suffix>\s+atr[áa]s)?', re.IGNORECASE), _relative),
+    ('relative-day', re.compile(r'\b(?P<word>hoje|ontem|anteontem)\b(?:\D*(?P<hour>\d{1,2})[:h](?P<minute>\d{2}))?', re.IGNORECASE), _relative_day),
+]
+
+_FORMATS_BY_NAME = {name: (pattern, builder) for name, pattern, builder in DATE_FORMATS}
+
+
+def parse_iso(value):
+    """Parse an ISO 8601 datetime attribute into a naive local datetime, or None."""
+    value = value.strip()
+    if value.endswith('Z'):
+        value = value[:-1] + '+00:00'
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone().replace(tzinfo=None)
+    return parsed
+
+
+class DateParser:
+    """Date parser with a per-source memo of the format that last succeeded."""
+    
+    def __init__(self):
+        self.last_format = {}
+        self.lock = threading.Lock()
+    
+    def parse(self, text, datetime_attr=None, source_key=None, now=None):
+        """Parse an article date, returning a naive datetime or None."""
+        if datetime_attr:
+            parsed = parse_iso(datetime_attr)
+            if parsed:
+                return parsed
+        
+        if not text:
+            return None
+        
+        now = now or datetime.now()
+        with self.lock:
+            preferred = self.last_format.get(source_key)
+        
+        for name in self._ordered_formats(preferred):
+            pattern, builder = _FORMATS_BY_NAME[name]
+            match = pattern.search(text)
+            if not match:
+                continue
+            
+            try:
+                parsed = builder(match, now)
+            except ValueError:
+                # Matched the shape but not a real date (e.g. 31/02/2025)
+                parsed = None
+            if parsed:
+                if name != preferred:
+                    with self.lock:
+                        self.last_format[source_key] = name
+                return parsed
+        
+        return None
+    
+    def _ordered_formats(self, preferred):
+        if preferred in _FORMATS_BY_NAME:
+            yield preferred
+        for name, _, _ in DATE_FORMATS:
+            if name != preferred:
+                yield name
+
+
+default_date_parser = DateParser()
+
+
+def parse_date(text, datetime_attr=None, source_key=None, now=None):
+    """Parse an article date with the shared parser."""
+    return default_date_parser.parse(text, datetime_attr, source_key, now)
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Extraction Cache
+
+Remembers the article records extracted from a page, keyed by a hash of the
+response body plus the source configuration. When a source returns a
+byte-identical page, the records come straight from the cache and the page
+is never parsed. Engagement numbers are not cached; they are recomputed by
+the scraper on every run.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+
+
+DEFAULT_CACHE_PATH = ".extraction_cache.json"
+
+# Bump when the extraction logic changes so stale records are not reused
+EXTRACTOR_VERSION = 4
+
+
+class ExtractionCache:
+    """Persistent LRU map from (page body, source config) to extracted records."""
+    
+    def __init__(self, path=DEFAULT_CACHE_PATH, max_entries=64, version=EXTRACTOR_VERSION):
+        self.path = path
+        self.max_entries = max_entries
+        self.version = version
+        self.lock = threading.Lock()
+        self.entries = self._load()
+    
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return OrderedDict()
+        
+        if data.get('version') != self.version:
+            return OrderedDict()
+        return OrderedDict(data.get('entries', []))
+    
+    def _save(self):
+        # Best effort: an unwritable cache must not cost the records just extracted
+        tmp_path = self.path + ".tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': self.version, 'entries': list(self.entries.items())}, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"⚠️ Não foi possível salvar o cache de extração em {self.path}: {e}")
+    
+    def key(self, content, source):
+        """Hash of the page body and the source configuration."""
+        digest = hashlib.sha256(content)
+        digest.update(json.dumps(source, sort_keys=True, ensure_ascii=False).encode('utf-8'))
+        return digest.hexdigest()
+    
+    def get(self, content, source):
+        """Return the cached records for this page, or None."""
+        key = self.key(content, source)
+        with self.lock:
+            records = self.entries.get(key)
+            if records is not None:
+                self.entries.move_to_end(key)
+            return records
+    
+    def put(self, content, source, records):
+        """Store the records extracted from this page."""
+        key = self.key(content, source)
+        with self.lock:
+            self.entries[key] = records
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+            self._save()
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Extraction Plans
+
+Each news source config is compiled once into an ExtractionPlan: all CSS
+selectors are pre-compiled, the partial-parse strainer is built once, and
+the selector cascades for articles and fields are laid out as ordered
+candidate lists.
+
+A PlanMemo remembers, across runs, which page strategy and which article
+selector actually produced results for each source, and the plan tries
+that one first next time instead of walking the failed selectors again.
+
+Article fields (title, link, date, <time datetime> and summary) are
+extracted in a single walk over the article subtree that keeps the best
+match per field according to the declared selector priority.
+"""
+
+import json
+import os
+import re
+import threading
+
+import soupsieve
+
+from html_parsers import make_soup, parse_simple_selectors, rules_match, selector_strainer
+from text_matcher import get_matcher
+
+
+DEFAULT_MEMO_PATH = ".extraction_plans.json"
+
+# Fallback article container selectors, tried in order when a source's own selector finds nothing
+ALTERNATIVE_ARTICLE_SELECTORS = [
+    '.article', '.post', '.news', '.blog-post', '.content-item',
+    '[class*="article"]', '[class*="post"]', '[class*="news"]',
+    '.card', '.item', '.entry'
+]
+
+ALTERNATIVE_TITLE_SELECTORS = ['h1', 'h2', 'h3', '.title', '.post-title', '.card-title', '[class*="title"]']
+ALTERNATIVE_DATE_SELECTORS = ['.date', '.published', '.post-date', 'time', '.card-date', '[class*="date"]']
+SUMMARY_SELECTORS = ['p, .summary, .excerpt, .description', 'p']
+
+# Strategy 3 container classes
+CONTAINER_CLASS_PATTERN = re.compile(r'post|article|news|blog|card|item')
+
+STRATEGY_SELECTOR = 'selector'
+STRATEGY_CONTAINER_CLASS = 'container-class'
+STRATEGY_LINKED_HEADING = 'linked-heading'
+
+
+class PlanMemo:
+    """Persistent record of the winning strategy and selectors per source."""
+    
+    def __init__(self, path=DEFAULT_MEMO_PATH):
+        self.path = path
+        self.lock = threading.Lock()
+        self.dirty = False
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                self.data = json.load(f)
+        except (OSError, ValueError):
+            self.data = {}
+    
+    def get(self, source_name, key):
+        with self.lock:
+            return self.data.get(source_name, {}).get(key)
+    
+    def set(self, source_name, key, value):
+        with self.lock:
+            winners = self.data.setdefault(source_name, {})
+            if winners.get(key) != value:
+                winners[key] = value
+                self.dirty = True
+    
+    def save(self):
+        """Write the memo to disk if anything changed."""
+        with self.lock:
+            if not self.dirty:
+                return
+            tmp_path = self.path + ".tmp"
+            try:
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(self.data, f, ensure_ascii=False, indent=2)
+                os.replace(tmp_path, self.path)
+            except OSError as e:
+                # Best effort: the plans are only a speed-up for the next run
+                print(f"⚠️ Não foi possível salvar os planos de extração em {self.path}: {e}")
+                return
+            self.dirty = False
+
+
+class SelectorCascade:
+    """Ordered list of compiled article selectors that tries the memoized winner first."""
+    
+    def __init__(self, selectors):
+        self.selectors = list(dict.fromkeys(selectors))
+        self.compiled = {selector: soupsieve.compile(selector) for selector in self.selectors}
+    
+    def ordered(self, winner=None):
+        """Selectors in the order to try them, memoized winner first."""
+        if winner in self.compiled:
+            yield winner
+        for selector in self.selectors:
+            if selector != winner:
+                yield selector
+
+
+class FieldMatcher:
+    """Prioritized selector groups for one article field, compiled to tag predicates."""
+    
+    def __init__(self, selectors):
+        self.selectors = list(dict.fromkeys(selectors))
+        self.predicates = [self._compile(selector) for selector in self.selectors]
+    
+    def _compile(self, selector):
+        # Simple selectors are checked directly against the tag; anything else goes through soupsieve
+        rules = parse_simple_selectors(selector)
+        if rules is not None:
+            return lambda tag: rules_match(rules, tag.name, tag.attrs)
+        return soupsieve.compile(selector).match
+
+
+class ExtractionPlan:
+    """Pre-compiled extraction strategy for one news source."""
+    
+    def __init__(self, source, memo=None):
+        self.source = source
+        self.name = source['name']
+        self.parser = source.get('parser')
+        self.memo = memo or PlanMemo()
+        
+        self.articles = SelectorCascade([source['article_selector']] + ALTERNATIVE_ARTICLE_SELECTORS)
+        self.strainer = selector_strainer(self.articles.selectors)
+        
+        # Relevance and category keywords for this source's search terms
+        self.matcher = get_matcher(tuple(source['search_terms']))
+        
+        # Field name -> selector groups in priority order, as select_one would try them
+        self.fields = [
+            ('title', FieldMatcher([source['title_selector']] + ALTERNATIVE_TITLE_SELECTORS)),
+            ('link', FieldMatcher([source['link_selector'], 'a'])),
+            ('date', FieldMatcher([source['date_selector']] + ALTERNATIVE_DATE_SELECTORS)),
+            ('summary', FieldMatcher(SUMMARY_SELECTORS)),
+        ]
+    
+    def find_articles(self, content, partial_parse=True):
+        """Parse a page and return its article containers."""
+        winner = self.memo.get(self.name, 'strategy')
+        soup = None
+        
+        # Strategies 3 and 4 need the whole document; skip the selector walk if they won last time
+        if winner in (STRATEGY_CONTAINER_CLASS, STRATEGY_LINKED_HEADING):
+            soup = make_soup(content, self.parser)
+            articles = self.find_fallback_articles(soup, winner)
+            if articles:
+                return articles
+        
+        # Strategies 1 and 2 only need the article containers, so build just those subtrees
+        if partial_parse and self.strainer is not None:
+            articles = self.select_articles(make_soup(content, self.parser, parse_only=self.strainer))
+        else:
+            soup = soup or make_soup(content, self.parser)
+            articles = self.select_articles(soup)
+        
+        if articles:
+            return articles
+        
+        soup = soup or make_soup(content, self.parser)
+        return self.find_fallback_articles(soup)
+    
+    def select_articles(self, soup):
+        """Strategies 1 and 2: the source selector, then the alternative selectors."""
+        winner = self.memo.get(self.name, 'article_selector')
+        
+        for selector in self.articles.ordered(winner):
+            articles = self.articles.compiled[selector].select(soup)
+            if articles:
+                if selector != self.source['article_selector']:
+                    print(f"✅ Encontrados {len(articles)} artigos usando selector: {selector}")
+                self.memo.set(self.name, 'strategy', STRATEGY_SELECTOR)
+                self.memo.set(self.name, 'article_selector', selector)
+                return articles
+        
+        return []
+    
+    def find_fallback_articles(self, soup, first=None):
+        """Strategies 3 and 4 over the full document."""
+        strategies = [STRATEGY_CONTAINER_CLASS, STRATEGY_LINKED_HEADING]
+        if first in strategies:
+            strategies.remove(first)
+            strategies.insert(0, first)
+        
+        for strategy in strategies:
+            if strategy == STRATEGY_CONTAINER_CLASS:
+                # Strategy 3: any div or article whose class looks like an article container
+                articles = soup.find_all(['div', 'article'], class_=CONTAINER_CLASS_PATTERN)
+            else:
+                # Strategy 4: any classed div that holds both a link and a heading
+                articles = soup.find_all('div', class_=True)
+                articles = [a for a in articles if a.find('a') and a.find(['h1', 'h2', 'h3'])]
+            
+            if articles:
+                self.memo.set(self.name, 'strategy', strategy)
+                return articles
+        
+        return []
+    
+    def extract_fields(self, article):
+        """Walk an article subtree once and return the element for each field.
+        
+        The result maps title, link, date and summary to the element that the
+        selector cascade would have found (or None), plus 'datetime' with the
+        datetime attribute of the first <time> tag.
+        """
+        found = {field: None for field, _ in self.fields}
+        found['datetime'] = None
+        # Priority index of the current match per field; only better priorities are checked
+        ranks = {field: len(matcher.predicates) for field, matcher in self.fields}
+        
+        for tag in article.descendants:
+            if tag.name is None:
+                continue
+            
+            if found['datetime'] is None and tag.name == 'time' and tag.get('datetime'):
+                found['datetime'] = tag['datetime']
+            
+            done = found['datetime'] is not None
+            for field, matcher in self.fields:
+                rank = ranks[field]
+                for i in range(rank):
+                    if matcher.predicates[i](tag):
+                        ranks[field] = rank = i
+                        found[field] = tag
+                        break
+                if rank:
+                    done = False
+            
+            # Every field has its top-priority match; nothing later can beat it
+            if done:
+                break
+        
+        return found
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Fragment Cache
+
+Remembers rendered news cards between runs. Most cards on a page are the
+same articles as in the previous run with the same text; only the rank
+and the engagement numbers move. Each card template is bound once per
+article with its display fields (title, summary, source, ...) rendered
+in, leaving only the rank and engagement placeholders open, and the
+result is cached under the article's identity together with a hash of
+those display fields. Rendering a cached card is then a join over a few
+literal chunks and numbers. A card is re-bound only when its article's
+display fields or the card template change.
+
+Entries are kept in LRU order, capped at max_entries, and written to disk
+with save().
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+
+from templates import Fragments, Template
+
+
+DEFAULT_CACHE_PATH = ".fragment_cache.json"
+
+# Bump when the cache file layout changes
+CACHE_VERSION = 1
+
+
+@lru_cache(maxsize=None)
+def template_digest(template):
+    """Hash of a card template's source, computed once per template."""
+    return hashlib.blake2b(template.source.encode('utf-8'), digest_size=16).digest()
+
+
+class FragmentCache:
+    """Persistent LRU map from article identity to its bound card template."""
+    
+    def __init__(self, path=DEFAULT_CACHE_PATH, max_entries=2048):
+        self.path = path
+        self.max_entries = max_entries
+        self.lock = threading.Lock()
+        self.entries = self._load()
+        # Compiled templates of the entries used in this process, by identity
+        self.compiled = {}
+        self.dirty = False
+        self.hits = 0
+        self.misses = 0
+    
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return OrderedDict()
+        
+        if data.get('version') != CACHE_VERSION:
+            return OrderedDict()
+        return OrderedDict(data.get('entries', []))
+    
+    def save(self):
+        """Write the cache to disk if anything changed."""
+        with self.lock:
+            if not self.dirty:
+                return
+            tmp_path = self.path + ".tmp"
+            try:
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump({'version': CACHE_VERSION, 'entries': list(self.entries.items())}, f, ensure_ascii=False)
+                os.replace(tmp_path, self.path)
+            except OSError as e:
+                # Best effort: the page is already written
+                print(f"⚠️ Não foi possível salvar o cache de fragmentos em {self.path}: {e}")
+                return
+            self.dirty = False
+    
+    def digest(self, template, display):
+        """Hash of the card template and the article's display fields."""
+        digest = hashlib.blake2b(template_digest(template), digest_size=16)
+        digest.update(json.dumps(display, ensure_ascii=False, default=str).encode('utf-8'))
+        return digest.hexdigest()
+    
+    def bound(self, template, identity, display, context, keep):
+        """The card template bound to this article, from the cache when its display fields are unchanged."""
+        digest = self.digest(template, display)
+        with self.lock:
+            entry = self.entries.get(identity)
+            if entry is not None and entry[0] == digest:
+                self.entries.move_to_end(identity)
+                self.hits += 1
+                compiled = self.compiled.get(identity)
+                if compiled is None or compiled[0] != digest:
+                    compiled = self.compiled[identity] = (digest, Template(entry[1], identity))
+                return compiled[1]
+        
+        source = template.bind(context, keep)
+        bound = Template(source, identity)
+        with self.lock:
+            self.misses += 1
+            self.entries[identity] = [digest, source]
+            self.entries.move_to_end(identity)
+            self.compiled[identity] = (digest, bound)
+            while len(self.entries) > self.max_entries:
+                evicted, _ = self.entries.popitem(last=False)
+                self.compiled.pop(evicted, None)
+            self.dirty = True
+        return bound
+
+
+class CachedFragments(Fragments):
+    """Fragments whose cards are bound through a FragmentCache.
+    
+    card(item) returns (identity, display fields, template context); the
+    placeholders listed in keep are the per-render values (rank and
+    engagement) filled in on every render.
+    """
+    
+    def __init__(self, template, items, cache, card, keep):
+        super().__init__(template, items, key=None)
+        self.cache = cache
+        self.card = card
+        self.keep = frozenset(keep)
+    
+    def __iter__(self):
+        for i, item in enumerate(self.items):
+            if i:
+                yield '\n'
+            identity, display, context = self.card(item)
+            yield self.cache.bound(self.template, identity, display, context, self.keep).render(context)
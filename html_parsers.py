@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+HTML Parser Backends
+
+Pluggable BeautifulSoup tree builders for the scrapers. lxml is the fast
+default; Python's built-in html.parser is the fallback when lxml is not
+installed. Sources pick a backend with the "parser" key in their config.
+
+SelectorStrainer supports partial parsing: only the subtrees whose root
+matches one of a list of simple CSS selectors are built.
+"""
+
+import re
+
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer
+
+
+DEFAULT_BACKEND = "lxml"
+FALLBACK_BACKEND = "html.parser"
+
+# Backend name -> BeautifulSoup features string
+PARSER_BACKENDS = {
+    "lxml": "lxml",
+    "html.parser": "html.parser",
+}
+
+_available = {}
+
+
+def is_available(backend):
+    """Return True if BeautifulSoup can build trees with this backend."""
+    if backend not in _available:
+        try:
+            BeautifulSoup("", PARSER_BACKENDS[backend])
+            _available[backend] = True
+        except (FeatureNotFound, KeyError):
+            _available[backend] = False
+    return _available[backend]
+
+
+def resolve_backend(backend=None):
+    """Pick the requested backend, falling back to html.parser when it can't be used."""
+    backend = backend or DEFAULT_BACKEND
+    if is_available(backend):
+        return backend
+    
+    print(f"⚠️ Parser '{backend}' indisponível, usando {FALLBACK_BACKEND}")
+    return FALLBACK_BACKEND
+
+
+def make_soup(content, backend=None, **kwargs):
+    """Parse HTML with the chosen backend."""
+    return BeautifulSoup(content, PARSER_BACKENDS[resolve_backend(backend)], **kwargs)
+
+
+# tag, .class, tag.class.other, optionally followed by one [attr*="fragment"]
+SIMPLE_SELECTOR = re.compile(
+    r'^(?P<tag>[a-zA-Z][\w-]*)?(?P<classes>(?:\.[\w-]+)*)'
+    r'(?:\[(?P<attr>[\w-]+)\*=(?P<quote>["\']?)(?P<value>[^"\'\]]+)(?P=quote)\])?$'
+)
+
+
+def parse_simple_selectors(group):
+    """Parse a comma-separated selector group into match rules, or None if any selector is too complex.
+    
+    Each rule is (tag or None, set of required classes, attribute or None, fragment or None).
+    """
+    rules = []
+    for selector in group.split(','):
+        selector = selector.strip()
+        match = SIMPLE_SELECTOR.match(selector)
+        if not selector or not match:
+            return None
+        
+        classes = {c for c in match.group('classes').split('.') if c}
+        rules.append((match.group('tag'), classes, match.group('attr'), match.group('value')))
+    
+    return rules
+
+
+def rules_match(rules, name, attrs):
+    """Return True if a tag name and attribute dict satisfy any of the rules."""
+    for tag, required, attr, fragment in rules:
+        if tag and tag != name:
+            continue
+        
+        if required:
+            classes = attrs.get('class', '') if attrs else ''
+            if isinstance(classes, str):
+                classes = classes.split()
+            if not required.issubset(classes):
+                continue
+        
+        if attr:
+            value = attrs.get(attr) if attrs else None
+            if value is None:
+                continue
+            if isinstance(value, (list, tuple)):
+                value = ' '.join(value)
+            if fragment not in value:
+                continue
+        
+        return True
+    return False
+
+
+class SelectorStrainer(SoupStrainer):
+    """SoupStrainer that keeps every subtree whose root matches one of several simple selectors."""
+    
+    def __init__(self, rules):
+        super().__init__()
+        self.rules = rules
+    
+    def allow_tag_creation(self, nsprefix, name, attrs):
+        # Used by beautifulsoup4 >= 4.13
+        return rules_match(self.rules, name, attrs)
+    
+    def search_tag(self, markup_name=None, markup_attrs=None):
+        # Used by beautifulsoup4 < 4.13
+        if isinstance(markup_attrs, list):
+            markup_attrs = dict(markup_attrs)
+        return rules_match(self.rules, markup_name, markup_attrs)
+
+
+def selector_strainer(selectors):
+    """Build a SelectorStrainer for a list of selector groups, or None if any selector is too complex."""
+    rules = []
+    for group in selectors:
+        group_rules = parse_simple_selectors(group)
+        if group_rules is None:
+            return None
+        rules.extend(group_rules)
+    
+    return SelectorStrainer(rules)
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+HTTP Conditional-GET Cache
+
+Persistent cache that sits under a requests.Session as a transport adapter.
+Bodies are kept on disk together with their ETag/Last-Modified validators.
+Later GETs send If-None-Match/If-Modified-Since, and a 304 answer is turned
+into a normal 200 response served from disk. The cache is bounded in bytes
+and evicts the least recently used entries first.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+
+DEFAULT_CACHE_DIR = ".http_cache"
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+
+# Headers that no longer describe the body once requests has decoded it
+DROPPED_HEADERS = {'content-encoding', 'content-length', 'transfer-encoding', 'connection'}
+
+
+class HTTPCache:
+    """Size-bounded LRU store of response bodies and their validators."""
+    
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.index_path = os.path.join(directory, "index.json")
+        self.lock = threading.Lock()
+        
+        try:
+            os.makedirs(directory, exist_ok=True)
+        except OSError as e:
+            print(f"⚠️ Não foi possível criar o cache HTTP em {directory}: {e}")
+        self.index = self._load_index()
+    
+    def _load_index(self):
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_index(self):
+        # Cache writes are best effort: a failure must never fail the request
+        tmp_path = self.index_path + ".tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.index, f)
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            print(f"⚠️ Não foi possível salvar o índice do cache HTTP: {e}")
+    
+    def _key(self, url):
+        return hashlib.sha256(url.encode('utf-8')).hexdigest()
+    
+    def _body_path(self, key):
+        return os.path.join(self.directory, key + ".body")
+    
+    def lookup(self, url):
+        """Return the index entry for a URL, or None."""
+        with self.lock:
+            return self.index.get(self._key(url))
+    
+    def read_body(self, url):
+        """Read a cached body and mark the entry as recently used."""
+        key = self._key(url)
+        with self.lock:
+            entry = self.index.get(key)
+            if entry is None:
+                return None
+            
+            try:
+                with open(self._body_path(key), 'rb') as f:
+                    body = f.read()
+            except OSError:
+                # Body went missing; forget the entry so the request is retried unconditionally
+                del self.index[key]
+                self._save_index()
+                return None
+            
+            entry['accessed'] = time.time()
+            self._save_index()
+            return body
+    
+    def store(self, url, body, headers):
+        """Store a body with its validators, evicting old entries to stay under max_bytes."""
+        if len(body) > self.max_bytes:
+            return
+        
+        key = self._key(url)
+        kept_headers = {k: v for k, v in headers.items() if k.lower() not in DROPPED_HEADERS}
+        
+        with self.lock:
+            try:
+                with open(self._body_path(key), 'wb') as f:
+                    f.write(body)
+            except OSError as e:
+                print(f"⚠️ Não foi possível salvar {url} no cache HTTP: {e}")
+                return
+            
+            self.index[key] = {
+                'url': url,
+                'etag': headers.get('ETag'),
+                'last_modified': headers.get('Last-Modified'),
+                'headers': kept_headers,
+                'size': len(body),
+                'accessed': time.time()
+            }
+            self._evict()
+            self._save_index()
+    
+    def _evict(self):
+        total = sum(entry['size'] for entry in self.index.values())
+        if total <= self.max_bytes:
+            return
+        
+        for key, entry in sorted(self.index.items(), key=lambda x: x[1]['accessed']):
+            if total <= self.max_bytes:
+                break
+            
+            try:
+                os.remove(self._body_path(key))
+            except OSError:
+                pass
+            total -= entry['size']
+            del self.index[key]
+
+
+class CachingAdapter(HTTPAdapter):
+    """HTTPAdapter that revalidates GETs against an HTTPCache."""
+    
+    def __init__(self, cache=None, **kwargs):
+        super().__init__(**kwargs)
+        self.cache = cache or HTTPCache()
+    
+    def send(self, request, stream=False, **kwargs):
+        if request.method != 'GET' or stream:
+            return super().send(request, stream=stream, **kwargs)
+        
+        entry = self.cache.lookup(request.url)
+        if entry:
+            if entry.get('etag'):
+                request.headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                request.headers['If-Modified-Since'] = entry['last_modified']
+        
+        response = super().send(request, stream=stream, **kwargs)
+        
+        if response.status_code == 304 and entry:
+            body = self.cache.read_body(request.url)
+            if body is not None:
+                return self._build_cached_response(request, response, entry, body)
+            # The cached body is gone, so the 304 cannot be answered: ask again unconditionally
+            response.close()
+            request.headers.pop('If-None-Match', None)
+            request.headers.pop('If-Modified-Since', None)
+            response = super().send(request, stream=stream, **kwargs)
+
+        if response.status_code == 200 and ('ETag' in response.headers or 'Last-Modified' in response.headers):
+            self.cache.store(request.url, response.content, response.headers)
+        
+        return response
+    
+    def _build_cached_response(self, request, not_modified, entry, body):
+        """Turn a 304 into the 200 response it stands for."""
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = 'OK'
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        response.elapsed = not_modified.elapsed
+        response._content = body
+        
+        response.headers = CaseInsensitiveDict(entry['headers'])
+        # Refreshed validators and dates from the 304 take precedence
+        for name, value in not_modified.headers.items():
+            if name.lower() not in DROPPED_HEADERS:
+                response.headers[name] = value
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        
+        response.from_cache = True
+        return response
+
+
+def install_cache(session, cache=None):
+    """Mount a CachingAdapter for http and https on a session."""
+    adapter = CachingAdapter(cache)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return adapter
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Near Duplicates
+
+Detection of the same story republished with slightly different headlines,
+by the same or by different outlets.
+
+Each title is reduced to its set of accent-folded content words (Portuguese
+stopwords removed, so "O que fazer depois de ser demitido" and "...promovido"
+don't look alike on articles and prepositions alone) and summarized by
+a MinHash signature. Signatures are split into bands and only titles that
+share a band exactly are compared (LSH banding), so the work stays close to
+linear in the number of articles instead of comparing every pair. Candidate
+pairs are confirmed with the exact Jaccard similarity of their word sets and
+merged with a union-find.
+"""
+
+import hashlib
+import re
+from array import array
+from collections import defaultdict
+from functools import lru_cache
+
+from text_matcher import fold
+
+
+NUM_PERMUTATIONS = 60
+BAND_ROWS = 3
+
+# Share of content words two titles need in common to be the same story.
+# Short headlines differing in one topic word ("negociar salário" vs
+# "negociar benefícios") score 0.6, so the bar sits above that.
+DEFAULT_THRESHOLD = 0.7
+
+WORD_PATTERN = re.compile(r'\w+')
+
+# Accent-folded Portuguese function words, ignored when comparing titles
+STOPWORDS = frozenset("""
+    a o as os um uma uns umas ao aos de da do das dos em na no nas nos num numa
+    por pelo pela pelos pelas para pra com sem sob sobre entre ate apos e ou nem
+    mas que se como quando onde qual quais quem cujo seu sua seus suas meu minha
+    nosso nossa este esta estes estas esse essa esses essas isso isto aquele aquela
+    ja nao mais menos muito muita ser estar ter ha foi sao vai
+""".split())
+
+# Engagement counters that are summed when a cluster is collapsed
+ENGAGEMENT_FIELDS = ('views', 'comments', 'shares')
+
+
+@lru_cache(maxsize=65536)
+def word_hashes(word):
+    """NUM_PERMUTATIONS independent 32-bit hashes of a word."""
+    return array('I', hashlib.shake_128(word.encode('utf-8')).digest(4 * NUM_PERMUTATIONS))
+
+
+def title_words(title):
+    """Set of folded content words in a title."""
+    return frozenset(word for word in WORD_PATTERN.findall(fold(title or '')) if word not in STOPWORDS)
+
+
+def minhash(words):
+    """MinHash signature of a word set: the minimum hash per permutation."""
+    if not words:
+        return None
+    return tuple(map(min, zip(*(word_hashes(word) for word in words))))
+
+
+def jaccard(a, b):
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+class UnionFind:
+    """Disjoint sets over 0..n-1 with path halving."""
+    
+    def __init__(self, size):
+        self.parent = list(range(size))
+    
+    def find(self, item):
+        parent = self.parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+    
+    def union(self, a, b):
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a != root_b:
+            # Keep the lower index as root so clusters keep input order
+            if root_b < root_a:
+                root_a, root_b = root_b, root_a
+            self.parent[root_b] = root_a
+
+
+class NearDuplicateDetector:
+    """Groups articles whose titles share at least `threshold` of their words."""
+    
+    def __init__(self, threshold=DEFAULT_THRESHOLD, band_rows=BAND_ROWS):
+        self.threshold = threshold
+        self.band_rows = band_rows
+    
+    def clusters(self, articles):
+        """Return lists of article indexes, one per cluster, in input order."""
+        groups = UnionFind(len(articles))
+        
+        # Identical word sets are merged directly; LSH only runs over distinct sets
+        first_by_words = {}
+        for index, article in enumerate(articles):
+            words = title_words(article.get('title'))
+            if words in first_by_words:
+                groups.union(first_by_words[words], index)
+            elif words:
+                first_by_words[words] = index
+        
+        distinct = list(first_by_words.items())
+        signatures = [minhash(words) for words, _ in distinct]
+        compared = set()
+        
+        # Bucket by each band; only titles sharing a bucket are compared
+        for start in range(0, NUM_PERMUTATIONS - self.band_rows + 1, self.band_rows):
+            buckets = defaultdict(list)
+            for position, signature in enumerate(signatures):
+                buckets[signature[start:start + self.band_rows]].append(position)
+            
+            for members in buckets.values():
+                for i, a in enumerate(members):
+                    for b in members[i + 1:]:
+                        if (a, b) in compared:
+                            continue
+                        compared.add((a, b))
+                        (words_a, index_a), (words_b, index_b) = distinct[a], distinct[b]
+                        if jaccard(words_a, words_b) >= self.threshold:
+                            groups.union(index_a, index_b)
+        
+        clusters = defaultdict(list)
+        for index in range(len(articles)):
+            clusters[groups.find(index)].append(index)
+        return list(clusters.values())
+    
+    def collapse(self, articles):
+        """Merge each cluster into its first article in input order, summing engagement.
+        
+        Merged entries list the URLs of the other cluster members in 'duplicate_urls'.
+        """
+        collapsed = []
+        for members in self.clusters(articles):
+            if len(members) == 1:
+                collapsed.append(articles[members[0]])
+                continue
+            
+            cluster = [articles[index] for index in members]
+            # The first member, not the most engaged one: engagement changes between runs,
+            # and the representative URL must not, or the store sees a new article each time
+            best = cluster[0]
+            merged = best.copy()
+            for field in ENGAGEMENT_FIELDS:
+                merged[field] = sum(article.get(field, 0) for article in cluster)
+            # Remember the merged-away URLs so they are recognized as known later
+            duplicate_urls = []
+            for article in cluster:
+                if article is not best and 'url' in article:
+                    duplicate_urls.append(article['url'])
+                duplicate_urls.extend(article.get('duplicate_urls', ()))
+            merged['duplicate_urls'] = duplicate_urls
+            collapsed.append(merged)
+        
+        return collapsed
+
+
+def collapse_near_duplicates(articles, threshold=DEFAULT_THRESHOLD):
+    """Collapse near-duplicate articles with a default detector."""
+    return NearDuplicateDetector(threshold).collapse(articles)
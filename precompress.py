@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Precompress
+
+Writes compressed variants of generated artifacts (HTML pages, static
+assets, JSON outputs) once, at build time, instead of compressing them
+on every request. Each file gets a gzip variant (page.html.gz, level 9)
+and, when the brotli package is installed, a brotli variant
+(page.html.br, quality 11). A variant is kept only if it is smaller than
+the file itself.
+
+The variants of every artifact are recorded in a JSON manifest, together
+with the size and modification time of the file they were made from, so
+a server can tell stale variants apart and fall back to the plain file.
+Artifacts that have not changed since the last run are skipped.
+
+Usage: python precompress.py [FILE ...]
+Without arguments, every *.html page and every file under static/ in
+the current directory is compressed.
+"""
+
+import glob
+import gzip
+import json
+import os
+import sys
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+MANIFEST_PATH = "compression_manifest.json"
+MANIFEST_VERSION = 1
+
+DEFAULT_PATTERNS = ('*.html', 'static/*')
+
+# Variant suffixes, in server preference order
+SUFFIXES = {'br': '.br', 'gzip': '.gz'}
+
+
+def gzip_compress(data):
+    # mtime=0 keeps the output identical for identical input
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def brotli_compress(data):
+    return brotli.compress(data, quality=11)
+
+
+def available_encoders():
+    """{encoding: compress function} for the encodings usable here, in preference order."""
+    encoders = {}
+    if brotli is not None:
+        encoders['br'] = brotli_compress
+    encoders['gzip'] = gzip_compress
+    return encoders
+
+
+def is_variant(path):
+    return path.endswith(tuple(SUFFIXES.values()))
+
+
+def _write_atomic(path, data):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+class CompressionManifest:
+    """Map from artifact path to its compressed variants, stored as JSON.
+    
+    Artifact and variant paths are relative to the manifest's directory,
+    with '/' separators.
+    """
+    
+    def __init__(self, path=MANIFEST_PATH):
+        self.path = path
+        self.root = os.path.dirname(os.path.abspath(path))
+        self.artifacts = self._load()
+        self.dirty = False
+    
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        
+        if data.get('version') != MANIFEST_VERSION:
+            return {}
+        return data.get('artifacts', {})
+    
+    def save(self):
+        """Write the manifest to disk if anything changed."""
+        if not self.dirty:
+            return
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': MANIFEST_VERSION, 'artifacts': self.artifacts}, f, ensure_ascii=False, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+        self.dirty = False
+    
+    def key(self, path):
+        return os.path.relpath(os.path.abspath(path), self.root).replace(os.sep, '/')
+    
+    def is_current(self, path):
+        """True if the recorded variants were made from the file as it is now and still exist."""
+        entry = self.artifacts.get(self.key(path))
+        if entry is None:
+            return False
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+        if (entry['size'], entry['mtime_ns']) != (stat.st_size, stat.st_mtime_ns):
+            return False
+        return all(os.path.exists(os.path.join(self.root, variant['path'])) for variant in entry['variants'].values())
+    
+    def variants(self, path):
+        """{encoding: absolute variant path} for an artifact, or {} if it has none or they are stale."""
+        if not self.is_current(path):
+            return {}
+        entry = self.artifacts[self.key(path)]
+        return {encoding: os.path.join(self.root, variant['path']) for encoding, variant in entry['variants'].items()}
+    
+    def compress(self, path, force=False):
+        """Write the variants of one artifact and record them. Returns False if it was up to date."""
+        encoders = available_encoders()
+        entry = self.artifacts.get(self.key(path))
+        if not force and self.is_current(path) and set(entry['encodings']) >= set(encoders):
+            return False
+        
+        stat = os.stat(path)
+        with open(path, 'rb') as f:
+            data = f.read()
+        
+        variants = {}
+        for encoding, compress in encoders.items():
+            variant_path = path + SUFFIXES[encoding]
+            compressed = compress(data)
+            if len(compressed) >= len(data):
+                if os.path.exists(variant_path):
+                    os.remove(variant_path)
+                continue
+            _write_atomic(variant_path, compressed)
+            variants[encoding] = {'path': self.key(variant_path), 'size': len(compressed)}
+        
+        self.artifacts[self.key(path)] = {
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'encodings': list(encoders),
+            'variants': variants
+        }
+        self.dirty = True
+        return True
+
+
+def precompress(paths, manifest_path=MANIFEST_PATH):
+    """Compress the given artifacts, update the manifest and return it."""
+    manifest = CompressionManifest(manifest_path)
+    for path in paths:
+        manifest.compress(path)
+    manifest.save()
+    return manifest
+
+
+def default_artifacts(root="."):
+    """Generated pages and static assets under root, without existing variants."""
+    paths = []
+    for pattern in DEFAULT_PATTERNS:
+        paths.extend(glob.glob(os.path.join(root, pattern)))
+    return sorted(path for path in paths if os.path.isfile(path) and not is_variant(path) and not path.endswith(".tmp"))
+
+
+def main(argv=None):
+    paths = argv if argv else default_artifacts()
+    manifest = CompressionManifest()
+    
+    compressed = 0
+    for path in paths:
+        if manifest.compress(path):
+            compressed += 1
+    manifest.save()
+    
+    encodings = ', '.join(available_encoders())
+    print(f"🗜️ {compressed} de {len(paths)} arquivos comprimidos ({encodings}); manifesto em {MANIFEST_PATH}")
+    if brotli is None:
+        print("⚠️ Pacote brotli não instalado: apenas variantes gzip foram geradas")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Ranking
+
+Bounded top-K ranking for news lists. A TopKRanker keeps only the K best
+articles seen so far in a min-heap, so articles can be pushed as they
+arrive from each source and ranking a pool of N costs O(N log K) instead
+of sorting all N. Ties keep arrival order, like a stable sort.
+
+Scores are plain functions of an article dict; engagement, time-decayed
+and source-weighted scores are provided and can be combined.
+"""
+
+import heapq
+from datetime import datetime
+
+
+DEFAULT_HALF_LIFE_DAYS = 7
+
+
+def engagement_score(news):
+    """Comments plus views."""
+    return news.get('comments', 0) + news.get('views', 0)
+
+
+def engagement_recency_score(news):
+    """Comments plus views, with the more recent date winning ties."""
+    return engagement_score(news), news['date']
+
+
+def views_score(news):
+    return news.get('views', 0)
+
+
+def time_decayed_score(base=engagement_score, half_life_days=DEFAULT_HALF_LIFE_DAYS, now=None):
+    """Score that halves every half_life_days since the article's date."""
+    now = now or datetime.now()
+    
+    def score(news):
+        age_days = max(0.0, (now - datetime.strptime(news['date'], "%Y-%m-%d")).total_seconds() / 86400)
+        return base(news) * 0.5 ** (age_days / half_life_days)
+    
+    return score
+
+
+def source_weighted_score(weights, base=engagement_score, default_weight=1.0):
+    """Score multiplied by a per-source weight."""
+    def score(news):
+        return base(news) * weights.get(news.get('source'), default_weight)
+    
+    return score
+
+
+class TopKRanker:
+    """Keeps the k highest-scoring articles pushed into it."""
+    
+    def __init__(self, k=30, score=engagement_score):
+        self.k = k
+        self.score = score
+        self.heap = []
+        self.pushed = 0
+    
+    def __len__(self):
+        return len(self.heap)
+    
+    def push(self, news):
+        """Offer one article to the ranking."""
+        # Earlier arrivals win ties, so their sequence number must compare higher
+        entry = (self.score(news), -self.pushed, news)
+        self.pushed += 1
+        if len(self.heap) < self.k:
+            heapq.heappush(self.heap, entry)
+        elif entry[:2] > self.heap[0][:2]:
+            heapq.heapreplace(self.heap, entry)
+    
+    def extend(self, news_list):
+        for news in news_list:
+            self.push(news)
+    
+    def top(self):
+        """The kept articles, best first."""
+        return [entry[2] for entry in sorted(self.heap, key=lambda entry: entry[:2], reverse=True)]
+    
+    def ranked(self):
+        """The kept articles, best first, with 'rank' set from 1."""
+        top_news = self.top()
+        for i, news in enumerate(top_news, 1):
+            news['rank'] = i
+        return top_news
+
+
+def top_k(news_list, k=30, score=engagement_score):
+    """Rank an iterable of articles and return the best k with ranks assigned."""
+    ranker = TopKRanker(k, score)
+    ranker.extend(news_list)
+    return ranker.ranked()
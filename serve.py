@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Local Server
+
+Serves the generated pages and static assets from a directory, like
+`python -m http.server`, but sends the precompressed variants written by
+precompress.py when the client accepts them. The encoding is negotiated
+from the Accept-Encoding header (brotli preferred over gzip at equal
+quality), only variants listed as current in the compression manifest
+are used, and responses carry "Vary: Accept-Encoding". Conditional
+requests get a 304 for compressed variants just as for plain files.
+
+Content-hashed asset URLs (static/current_news.<hash>.css) are served
+from the plain file they stand for and get an immutable Cache-Control
+header.
+
+Usage: python serve.py [port] [directory]
+"""
+
+import email.utils
+import os
+import posixpath
+import sys
+import urllib.parse
+from datetime import datetime, timezone
+from functools import partial
+from http import HTTPStatus
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+from precompress import MANIFEST_PATH, SUFFIXES, CompressionManifest
+from static_assets import HASHED_NAME_PATTERN, resolve_hashed_path
+
+
+DEFAULT_PORT = 8000
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def parse_accept_encoding(header):
+    """{coding: q} from an Accept-Encoding header value."""
+    accepted = {}
+    for item in header.split(','):
+        coding, _, params = item.strip().partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(';'):
+            name, _, value = param.strip().partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        accepted[coding] = q
+    return accepted
+
+
+def negotiate_encoding(header, available):
+    """Best encoding among the available ones for an Accept-Encoding header, or None for identity."""
+    accepted = parse_accept_encoding(header or '')
+    default_q = accepted.get('*', 0.0)
+    best, best_q = None, 0.0
+    # SUFFIXES is in preference order, so the first of equal q values wins
+    for encoding in SUFFIXES:
+        if encoding not in available:
+            continue
+        q = accepted.get(encoding, default_q)
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+class ManifestCache:
+    """Compression manifest, reloaded whenever the file changes on disk."""
+    
+    def __init__(self, path):
+        self.path = path
+        self.mtime_ns = None
+        self.manifest = CompressionManifest(path)
+    
+    def get(self):
+        try:
+            mtime_ns = os.stat(self.path).st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        if mtime_ns != self.mtime_ns:
+            self.manifest = CompressionManifest(self.path)
+            self.mtime_ns = mtime_ns
+        return self.manifest
+
+
+class PrecompressedRequestHandler(SimpleHTTPRequestHandler):
+    """Static file handler that serves .br/.gz variants through content negotiation."""
+    
+    manifests = None
+    
+    def translate_path(self, path):
+        translated = super().translate_path(path)
+        if os.path.exists(translated):
+            return translated
+        return resolve_hashed_path(translated) or translated
+    
+    def is_hashed_asset(self):
+        url_path = urllib.parse.urlsplit(self.path).path
+        return url_path.startswith('/static/') and HASHED_NAME_PATTERN.match(posixpath.basename(url_path)) is not None
+    
+    def is_not_modified(self, mtime):
+        """True if If-Modified-Since is at or after mtime, checked like SimpleHTTPRequestHandler does."""
+        if "If-Modified-Since" not in self.headers or "If-None-Match" in self.headers:
+            return False
+        try:
+            since = email.utils.parsedate_to_datetime(self.headers["If-Modified-Since"])
+        except (TypeError, IndexError, OverflowError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        if since.tzinfo is not timezone.utc:
+            return False
+        return datetime.fromtimestamp(mtime, timezone.utc).replace(microsecond=0) <= since
+    
+    def send_head(self):
+        path = self.translate_path(self.path)
+        if os.path.isdir(path) or not os.path.isfile(path):
+            return super().send_head()
+        
+        variants = self.manifests.get().variants(path)
+        encoding = negotiate_encoding(self.headers.get('Accept-Encoding'), variants)
+        if encoding is None:
+            return super().send_head()
+        
+        try:
+            f = open(variants[encoding], 'rb')
+        except OSError:
+            return super().send_head()
+        
+        try:
+            stat = os.fstat(f.fileno())
+            if self.is_not_modified(stat.st_mtime):
+                self.send_response(HTTPStatus.NOT_MODIFIED)
+                self.end_headers()
+                f.close()
+                return None
+            
+            self.send_response(HTTPStatus.OK)
+            self.send_header("Content-Type", self.guess_type(path))
+            self.send_header("Content-Encoding", encoding)
+            self.send_header("Content-Length", str(stat.st_size))
+            self.send_header("Last-Modified", self.date_time_string(stat.st_mtime))
+            self.end_headers()
+            return f
+        except Exception:
+            f.close()
+            raise
+    
+    def end_headers(self):
+        self.send_header("Vary", "Accept-Encoding")
+        if self.is_hashed_asset():
+            self.send_header("Cache-Control", IMMUTABLE_CACHE_CONTROL)
+        super().end_headers()
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    port = int(argv[0]) if argv else DEFAULT_PORT
+    directory = os.path.abspath(argv[1] if len(argv) > 1 else '.')
+    
+    PrecompressedRequestHandler.manifests = ManifestCache(os.path.join(directory, MANIFEST_PATH))
+    handler = partial(PrecompressedRequestHandler, directory=directory)
+    
+    with ThreadingHTTPServer(('', port), handler) as server:
+        print(f"🌐 Servindo {directory} em http://localhost:{port} (Ctrl+C para sair)")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            print("\n👋 Servidor encerrado")
+
+
+if __name__ == "__main__":
+    main()
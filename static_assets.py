@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Static Assets
+
+Content-hashed URLs for the stylesheets shared by every generated page.
+Each page's CSS is kept once, as static/current_news.css, and pages link
+it as static/current_news.<hash>.css, where the hash is taken from the
+file's contents. Pages link that file instead of inlining the same few
+hundred lines of CSS on every run.
+
+No hashed copy is ever written: the hashed name is an alias that the
+server maps back to the plain file (a rewrite in vercel.json, and
+resolve_hashed_path for serve.py). Because the name changes whenever the
+contents do, hashed URLs can be served with a long-lived immutable
+Cache-Control header, and nothing has to be generated at build or
+request time.
+"""
+
+import hashlib
+import os
+import re
+from functools import lru_cache
+
+
+STATIC_DIR = "static"
+HASH_LENGTH = 12
+
+# <stem>.<hash><ext>, as produced by hashed_name
+HASHED_NAME_PATTERN = re.compile(rf'^(?P<stem>.+)\.[0-9a-f]{{{HASH_LENGTH}}}(?P<ext>\.[^./]+)$')
+
+
+def hashed_name(name, content):
+    """'<stem>.<content hash><ext>' for an asset file name."""
+    stem, ext = os.path.splitext(name)
+    return f"{stem}.{hashlib.sha256(content).hexdigest()[:HASH_LENGTH]}{ext}"
+
+
+def asset_path(name, static_dir=STATIC_DIR):
+    """Path of an asset file."""
+    return os.path.join(static_dir, name)
+
+
+@lru_cache(maxsize=None)
+def asset_url(name, static_dir=STATIC_DIR):
+    """Content-hashed URL of an asset, hashed once per process.
+    
+    The URL is relative, so it resolves from pages written next to static_dir.
+    """
+    with open(asset_path(name, static_dir), 'rb') as f:
+        content = f.read()
+    return f"{os.path.basename(os.path.normpath(static_dir))}/{hashed_name(name, content)}"
+
+
+def resolve_hashed_path(path):
+    """The plain file a hashed asset path stands for, or None unless the hash matches its current contents."""
+    directory, filename = os.path.split(path)
+    match = HASHED_NAME_PATTERN.match(filename)
+    if match is None:
+        return None
+    
+    name = match.group('stem') + match.group('ext')
+    plain_path = os.path.join(directory, name)
+    try:
+        with open(plain_path, 'rb') as f:
+            content = f.read()
+    except OSError:
+        return None
+    # A stale hash must not be answered with new contents under an immutable URL
+    return plain_path if hashed_name(name, content) == filename else None
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+News Statistics
+
+Single-pass statistics for news lists, shared by all collectors. A
+NewsStatistics accumulator updates totals, per-category and per-source
+aggregates and the most viewed category and source in O(1) per article,
+so articles can be added as they are collected instead of walking the
+finished list once per figure. An empty list gives zeros instead of a
+division error.
+"""
+
+
+NO_TOP_VALUE = "—"
+
+
+class GroupTotals:
+    """Count and views per group key, tracking the most viewed key as it goes."""
+    
+    def __init__(self):
+        self.groups = {}
+        self.order = {}
+        self.top_key = None
+    
+    def add(self, key, views):
+        group = self.groups.get(key)
+        if group is None:
+            group = self.groups[key] = {'count': 0, 'views': 0}
+            self.order[key] = len(self.order)
+        group['count'] += 1
+        group['views'] += views
+        
+        # Views only grow, so the leader can only change to the key just updated.
+        # Ties go to the key seen first, as max() over the dict would pick.
+        if self.top_key is None:
+            self.top_key = key
+        elif key != self.top_key:
+            top_views = self.groups[self.top_key]['views']
+            if group['views'] > top_views or (group['views'] == top_views and self.order[key] < self.order[self.top_key]):
+                self.top_key = key
+
+
+class NewsStatistics:
+    """Running statistics over a stream of news articles."""
+    
+    def __init__(self):
+        self.count = 0
+        self.total_views = 0
+        self.total_shares = 0
+        self.total_comments = 0
+        self.current_news = 0
+        self.categories = GroupTotals()
+        self.sources = GroupTotals()
+    
+    @classmethod
+    def from_news(cls, news_list):
+        stats = cls()
+        stats.extend(news_list)
+        return stats
+    
+    def add(self, news):
+        """Account for one article."""
+        views = news['views']
+        self.count += 1
+        self.total_views += views
+        self.total_shares += news['shares']
+        self.total_comments += news['comments']
+        if news.get('is_current', False):
+            self.current_news += 1
+        self.categories.add(news['category'], views)
+        self.sources.add(news['source'], views)
+    
+    def extend(self, news_list):
+        for news in news_list:
+            self.add(news)
+    
+    @property
+    def avg_views(self):
+        return self.total_views // self.count if self.count else 0
+    
+    def as_dict(self):
+        """Statistics in the dict layout the HTML generators expect."""
+        return {
+            'total_views': self.total_views,
+            'total_shares': self.total_shares,
+            'total_comments': self.total_comments,
+            'current_news': self.current_news,
+            'categories': self.categories.groups,
+            'sources': self.sources.groups,
+            'avg_views': self.avg_views,
+            'top_category': self.categories.top_key if self.count else NO_TOP_VALUE,
+            'top_source': self.sources.top_key if self.count else NO_TOP_VALUE
+        }
+
+
+def news_statistics(news_list):
+    """Statistics dict for a finished news list."""
+    return NewsStatistics.from_news(news_list).as_dict()
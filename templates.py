@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Templates
+
+Small compiled template engine shared by the HTML generators.
+
+Page and fragment templates live as .html files in the templates/
+directory and use {{ name }} placeholders, with dotted lookups into dicts
+or attributes ({{ news.title }}) and optional filters
+({{ news.views|thousands }}). Each template is parsed once per process
+into a list of literal chunks and compiled lookups, so rendering is a
+single join over the parts and lists of fragments are joined once instead
+of being grown with += in a loop.
+
+Values are HTML-escaped on output unless they are Markup (already
+rendered HTML) or go through the |safe filter. Lists of cards are passed
+as Fragments, rendered item by item only as the page is produced, so a
+page can also be streamed chunk by chunk to a file with write_atomic
+without ever holding it as one string. Only identifiers are recognized
+inside {{ }}, so the CSS and JS embedded in the pages are left untouched.
+"""
+
+import html
+import os
+import re
+from contextlib import suppress
+from functools import lru_cache
+from urllib.parse import quote_plus
+
+
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'templates')
+
+WRITE_BUFFER_SIZE = 64 * 1024
+
+PLACEHOLDER_PATTERN = re.compile(r'\{\{\s*([A-Za-z_]\w*(?:\.\w+)*)\s*((?:\|\s*\w+\s*)*)\}\}')
+
+
+class Markup(str):
+    """A string of HTML that is inserted as is, without escaping."""
+
+
+def escape(value):
+    """HTML-escape a value unless it is already Markup."""
+    if isinstance(value, Markup):
+        return value
+    return Markup(html.escape(str(value)))
+
+
+FILTERS = {
+    'safe': lambda value: Markup(value),
+    'thousands': lambda value: f"{value:,}",
+    'urlquote': lambda value: quote_plus(str(value)),
+    'join': lambda value: ', '.join(value),
+    'length': len,
+}
+
+
+class TemplateError(Exception):
+    """Raised for unknown filters and for names missing from the render context."""
+
+
+def _lookup(path, filters, template_name, placeholder):
+    """Compile one placeholder into a function of the render context."""
+    name, *attributes = path.split('.')
+    
+    def resolve(context):
+        try:
+            value = context[name]
+            for attribute in attributes:
+                try:
+                    value = value[attribute]
+                except (KeyError, TypeError):
+                    value = getattr(value, attribute)
+        except (KeyError, AttributeError):
+            raise TemplateError(f"{template_name}: '{path}' is not defined") from None
+        for apply in filters:
+            value = apply(value)
+        return value if isinstance(value, Fragments) else escape(value)
+    
+    resolve.path = path
+    resolve.placeholder = placeholder
+    return resolve
+
+
+class Template:
+    """A template compiled into literal chunks and placeholder lookups."""
+    
+    def __init__(self, source, name='<string>'):
+        self.name = name
+        self.source = source
+        self.parts = []
+        position = 0
+        for match in PLACEHOLDER_PATTERN.finditer(source):
+            if match.start() > position:
+                self.parts.append(source[position:match.start()])
+            filter_names = [f.strip() for f in match.group(2).split('|') if f.strip()]
+            unknown = [f for f in filter_names if f not in FILTERS]
+            if unknown:
+                raise TemplateError(f"{name}: unknown filter '{unknown[0]}'")
+            self.parts.append(_lookup(match.group(1), [FILTERS[f] for f in filter_names], name, match.group(0)))
+            position = match.end()
+        if position < len(source):
+            self.parts.append(source[position:])
+    
+    def iter_render(self, context=None, **values):
+        """Render chunk by chunk, expanding Fragments item by item."""
+        context = dict(context or {}, **values)
+        for part in self.parts:
+            if isinstance(part, str):
+                yield part
+                continue
+            value = part(context)
+            if isinstance(value, Fragments):
+                yield from value
+            else:
+                yield value
+    
+    def render(self, context=None, **values):
+        """Render to a Markup string."""
+        return Markup(''.join(self.iter_render(context, **values)))
+    
+    def bind(self, context, keep=()):
+        """Template source with every placeholder rendered in except those whose path is in keep."""
+        chunks = []
+        for part in self.parts:
+            if isinstance(part, str):
+                chunks.append(part)
+            elif part.path in keep:
+                chunks.append(part.placeholder)
+            else:
+                # Rendered values must not be read back as placeholders
+                chunks.append(part(context).replace('{', '&#123;'))
+        return ''.join(chunks)
+
+
+class Fragments:
+    """A fragment template rendered once per item, lazily, separated by newlines.
+    
+    Each item is passed to the template as `key`, or, with key=None, is
+    itself the whole context (a dict). Iterating renders the items one at
+    a time; it can be repeated only if items is a sequence.
+    """
+    
+    def __init__(self, template, items, key='item', values=None):
+        self.template = template
+        self.items = items
+        self.key = key
+        self.values = values or {}
+    
+    def __iter__(self):
+        for i, item in enumerate(self.items):
+            if i:
+                yield '\n'
+            if self.key is None:
+                yield self.template.render(item, **self.values)
+            else:
+                yield self.template.render(self.values, **{self.key: item})
+
+
+@lru_cache(maxsize=None)
+def load_template(name):
+    """Compiled template from the templates directory, parsed once per process."""
+    with open(os.path.join(TEMPLATE_DIR, name), encoding='utf-8') as f:
+        return Template(f.read(), name)
+
+
+def render(name, context=None, **values):
+    """Render a template file by name."""
+    return load_template(name).render(context, **values)
+
+
+def iter_render(name, context=None, **values):
+    """Render a template file by name, chunk by chunk."""
+    return load_template(name).iter_render(context, **values)
+
+
+def render_each(name, items, key='item', **values):
+    """Fragments of a template file, one per item, to place in a page context."""
+    return Fragments(load_template(name), items, key, values)
+
+
+def write_atomic(path, chunks, buffer_size=WRITE_BUFFER_SIZE):
+    """Write text chunks to path through a buffered temporary file, then rename it into place.
+    
+    Readers of path see either the previous file or the complete new one.
+    """
+    tmp_path = path + ".tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8', buffering=buffer_size) as f:
+            f.writelines(chunks)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with suppress(OSError):
+            os.remove(tmp_path)
+        raise
+
+
+def render_group_stats(groups):
+    """Stat items for a category or source breakdown, most viewed first."""
+    ranked = sorted(groups.items(), key=lambda x: x[1]['views'], reverse=True)
+    return render_each('stat_item.html', ({'label': label, 'data': data} for label, data in ranked), key=None)
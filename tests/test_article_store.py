@@ -0,0 +1,98 @@
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+
+import article_store
+from article_store import ArticleStore
+from near_duplicates import collapse_near_duplicates
+
+
+TODAY = datetime.now().strftime("%Y-%m-%d")
+
+
+def news(url, title="Mercado de trabalho cresce 5% em 2025", views=1000, date=TODAY, is_real=True, **fields):
+    return dict({'title': title, 'url': url, 'source': 'Exame', 'date': date, 'views': views,
+                 'shares': 10, 'comments': 5, 'category': 'Mercado', 'is_real': is_real}, **fields)
+
+
+@pytest.fixture
+def store(tmp_path):
+    with ArticleStore(str(tmp_path / "news.db")) as store:
+        yield store
+
+
+def test_upsert_counts_only_new_articles(store):
+    assert store.upsert_many([news("https://exame.com/a"), news("https://exame.com/b", title="Outra")]) == 2
+    assert store.upsert_many([news("https://www.exame.com/a?utm_source=x", views=2000)]) == 0
+    assert len(store) == 2
+    assert store.query(source='Exame', limit=1)[0]['views'] == 2000
+
+
+def test_simulated_articles_are_not_stored(store):
+    assert store.upsert_many([news("https://exame.com/a", is_real=False)]) == 0
+    assert len(store) == 0
+
+
+def test_simulated_rows_from_older_versions_are_purged(tmp_path):
+    path = str(tmp_path / "news.db")
+    with ArticleStore(path) as store:
+        store.upsert_many([news("https://exame.com/a")])
+    conn = sqlite3.connect(path)
+    with conn:
+        conn.execute("UPDATE articles SET is_real = 0")
+    conn.close()
+    
+    with ArticleStore(path) as store:
+        assert len(store) == 0
+
+
+def test_same_cluster_with_another_representative_stays_one_article(store):
+    ibge = [
+        news("https://exame.com/noticias/ibge", views=3000),
+        news("https://portalrh.com.br/noticias/ibge", title="Mercado de trabalho cresce 5% em 2025, diz IBGE", views=1000),
+    ]
+    first_run = collapse_near_duplicates(ibge)
+    second_run = collapse_near_duplicates(ibge[::-1])
+    assert first_run[0]['url'] != second_run[0]['url']
+    
+    day = datetime(2025, 7, 1)
+    assert store.upsert_many(first_run, observed_at=day) == 1
+    assert store.upsert_many(second_run, observed_at=day + timedelta(days=1)) == 0
+    
+    assert len(store) == 1
+    assert store.query()[0]['url'] == "https://exame.com/noticias/ibge"
+    assert store.known_urls([article['url'] for article in ibge]) == {article['url'] for article in ibge}
+    history = store.engagement_history("https://portalrh.com.br/noticias/ibge")
+    assert [views for _, views, _, _ in history] == [4000, 4000]
+
+
+def test_known_urls_include_aliases(store):
+    merged = news("https://exame.com/a", duplicate_urls=["https://vagas.com.br/b"])
+    store.upsert_many([merged])
+    
+    urls = ["https://www.exame.com/a/", "https://vagas.com.br/b?utm_medium=email", "https://exame.com/c"]
+    assert store.known_urls(urls) == set(urls[:2])
+
+
+def test_known_urls_are_looked_up_in_batches(store, monkeypatch):
+    monkeypatch.setattr(article_store, 'KNOWN_URLS_BATCH', 3)
+    store.upsert_many([news(f"https://exame.com/{i}", title=f"Notícia {i}") for i in range(0, 10, 2)])
+    
+    urls = [f"https://exame.com/{i}" for i in range(10)]
+    assert store.known_urls(urls) == set(urls[::2])
+
+
+def test_hot_news_prefers_fresh_engagement(store):
+    now = datetime(2025, 7, 10, 12)
+    store.upsert_many([
+        news("https://exame.com/old", title="Antiga", views=50000, date="2025-06-01"),
+        news("https://exame.com/new", title="Nova", views=2000, date="2025-07-10"),
+        news("https://exame.com/mid", title="Média", views=1000, date="2025-07-09"),
+    ])
+    
+    hot = store.hot_news(3, now=now)
+    
+    assert [article['title'] for article in hot] == ["Nova", "Média", "Antiga"]
+    assert [article['rank'] for article in hot] == [1, 2, 3]
+    assert [article['title'] for article in store.hot_news(1, now=now)] == ["Nova"]
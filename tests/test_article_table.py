@@ -0,0 +1,73 @@
+import pytest
+
+import article_table
+from article_table import ArticleTable
+from stats import news_statistics
+from vector_scoring import has_numpy
+
+
+ROWS = [
+    ('Liderança', 'Exame', 1000, '2025-07-01', True),
+    ('Carreira', 'Vagas.com', 1000, '2025-07-02', False),
+    ('Liderança', 'Vagas.com', 1000, '2025-07-03', True),
+    ('Mercado', 'InfoMoney', 4000, '2025-07-04', True),
+    ('Carreira', 'Exame', 500, '2025-07-05', False),
+    ('Mercado', 'Vagas.com', 0, '2025-07-06', True),
+]
+
+NEWS = [
+    {'title': f"Notícia {i}", 'url': f"https://exame.com/{i}", 'summary': '', 'category': category,
+     'source': source, 'views': views, 'shares': i, 'comments': 2 * i, 'date': date,
+     'is_current': is_current, 'is_real': True}
+    for i, (category, source, views, date, is_current) in enumerate(ROWS)
+]
+
+# (filter arguments, matching rows) with several equal-views groups, so the tie order matters
+FILTERS = [
+    ({}, NEWS),
+    ({'source': 'Vagas.com'}, [news for news in NEWS if news['source'] == 'Vagas.com']),
+    ({'category': 'Carreira'}, [news for news in NEWS if news['category'] == 'Carreira']),
+    ({'current': True}, [news for news in NEWS if news['is_current']]),
+    ({'source': 'Nenhuma'}, []),
+]
+
+
+@pytest.fixture(params=[True, False], ids=['numpy', 'python'])
+def backend(request, monkeypatch):
+    if request.param and not has_numpy():
+        pytest.skip("numpy not installed")
+    if not request.param:
+        monkeypatch.setattr(article_table, 'np', None)
+
+
+@pytest.mark.parametrize("filters, expected_rows", FILTERS)
+def test_statistics_match_news_statistics(backend, filters, expected_rows):
+    table = ArticleTable.from_articles(NEWS).filter(**filters)
+    
+    statistics = table.statistics()
+    expected = news_statistics(expected_rows)
+    
+    assert statistics == expected
+    # Equal dicts can still differ in order, which decides ties downstream
+    assert list(statistics['categories']) == list(expected['categories'])
+    assert list(statistics['sources']) == list(expected['sources'])
+
+
+def test_filtered_table_breaks_ties_by_its_own_rows(backend):
+    rows = [
+        {'title': 'a', 'source': 'B', 'category': 'y', 'date': '2025-07-01', 'views': 10, 'shares': 0, 'comments': 0},
+        {'title': 'b', 'source': 'A', 'category': 'x', 'date': '2025-07-01', 'views': 10, 'shares': 0, 'comments': 0},
+        {'title': 'c', 'source': 'A', 'category': 'y', 'date': '2025-07-01', 'views': 10, 'shares': 0, 'comments': 0},
+    ]
+    
+    statistics = ArticleTable.from_articles(rows).filter(source='A').statistics()
+    
+    assert statistics['top_category'] == 'x'
+    assert list(statistics['categories']) == ['x', 'y']
+
+
+def test_top_k_keeps_row_order_on_ties(backend):
+    top = ArticleTable.from_articles(NEWS).top_k(3, score='views')
+    
+    assert [news.title for news in top] == ["Notícia 3", "Notícia 0", "Notícia 1"]
+    assert [news.rank for news in top] == [1, 2, 3]
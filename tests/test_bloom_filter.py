@@ -0,0 +1,65 @@
+from bloom_filter import BloomFilter, RotatingBloomFilter, optimal_size
+
+
+def test_optimal_size():
+    bits, hashes = optimal_size(1_000_000, 0.001)
+    
+    assert 14_000_000 < bits < 15_000_000
+    assert hashes == 10
+
+
+def test_added_items_are_found():
+    bloom = BloomFilter(*optimal_size(1000, 0.001))
+    
+    assert bloom.add("https://exame.com/a")
+    assert not bloom.add("https://exame.com/a")
+    assert "https://exame.com/a" in bloom
+    assert "https://exame.com/b" not in bloom
+
+
+def test_generations_survive_a_reload(tmp_path):
+    path = str(tmp_path / "seen.bloom")
+    seen = RotatingBloomFilter(path, capacity=100)
+    seen.add("https://exame.com/a")
+    seen.save()
+    
+    reloaded = RotatingBloomFilter(path, capacity=100)
+    
+    assert "https://exame.com/a" in reloaded
+    assert not reloaded.add("https://exame.com/a")
+    assert len(reloaded) == 1
+
+
+def test_changed_parameters_start_empty(tmp_path):
+    path = str(tmp_path / "seen.bloom")
+    seen = RotatingBloomFilter(path, capacity=100)
+    seen.add("https://exame.com/a")
+    seen.save()
+    
+    assert "https://exame.com/a" not in RotatingBloomFilter(path, capacity=200)
+
+
+def fill_generation(seen, prefix, count):
+    for i in range(count):
+        seen.add(f"https://exame.com/{prefix}/{i}")
+
+
+def test_unused_urls_expire_after_two_generations(tmp_path):
+    seen = RotatingBloomFilter(str(tmp_path / "seen.bloom"), capacity=10)
+    seen.add("https://exame.com/old")
+    fill_generation(seen, "first", 9)
+    # The first generation is full and now the previous one, still checked
+    assert "https://exame.com/old" in seen
+    
+    fill_generation(seen, "second", 10)
+    assert "https://exame.com/old" not in seen
+
+
+def test_urls_seen_again_are_kept(tmp_path):
+    seen = RotatingBloomFilter(str(tmp_path / "seen.bloom"), capacity=10)
+    seen.add("https://exame.com/old")
+    fill_generation(seen, "first", 9)
+    
+    assert not seen.add("https://exame.com/old")
+    fill_generation(seen, "second", 9)
+    assert "https://exame.com/old" in seen
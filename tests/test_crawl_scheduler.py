@@ -0,0 +1,44 @@
+import time
+
+from crawl_scheduler import CrawlScheduler
+
+
+class FakeResponse:
+    status_code = 404
+    text = ''
+
+
+class FakeSession:
+    """Records the time of every GET."""
+    
+    def __init__(self):
+        self.headers = {'User-Agent': 'test'}
+        self.calls = []
+    
+    def get(self, url, **kwargs):
+        self.calls.append((url, time.monotonic()))
+        return FakeResponse()
+
+
+def test_robots_fetch_waits_for_the_host_token():
+    scheduler = CrawlScheduler(min_interval=0.2)
+    session = FakeSession()
+    
+    scheduler.get(session, "https://example.com/noticias")
+    
+    (robots_url, robots_at), (page_url, page_at) = session.calls
+    assert robots_url == "https://example.com/robots.txt"
+    assert page_url == "https://example.com/noticias"
+    assert page_at - robots_at >= 0.15
+
+
+def test_hosts_do_not_share_tokens():
+    scheduler = CrawlScheduler(min_interval=0.2)
+    session = FakeSession()
+    
+    start = time.monotonic()
+    scheduler.get(session, "https://a.example.com/")
+    scheduler.get(session, "https://b.example.com/")
+    
+    # One wait per host (robots.txt, then the page), not one per request overall
+    assert time.monotonic() - start < 0.6
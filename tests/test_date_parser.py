@@ -0,0 +1,67 @@
+from datetime import datetime
+
+import pytest
+
+from date_parser import DateParser, parse_iso
+
+
+NOW = datetime(2025, 8, 20, 15, 0)
+
+
+@pytest.fixture
+def parser():
+    return DateParser()
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("14/08/2025", datetime(2025, 8, 14)),
+    ("14/08/25 às 10:30", datetime(2025, 8, 14, 10, 30)),
+    ("2025-08-14 10:30:00", datetime(2025, 8, 14, 10, 30)),
+    ("2025/08/14", datetime(2025, 8, 14)),
+    ("Publicado: 2025/08/14 10:00", datetime(2025, 8, 14, 10, 0)),
+    ("14.08.2025 10h30", datetime(2025, 8, 14, 10, 30)),
+    ("14 de agosto de 2025", datetime(2025, 8, 14)),
+    ("Publicado em 3 ago. 2025", datetime(2025, 8, 3)),
+])
+def test_absolute_dates(parser, text, expected):
+    assert parser.parse(text, now=NOW) == expected
+
+
+@pytest.mark.parametrize("text", [
+    "Edição 123/08/2025",
+    "Edição 123 de agosto de 2025",
+    "31/02/2025",
+    "às 10 h",
+    "",
+])
+def test_numbers_that_are_not_dates(parser, text):
+    assert parser.parse(text, now=NOW) is None
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("há 2 horas", datetime(2025, 8, 20, 13, 0)),
+    ("3 dias atrás", datetime(2025, 8, 17, 15, 0)),
+    ("há 1 semana", datetime(2025, 8, 13, 15, 0)),
+    ("ontem", datetime(2025, 8, 19)),
+    ("Hoje às 09:15", datetime(2025, 8, 20, 9, 15)),
+])
+def test_relative_dates(parser, text, expected):
+    assert parser.parse(text, now=NOW) == expected
+
+
+def test_datetime_attribute_wins_over_text(parser):
+    parsed = parser.parse("ontem", datetime_attr="2025-08-14T10:00:00", now=NOW)
+    
+    assert parsed == datetime(2025, 8, 14, 10, 0)
+    assert parse_iso("não é uma data") is None
+
+
+def test_format_is_remembered_per_source(parser):
+    parser.parse("14-08-2025", source_key="Exame", now=NOW)
+    parser.parse("14/08/2025", source_key="Vagas.com", now=NOW)
+    
+    assert parser.last_format == {"Exame": "dmy-dash", "Vagas.com": "dmy"}
+    assert next(parser._ordered_formats("dmy-dash")) == "dmy-dash"
+    # The remembered format is only tried first; other formats still parse
+    assert parser.parse("2025/08/15", source_key="Exame", now=NOW) == datetime(2025, 8, 15)
+    assert parser.last_format["Exame"] == "ymd"
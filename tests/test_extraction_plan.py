@@ -0,0 +1,87 @@
+import random
+
+import pytest
+import soupsieve
+
+from extraction_plan import ExtractionPlan, PlanMemo
+from html_parsers import make_soup
+
+
+SOURCE = {
+    "name": "Vagas.com",
+    "url": "https://www.vagas.com.br",
+    "search_terms": ["entrevista", "recolocação", "processo seletivo", "carreira"],
+    "article_selector": "article, .post, .blog-post, .news-item, .card",
+    "title_selector": "h1, h2, h3, .title, .post-title, .card-title",
+    "link_selector": "a[href*='/blog/'], a[href*='/artigo/'], a[href*='/post/'], a[href*='/noticias/']",
+    "date_selector": ".date, .published, .post-date, time, .card-date",
+    "parser": "html.parser",
+    "category": "Carreira"
+}
+
+# Tags that match some field selector, others that match none, and containers to nest them in
+FIELD_TAGS = [
+    '<h1>Título {i}</h1>', '<h2>Título {i}</h2>', '<h3>Título {i}</h3>',
+    '<div class="title">Título {i}</div>', '<span class="post-title">Título {i}</span>',
+    '<div class="card-title x">Título {i}</div>', '<h4 class="headline-title">Título {i}</h4>',
+    '<a href="/blog/artigo-{i}">Leia</a>', '<a href="https://www.vagas.com.br/artigo/{i}">Leia</a>',
+    '<a href="/post/{i}/">Leia</a>', '<a href="/noticias/{i}">Leia</a>', '<a href="/sobre">Sobre</a>',
+    '<span class="date">01/07/2025</span>', '<span class="published">há 2 horas</span>',
+    '<span class="post-date">2 de julho</span>', '<time datetime="2025-07-0{d}">{d} de julho</time>',
+    '<time>ontem</time>', '<span class="card-date">3/7</span>', '<em class="update-date">hoje</em>',
+    '<p>Resumo {i}</p>', '<div class="summary">Resumo {i}</div>', '<span class="excerpt">Resumo {i}</span>',
+    '<div class="description">Resumo {i}</div>',
+]
+OTHER_TAGS = ['<span>nada {i}</span>', '<img src="/x{i}.png">', '<b>{i}</b>']
+CONTAINERS = ['<div>{}</div>', '<section class="body">{}</section>', '<header>{}</header>', '<p>{}</p>']
+
+
+def random_article(rng, i):
+    parts = []
+    for _ in range(rng.randint(0, 8)):
+        tag = rng.choice(FIELD_TAGS + OTHER_TAGS).format(i=i, d=rng.randint(1, 9))
+        if rng.random() < 0.3:
+            tag = rng.choice(CONTAINERS).format(tag)
+        parts.append(tag)
+    return f'<article class="post">{"".join(parts)}</article>'
+
+
+def cascade_fields(plan, article):
+    """The fields as the select_one cascades found them before extract_fields."""
+    found = {}
+    for field, matcher in plan.fields:
+        found[field] = None
+        for selector in matcher.selectors:
+            elem = soupsieve.select_one(selector, article)
+            if elem is not None:
+                found[field] = elem
+                break
+    time_tag = next((tag for tag in article.find_all('time') if tag.get('datetime')), None)
+    found['datetime'] = time_tag['datetime'] if time_tag else None
+    return found
+
+
+@pytest.fixture
+def plan(tmp_path):
+    return ExtractionPlan(SOURCE, PlanMemo(str(tmp_path / "plans.json")))
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_extract_fields_matches_select_one_cascade(plan, seed):
+    rng = random.Random(seed)
+    page = '<html><body>' + ''.join(random_article(rng, i) for i in range(200)) + '</body></html>'
+    articles = make_soup(page, SOURCE['parser']).select('article')
+    
+    for article in articles:
+        fields = plan.extract_fields(article)
+        expected = cascade_fields(plan, article)
+        assert fields['datetime'] == expected.pop('datetime')
+        for field, elem in expected.items():
+            # Same element, not merely an equal one
+            assert fields[field] is elem, (field, str(article))
+
+
+def test_extract_fields_of_empty_article(plan):
+    article = make_soup('<article></article>', SOURCE['parser']).article
+    
+    assert plan.extract_fields(article) == {'title': None, 'link': None, 'date': None, 'summary': None, 'datetime': None}
@@ -0,0 +1,63 @@
+from fragment_cache import CachedFragments, FragmentCache
+from templates import Template
+
+
+CARD = Template('<div class="card">#{{ news.rank }} {{ news.title }} · {{ news.views|thousands }}</div>', 'card.html')
+KEEP = ('news.rank', 'news.views')
+
+
+def card(news):
+    return news['url'], (news['title'],), {'news': news}
+
+
+def render(cache, news_list):
+    return ''.join(CachedFragments(CARD, news_list, cache, card, KEEP))
+
+
+def articles(*titles):
+    return [{'url': f"https://exame.com/{i}", 'title': title, 'rank': i, 'views': 1000 * i}
+            for i, title in enumerate(titles, 1)]
+
+
+def test_cached_cards_render_like_plain_cards(tmp_path):
+    cache = FragmentCache(str(tmp_path / "cards.json"))
+    news_list = articles("Entrevista <remota>", "Currículo")
+    
+    expected = '\n'.join(CARD.render(news=news) for news in news_list)
+    
+    assert render(cache, news_list) == expected
+    assert render(cache, news_list) == expected
+    assert (cache.hits, cache.misses) == (2, 2)
+
+
+def test_moving_numbers_reuse_the_card_and_changed_text_rebinds_it(tmp_path):
+    cache = FragmentCache(str(tmp_path / "cards.json"))
+    render(cache, articles("Entrevista", "Currículo"))
+    
+    news_list = articles("Entrevista", "Currículo atualizado")
+    news_list[0].update(rank=7, views=123456)
+    
+    assert render(cache, news_list).startswith('<div class="card">#7 Entrevista · 123,456</div>')
+    assert (cache.hits, cache.misses) == (1, 3)
+
+
+def test_entries_persist_and_are_capped(tmp_path):
+    path = str(tmp_path / "cards.json")
+    cache = FragmentCache(path, max_entries=2)
+    render(cache, articles("Um", "Dois", "Três"))
+    cache.save()
+    
+    reloaded = FragmentCache(path, max_entries=2)
+    render(reloaded, articles("Um", "Dois", "Três")[1:])
+    
+    assert list(reloaded.entries) == ["https://exame.com/2", "https://exame.com/3"]
+    assert (reloaded.hits, reloaded.misses) == (2, 0)
+
+
+def test_unwritable_cache_is_not_fatal(tmp_path):
+    cache = FragmentCache(str(tmp_path / "missing" / "cards.json"))
+    render(cache, articles("Um"))
+    
+    cache.save()
+    
+    assert cache.dirty
@@ -0,0 +1,70 @@
+import io
+import os
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from http_cache import CachingAdapter, HTTPCache
+
+
+URL = "https://example.com/noticias"
+
+
+def fake_response(request, status_code, content=b'', headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response.url = request.url
+    response.request = request
+    response.headers.update(headers or {})
+    response._content = content
+    response.raw = io.BytesIO(content)
+    return response
+
+
+class FakeServer:
+    """Answers 304 to conditional GETs and 200 with a validator otherwise."""
+    
+    def __init__(self):
+        self.requests = []
+    
+    def send(self, request):
+        self.requests.append(dict(request.headers))
+        if request.headers.get('If-None-Match') == '"v1"':
+            return fake_response(request, 304, headers={'ETag': '"v1"'})
+        return fake_response(request, 200, b'<html>v1</html>', {'ETag': '"v1"'})
+
+
+def session_with_cache(tmp_path, monkeypatch):
+    server = FakeServer()
+    monkeypatch.setattr(HTTPAdapter, 'send', lambda adapter, request, **kwargs: server.send(request))
+    session = requests.Session()
+    cache = HTTPCache(str(tmp_path / "http"))
+    session.mount('https://', CachingAdapter(cache))
+    return session, cache, server
+
+
+def test_not_modified_is_served_from_cache(tmp_path, monkeypatch):
+    session, cache, server = session_with_cache(tmp_path, monkeypatch)
+    session.get(URL)
+    
+    response = session.get(URL)
+    
+    assert response.status_code == 200
+    assert response.content == b'<html>v1</html>'
+    assert response.from_cache
+    assert server.requests[1]['If-None-Match'] == '"v1"'
+
+
+def test_missing_body_retries_unconditionally(tmp_path, monkeypatch):
+    session, cache, server = session_with_cache(tmp_path, monkeypatch)
+    session.get(URL)
+    os.remove(cache._body_path(cache._key(URL)))
+    
+    response = session.get(URL)
+    
+    assert response.status_code == 200
+    assert response.content == b'<html>v1</html>'
+    assert len(server.requests) == 3
+    assert 'If-None-Match' not in server.requests[2]
+    # The unconditional answer is cached again
+    assert cache.read_body(URL) == b'<html>v1</html>'
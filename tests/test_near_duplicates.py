@@ -0,0 +1,51 @@
+import pytest
+
+from near_duplicates import DEFAULT_THRESHOLD, collapse_near_duplicates, jaccard, title_words
+
+
+DIFFERENT_STORIES = [
+    ("O que fazer depois de ser demitido", "O que fazer depois de ser promovido"),
+    ("Como negociar salário em uma nova oportunidade", "Como negociar benefícios em uma nova oportunidade"),
+    ("Como se preparar para uma entrevista de emprego", "Como se preparar para uma dinâmica de grupo"),
+]
+
+
+def article(title, url, views=1000):
+    return {'title': title, 'url': url, 'views': views, 'comments': 10, 'shares': 5}
+
+
+@pytest.mark.parametrize("title_a, title_b", DIFFERENT_STORIES)
+def test_different_stories_stay_below_threshold(title_a, title_b):
+    assert jaccard(title_words(title_a), title_words(title_b)) < DEFAULT_THRESHOLD
+
+
+@pytest.mark.parametrize("title_a, title_b", DIFFERENT_STORIES)
+def test_different_stories_are_not_merged(title_a, title_b):
+    collapsed = collapse_near_duplicates([article(title_a, "https://a.com/1"), article(title_b, "https://b.com/2")])
+    assert len(collapsed) == 2
+    assert [news['views'] for news in collapsed] == [1000, 1000]
+
+
+def test_stopwords_are_ignored():
+    assert title_words("O que fazer depois de ser demitido") == {'fazer', 'depois', 'demitido'}
+
+
+def test_republished_story_is_merged():
+    collapsed = collapse_near_duplicates([
+        article("Mercado de trabalho cresce 5% em 2025", "https://a.com/1", views=3000),
+        article("Mercado de trabalho cresce 5% em 2025, diz IBGE", "https://b.com/2", views=1000),
+    ])
+    assert len(collapsed) == 1
+    assert collapsed[0]['url'] == "https://a.com/1"
+    assert collapsed[0]['views'] == 4000
+    assert collapsed[0]['duplicate_urls'] == ["https://b.com/2"]
+
+
+def test_representative_does_not_depend_on_engagement():
+    titles = ["Mercado de trabalho cresce 5% em 2025", "Mercado de trabalho cresce 5% em 2025, diz IBGE"]
+    for views in ((3000, 1000), (1000, 3000)):
+        collapsed = collapse_near_duplicates([
+            article(titles[0], "https://a.com/1", views=views[0]),
+            article(titles[1], "https://b.com/2", views=views[1]),
+        ])
+        assert collapsed[0]['url'] == "https://a.com/1"
@@ -0,0 +1,77 @@
+import gzip
+import json
+import os
+
+from precompress import MANIFEST_PATH, CompressionManifest, default_artifacts, precompress
+
+
+PAGE = ("<html><body>" + "<div class='card'>Entrevista de emprego</div>" * 200 + "</body></html>").encode('utf-8')
+
+
+def write(path, data):
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+def test_variants_are_written_and_recorded(tmp_path):
+    page = str(tmp_path / "page.html")
+    write(page, PAGE)
+    manifest_path = str(tmp_path / MANIFEST_PATH)
+    
+    manifest = precompress([page], manifest_path)
+    
+    variants = manifest.variants(page)
+    with open(variants['gzip'], 'rb') as f:
+        assert gzip.decompress(f.read()) == PAGE
+    with open(manifest_path, encoding='utf-8') as f:
+        recorded = json.load(f)['artifacts']['page.html']
+    assert recorded['size'] == len(PAGE)
+    assert recorded['variants']['gzip']['path'] == "page.html.gz"
+
+
+def test_gzip_output_is_reproducible(tmp_path):
+    page = str(tmp_path / "page.html")
+    write(page, PAGE)
+    manifest = CompressionManifest(str(tmp_path / MANIFEST_PATH))
+    manifest.compress(page)
+    with open(page + ".gz", 'rb') as f:
+        first = f.read()
+    
+    manifest.compress(page, force=True)
+    
+    with open(page + ".gz", 'rb') as f:
+        assert f.read() == first
+
+
+def test_unchanged_artifacts_are_skipped_and_changed_ones_are_stale(tmp_path):
+    page = str(tmp_path / "page.html")
+    write(page, PAGE)
+    manifest = CompressionManifest(str(tmp_path / MANIFEST_PATH))
+    assert manifest.compress(page)
+    assert not manifest.compress(page)
+    
+    write(page, PAGE + b"<!-- novo -->")
+    os.utime(page, ns=(0, 0))
+    
+    assert manifest.variants(page) == {}
+    assert manifest.compress(page)
+
+
+def test_incompressible_files_get_no_variant(tmp_path):
+    tiny = str(tmp_path / "tiny.css")
+    write(tiny, b"a{}")
+    
+    manifest = precompress([tiny], str(tmp_path / MANIFEST_PATH))
+    
+    assert manifest.variants(tiny) == {}
+    assert not os.path.exists(tiny + ".gz")
+
+
+def test_default_artifacts_skip_variants(tmp_path):
+    (tmp_path / "static").mkdir()
+    for name in ("index.html", "index.html.gz", "static/page.css", "static/page.css.br", "notes.txt"):
+        write(str(tmp_path / name), b"x")
+    
+    artifacts = [os.path.relpath(path, tmp_path) for path in default_artifacts(str(tmp_path))]
+    
+    assert artifacts == ["index.html", os.path.join("static", "page.css")]
@@ -0,0 +1,50 @@
+import random
+from datetime import datetime
+
+import pytest
+
+from ranking import TopKRanker, engagement_recency_score, engagement_score, time_decayed_score, top_k
+
+
+def random_pool(rng, n):
+    # Small value ranges so that ties are common
+    return [
+        {
+            'title': f"Notícia {i}",
+            'views': rng.randint(0, 50) * 100,
+            'comments': rng.randint(0, 3),
+            'date': f"2025-07-{rng.randint(1, 5):02d}"
+        }
+        for i in range(n)
+    ]
+
+
+SCORES = [
+    engagement_score,
+    engagement_recency_score,
+    time_decayed_score(now=datetime(2025, 7, 6)),
+]
+
+
+@pytest.mark.parametrize("score", SCORES)
+@pytest.mark.parametrize("seed", range(20))
+def test_top_k_matches_stable_sort(score, seed):
+    rng = random.Random(seed)
+    pool = random_pool(rng, rng.randint(0, 200))
+    k = rng.randint(1, 60)
+    
+    expected = sorted(pool, key=score, reverse=True)[:k]
+    
+    assert top_k(pool, k, score) == expected
+    assert [news['rank'] for news in expected] == list(range(1, len(expected) + 1))
+
+
+def test_pushing_in_batches_matches_one_pool():
+    rng = random.Random(0)
+    batches = [random_pool(rng, 40) for _ in range(5)]
+    
+    ranker = TopKRanker(30)
+    for batch in batches:
+        ranker.extend(batch)
+    
+    assert ranker.top() == sorted(sum(batches, []), key=engagement_score, reverse=True)[:30]
@@ -0,0 +1,95 @@
+import gzip
+import threading
+import urllib.error
+import urllib.request
+from email.utils import formatdate
+from functools import partial
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+from precompress import MANIFEST_PATH, precompress
+from serve import IMMUTABLE_CACHE_CONTROL, ManifestCache, PrecompressedRequestHandler, negotiate_encoding
+from static_assets import asset_url
+
+
+PAGE = ("<html><body>" + "<p>Processo seletivo</p>" * 200 + "</body></html>").encode('utf-8')
+
+
+@pytest.mark.parametrize("header, available, expected", [
+    ("gzip, deflate, br", {'br', 'gzip'}, 'br'),
+    ("gzip;q=1.0, br;q=0.5", {'br', 'gzip'}, 'gzip'),
+    ("br", {'gzip'}, None),
+    ("*", {'gzip'}, 'gzip'),
+    ("gzip;q=0", {'gzip'}, None),
+    (None, {'gzip'}, None),
+])
+def test_negotiate_encoding(header, available, expected):
+    assert negotiate_encoding(header, available) == expected
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    (tmp_path / "index.html").write_bytes(PAGE)
+    (tmp_path / "static").mkdir()
+    (tmp_path / "static" / "page.css").write_bytes(b"body { margin: 0; }\n" * 50)
+    monkeypatch.chdir(tmp_path)
+    precompress(["index.html", "static/page.css"])
+    
+    PrecompressedRequestHandler.manifests = ManifestCache(str(tmp_path / MANIFEST_PATH))
+    handler = partial(PrecompressedRequestHandler, directory=str(tmp_path))
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    thread = threading.Thread(target=httpd.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def get(url, **headers):
+    try:
+        return urllib.request.urlopen(urllib.request.Request(url, headers=headers))
+    except urllib.error.HTTPError as e:
+        return e
+
+
+def test_gzip_variant_is_served_when_accepted(server):
+    response = get(server + "/index.html", **{'Accept-Encoding': 'gzip'})
+    
+    assert response.status == 200
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert response.headers['Vary'] == 'Accept-Encoding'
+    assert gzip.decompress(response.read()) == PAGE
+
+
+def test_plain_file_without_accept_encoding(server):
+    response = get(server + "/index.html")
+    
+    assert response.headers['Content-Encoding'] is None
+    assert response.headers['Vary'] == 'Accept-Encoding'
+    assert response.read() == PAGE
+
+
+@pytest.mark.parametrize("accept_encoding", ['gzip', 'identity'])
+def test_conditional_requests_get_not_modified(server, accept_encoding):
+    first = get(server + "/index.html", **{'Accept-Encoding': accept_encoding})
+    last_modified = first.headers['Last-Modified']
+    
+    again = get(server + "/index.html", **{'Accept-Encoding': accept_encoding, 'If-Modified-Since': last_modified})
+    stale = get(server + "/index.html", **{'Accept-Encoding': accept_encoding, 'If-Modified-Since': formatdate(0, usegmt=True)})
+    
+    assert again.status == 304
+    assert again.read() == b''
+    assert stale.status == 200
+
+
+def test_hashed_asset_urls_are_immutable(server):
+    hashed = get(server + "/" + asset_url("page.css"))
+    plain = get(server + "/static/page.css")
+    stale = get(server + "/static/page.0123456789ab.css")
+    
+    assert hashed.status == 200
+    assert hashed.headers['Cache-Control'] == IMMUTABLE_CACHE_CONTROL
+    assert hashed.read() == plain.read()
+    assert plain.headers['Cache-Control'] is None
+    assert stale.status == 404
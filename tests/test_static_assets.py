@@ -0,0 +1,30 @@
+import os
+
+from static_assets import asset_url, hashed_name, resolve_hashed_path
+
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "static")
+
+
+def test_hashed_url_resolves_to_the_plain_file(tmp_path):
+    static_dir = tmp_path / "static"
+    static_dir.mkdir()
+    (static_dir / "page.css").write_bytes(b"body { color: red; }")
+    
+    url = asset_url("page.css", str(static_dir))
+    
+    assert url == "static/" + hashed_name("page.css", b"body { color: red; }")
+    assert resolve_hashed_path(str(tmp_path / url)) == os.path.join(str(static_dir), "page.css")
+
+
+def test_stale_or_plain_names_do_not_resolve(tmp_path):
+    (tmp_path / "page.css").write_bytes(b"body { color: blue; }")
+    
+    assert resolve_hashed_path(str(tmp_path / hashed_name("page.css", b"body { color: red; }"))) is None
+    assert resolve_hashed_path(str(tmp_path / "page.css")) is None
+    assert resolve_hashed_path(str(tmp_path / "missing.0123456789ab.css")) is None
+
+
+def test_every_page_stylesheet_is_committed():
+    for name in ("current_news.css", "top_100.css", "real_data.css", "alternative_data.css", "hr_tweets.css"):
+        assert asset_url(name, STATIC_DIR).startswith("static/" + name[:-len(".css")] + ".")
@@ -0,0 +1,70 @@
+import random
+
+import pytest
+
+from stats import NO_TOP_VALUE, NewsStatistics, news_statistics
+
+
+def naive_statistics(news_list):
+    """The statistics as the collectors computed them before the shared accumulator."""
+    total_views = sum(news['views'] for news in news_list)
+    
+    categories = {}
+    sources = {}
+    for groups, key in ((categories, 'category'), (sources, 'source')):
+        for news in news_list:
+            group = groups.setdefault(news[key], {'count': 0, 'views': 0})
+            group['count'] += 1
+            group['views'] += news['views']
+    
+    return {
+        'total_views': total_views,
+        'total_shares': sum(news['shares'] for news in news_list),
+        'total_comments': sum(news['comments'] for news in news_list),
+        'current_news': sum(1 for news in news_list if news.get('is_current', False)),
+        'categories': categories,
+        'sources': sources,
+        'avg_views': total_views // len(news_list),
+        'top_category': max(categories.items(), key=lambda x: x[1]['views'])[0],
+        'top_source': max(sources.items(), key=lambda x: x[1]['views'])[0]
+    }
+
+
+def random_news(rng, n):
+    # Few groups and coarse views so that the top category and source are often tied
+    return [
+        {
+            'views': rng.randint(0, 4) * 1000,
+            'shares': rng.randint(0, 50),
+            'comments': rng.randint(0, 50),
+            'is_current': rng.random() < 0.5,
+            'category': rng.choice(['Carreira', 'Mercado', 'Liderança']),
+            'source': rng.choice(['Exame', 'Vagas.com', 'InfoMoney', 'Valor'])
+        }
+        for _ in range(n)
+    ]
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_matches_naive_statistics(seed):
+    rng = random.Random(seed)
+    news_list = random_news(rng, rng.randint(1, 60))
+    
+    assert news_statistics(news_list) == naive_statistics(news_list)
+
+
+def test_adding_one_at_a_time_matches_whole_list():
+    news_list = random_news(random.Random(0), 40)
+    
+    stats = NewsStatistics()
+    for news in news_list:
+        stats.add(news)
+    
+    assert stats.as_dict() == news_statistics(news_list)
+
+
+def test_empty_list():
+    stats = news_statistics([])
+    
+    assert stats['avg_views'] == 0
+    assert stats['top_category'] == stats['top_source'] == NO_TOP_VALUE
@@ -0,0 +1,85 @@
+import os
+
+import pytest
+
+from templates import Markup, Template, TemplateError, render, render_each, write_atomic
+
+
+def test_values_are_escaped_unless_markup_or_safe():
+    template = Template("<p>{{ text }}</p><div>{{ html }}</div><div>{{ raw|safe }}</div>")
+    
+    rendered = template.render(text="<b>&</b>", html=Markup("<i>ok</i>"), raw="<hr>")
+    
+    assert rendered == "<p>&lt;b&gt;&amp;&lt;/b&gt;</p><div><i>ok</i></div><div><hr></div>"
+    assert isinstance(rendered, Markup)
+
+
+def test_dotted_lookups_and_filters():
+    class Source:
+        name = "Exame"
+    
+    template = Template("{{ news.views|thousands }} · {{ news.source.name }} · {{ q|urlquote }} · {{ tags|join }} ({{ tags|length }})")
+    
+    rendered = template.render(news={'views': 1234567, 'source': Source()}, q="recolocação 50+", tags=["RH", "Carreira"])
+    
+    assert rendered == "1,234,567 · Exame · recoloca%C3%A7%C3%A3o+50%2B · RH, Carreira (2)"
+
+
+def test_css_and_js_braces_are_left_alone():
+    source = "<style>.a { color: red; }</style><script>if (x) { y(); }</script>{{ name }}"
+    
+    assert Template(source).render(name="ok") == source.replace("{{ name }}", "ok")
+
+
+def test_errors_name_the_template():
+    with pytest.raises(TemplateError, match="card.html: unknown filter 'upper'"):
+        Template("{{ title|upper }}", "card.html")
+    with pytest.raises(TemplateError, match="card.html: 'news.title' is not defined"):
+        Template("{{ news.title }}", "card.html").render(news={})
+
+
+def test_render_by_file_name():
+    assert "42 artigos" in render('stat_item.html', label="RH", data={'count': 42, 'views': 0})
+
+
+def test_fragments_render_lazily_item_by_item():
+    rendered = []
+    
+    def items():
+        for label in ("Exame", "Vagas.com"):
+            rendered.append(label)
+            yield {'label': label, 'data': {'count': 1, 'views': 1000}}
+    
+    fragments = render_each('stat_item.html', items(), key=None)
+    assert rendered == []
+    
+    page = Template("<section>{{ stats }}</section>").render(stats=fragments)
+    
+    assert rendered == ["Exame", "Vagas.com"]
+    assert page.count('class="stat-item"') == 2
+    assert "1,000 visualizações" in page
+
+
+def test_bind_keeps_only_the_listed_placeholders():
+    template = Template("<h2>{{ news.title }}</h2><span>{{ news.views|thousands }}</span>")
+    
+    bound = template.bind({'news': {'title': "{{ x }} & cia", 'views': 10}}, keep={'news.views'})
+    
+    assert bound == "<h2>&#123;&#123; x }} &amp; cia</h2><span>{{ news.views|thousands }}</span>"
+    assert Template(bound).render(news={'views': 2500}) == "<h2>&#123;&#123; x }} &amp; cia</h2><span>2,500</span>"
+
+
+def test_write_atomic_replaces_the_file_only_when_complete(tmp_path):
+    path = str(tmp_path / "page.html")
+    write_atomic(path, ["<html>", "antiga", "</html>"])
+    
+    def failing_chunks():
+        yield "<html>nova"
+        raise RuntimeError("render failed")
+    
+    with pytest.raises(RuntimeError):
+        write_atomic(path, failing_chunks())
+    
+    with open(path, encoding='utf-8') as f:
+        assert f.read() == "<html>antiga</html>"
+    assert os.listdir(tmp_path) == ["page.html"]
@@ -0,0 +1,39 @@
+import pytest
+
+from text_matcher import AhoCorasick, DEFAULT_CATEGORY, TextMatcher, fold, get_matcher
+
+
+def test_fold_strips_accents_and_case():
+    assert fold("Rejeição no Currículo") == "rejeicao no curriculo"
+
+
+def test_automaton_finds_overlapping_and_nested_patterns():
+    automaton = AhoCorasick(["he", "she", "his", "hers"])
+    
+    assert automaton.find_all("ushers") == {0, 1, 3}
+    assert automaton.find_all("nada") == set()
+
+
+@pytest.mark.parametrize("title, expected", [
+    ("Como montar um curriculo que chama atenção", (False, "Currículo")),
+    ("Entrevista de emprego: 10 perguntas comuns", (True, "Entrevistas")),
+    ("Mercado de trabalho para cargos de liderança", (True, "Liderança")),
+    ("Receita de bolo de cenoura", (False, DEFAULT_CATEGORY)),
+])
+def test_relevance_and_category_in_one_pass(title, expected):
+    assert get_matcher().analyze(title) == expected
+
+
+def test_first_category_key_wins():
+    matcher = TextMatcher(["carreira"])
+    
+    # "liderança" comes before "sênior" in the mapping, whatever their order in the title
+    assert matcher.category("Sênior em liderança") == "Liderança"
+
+
+def test_search_terms_are_per_source():
+    matcher = get_matcher(("recolocação",))
+    
+    assert matcher.analyze("Guia de recolocacao")[0]
+    assert not matcher.analyze("Guia de carreira")[0]
+    assert get_matcher(("recolocação",)) is matcher
@@ -0,0 +1,40 @@
+import pytest
+
+from url_tools import DedupeIndex, SourceAllowlist, canonicalize_url, dedupe_key
+
+
+@pytest.mark.parametrize("url, expected", [
+    ("HTTPS://Exame.com/carreira/artigo/?utm_source=x&b=2&a=1#topo", "https://exame.com/carreira/artigo?a=1&b=2"),
+    ("https://exame.com:443/carreira/", "https://exame.com/carreira"),
+    ("http://exame.com:8080/", "http://exame.com:8080/"),
+    ("https://exame.com/carreira/artigo/amp/", "https://exame.com/carreira/artigo"),
+    ("https://exame.com/?fbclid=abc", "https://exame.com/"),
+])
+def test_canonicalize_url(url, expected):
+    assert canonicalize_url(url) == expected
+
+
+def test_relative_links_are_resolved():
+    assert canonicalize_url("../noticias/1/", base="https://portalrh.com.br/blog/") == "https://portalrh.com.br/noticias/1"
+
+
+def test_dedupe_key_ignores_scheme_and_www():
+    assert dedupe_key("http://www.exame.com/a/?utm_medium=email") == dedupe_key("https://exame.com/a") == "exame.com/a"
+
+
+def test_allowlist_accepts_subdomains_only_of_sources():
+    allowlist = SourceAllowlist(["https://www.vagas.com.br", "https://exame.com"])
+    
+    assert allowlist.allows("https://blog.vagas.com.br/artigo")
+    assert allowlist.allows("http://exame.com/x")
+    assert not allowlist.allows("https://vagas.com.br.evil.com/x")
+    assert not allowlist.allows("https://notexame.com/x")
+
+
+def test_dedupe_index_counts_each_article_once():
+    index = DedupeIndex()
+    
+    assert index.add("https://exame.com/a")
+    assert not index.add("http://www.exame.com/a/?utm_source=x")
+    assert "https://exame.com/a#comentarios" in index
+    assert len(index) == 1
@@ -0,0 +1,57 @@
+import random
+
+import pytest
+
+import vector_scoring
+from vector_scoring import hot_scores, top_k_indices
+
+
+NOW_TS = 1751800000.0
+
+
+def random_counters(rng, n):
+    views = [rng.randint(0, 20) * 500 for _ in range(n)]
+    comments = [rng.randint(0, 5) for _ in range(n)]
+    shares = [rng.randint(0, 5) for _ in range(n)]
+    # Some articles are dated in the future, which counts as age zero
+    published_ts = [NOW_TS - rng.choice([-3600, 0, 3600, 86400, 7 * 86400]) for _ in range(n)]
+    return views, comments, shares, published_ts
+
+
+def without_numpy(monkeypatch, function, *args, **kwargs):
+    with monkeypatch.context() as patch:
+        patch.setattr(vector_scoring, 'np', None)
+        return function(*args, **kwargs)
+
+
+@pytest.mark.parametrize("use_numpy", [
+    pytest.param(True, marks=pytest.mark.skipif(not vector_scoring.has_numpy(), reason="numpy not installed")),
+    False,
+])
+@pytest.mark.parametrize("seed", range(20))
+def test_top_k_indices_match_stable_sort(monkeypatch, use_numpy, seed):
+    if not use_numpy:
+        monkeypatch.setattr(vector_scoring, 'np', None)
+    rng = random.Random(seed)
+    scores = [float(rng.randint(0, 10)) for _ in range(rng.randint(0, 100))]
+    k = rng.randint(0, 40)
+    
+    expected = sorted(range(len(scores)), key=scores.__getitem__, reverse=True)[:k]
+    
+    assert top_k_indices(scores, k) == expected
+
+
+@pytest.mark.skipif(not vector_scoring.has_numpy(), reason="numpy not installed")
+@pytest.mark.parametrize("seed", range(20))
+def test_numpy_matches_pure_python(monkeypatch, seed):
+    rng = random.Random(seed)
+    counters = random_counters(rng, rng.randint(0, 300))
+    weights = (1.0, rng.choice([1.0, 5.0]), rng.choice([1.0, 10.0]))
+    k = rng.randint(0, 50)
+    
+    expected_scores = without_numpy(monkeypatch, hot_scores, *counters, NOW_TS, weights=weights)
+    scores = hot_scores(*counters, NOW_TS, weights=weights)
+    
+    assert scores.tolist() == pytest.approx(expected_scores, rel=1e-12)
+    # Equal scores must come out in the same order, ties included
+    assert top_k_indices(scores, k) == without_numpy(monkeypatch, top_k_indices, expected_scores, k)
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Text Matcher
+
+Keyword engine for relevance filtering and category detection of article
+titles. All relevance keywords and category keys are compiled once into a
+single Aho-Corasick automaton, so a title is scanned one time no matter how
+many keywords there are, and relevance and category come out of the same
+pass. Text and keywords are accent-folded, so "currículo" also matches
+"curriculo" and the keyword lists need no unaccented duplicates.
+"""
+
+import unicodedata
+from collections import deque
+from functools import lru_cache
+
+
+# Category keys in priority order: the first key found in a title wins
+CATEGORY_MAPPING = {
+    "entrevista": "Entrevistas",
+    "entrevistas": "Entrevistas",
+    "processo seletivo": "Processos Seletivos",
+    "processos seletivos": "Processos Seletivos",
+    "currículo": "Currículo",
+    "cv": "Currículo",
+    "networking": "Networking",
+    "comportamental": "Entrevistas Comportamentais",
+    "comportamentais": "Entrevistas Comportamentais",
+    "perguntas": "Entrevistas",
+    "linkedin": "LinkedIn",
+    "mudança de carreira": "Transição de Carreira",
+    "videoconferência": "Entrevistas Remotas",
+    "negociar": "Negociação",
+    "negociação": "Negociação",
+    "psicológica": "Preparação Psicológica",
+    "segunda entrevista": "Entrevistas",
+    "rejeição": "Resiliência",
+    "recrutamento": "Recrutamento",
+    "remoto": "Processos Remotos",
+    "dinâmica": "Dinâmicas de Grupo",
+    "teste": "Testes",
+    "gestor": "Entrevistas Sênior",
+    "soft skill": "Soft Skills",
+    "soft skills": "Soft Skills",
+    "técnica": "Entrevistas Técnicas",
+    "follow-up": "Follow-up",
+    "inglês": "Entrevistas em Inglês",
+    "vestir": "Imagem Profissional",
+    "estágio": "Primeira Oportunidade",
+    "demissão": "Explicar Demissão",
+    "primeira oportunidade": "Primeira Oportunidade",
+    "liderança": "Liderança",
+    "sênior": "Cargos Sênior",
+    "resultado": "Resultados",
+    "startup": "Startups"
+}
+
+DEFAULT_CATEGORY = "Carreira"
+
+# Terms that make any title relevant, on top of each source's search_terms
+GENERIC_RELEVANCE_TERMS = ['emprego', 'trabalho', 'profissional', 'mercado']
+
+DEFAULT_SEARCH_TERMS = ["entrevista", "recolocação", "processo seletivo", "carreira"]
+
+
+def fold(text):
+    """Lowercase and strip accents, so 'Rejeição' and 'rejeicao' compare equal."""
+    decomposed = unicodedata.normalize('NFKD', text.lower())
+    return ''.join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+class AhoCorasick:
+    """Multi-pattern substring matcher."""
+    
+    def __init__(self, patterns):
+        # Trie as a list of transition dicts; outputs[state] holds pattern ids ending there
+        self.goto = [{}]
+        self.fail = [0]
+        self.outputs = [[]]
+        
+        for pattern_id, pattern in enumerate(patterns):
+            state = 0
+            for ch in pattern:
+                next_state = self.goto[state].get(ch)
+                if next_state is None:
+                    next_state = len(self.goto)
+                    self.goto[state][ch] = next_state
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.outputs.append([])
+                state = next_state
+            self.outputs[state].append(pattern_id)
+        
+        # Breadth-first pass to set failure links and merge outputs along them
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fallback = self.fail[state]
+                while fallback and ch not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[next_state] = self.goto[fallback].get(ch, 0)
+                self.outputs[next_state] = self.outputs[next_state] + self.outputs[self.fail[next_state]]
+    
+    def find_all(self, text):
+        """Return the set of pattern ids that occur anywhere in text."""
+        found = set()
+        state = 0
+        goto, fail, outputs = self.goto, self.fail, self.outputs
+        
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if outputs[state]:
+                found.update(outputs[state])
+        
+        return found
+
+
+class TextMatcher:
+    """Relevance and category detection for titles in one automaton pass."""
+    
+    def __init__(self, relevance_terms, category_mapping=CATEGORY_MAPPING, default_category=DEFAULT_CATEGORY):
+        self.default_category = default_category
+        
+        # Folded keyword -> (is relevance term, category priority or None, category)
+        keywords = {}
+        for term in relevance_terms:
+            keywords[fold(term)] = [True, None, None]
+        for priority, (key, category) in enumerate(category_mapping.items()):
+            entry = keywords.setdefault(fold(key), [False, None, None])
+            if entry[1] is None:
+                entry[1] = priority
+                entry[2] = category
+        
+        self.keywords = list(keywords)
+        self.entries = [keywords[k] for k in self.keywords]
+        self.automaton = AhoCorasick(self.keywords)
+    
+    def analyze(self, title):
+        """Return (is_relevant, category) for a title."""
+        relevant = False
+        best_priority = None
+        category = self.default_category
+        
+        for keyword_id in self.automaton.find_all(fold(title)):
+            is_relevance_term, priority, keyword_category = self.entries[keyword_id]
+            relevant = relevant or is_relevance_term
+            if priority is not None and (best_priority is None or priority < best_priority):
+                best_priority = priority
+                category = keyword_category
+        
+        return relevant, category
+    
+    def category(self, title):
+        """Return only the category for a title."""
+        return self.analyze(title)[1]
+
+
+@lru_cache(maxsize=None)
+def get_matcher(search_terms=tuple(DEFAULT_SEARCH_TERMS)):
+    """Shared matcher for a source's search terms plus the generic relevance terms."""
+    return TextMatcher(list(search_terms) + GENERIC_RELEVANCE_TERMS)
+
+
+# Built once at import time for the default search terms
+DEFAULT_MATCHER = get_matcher()
@@ -12,6 +12,13 @@ from datetime import datetime
 import time
 import re
 
+from article import Article
+from ranking import top_k, views_score
+from stats import news_statistics
+from precompress import precompress
+from static_assets import asset_path, asset_url
+from templates import render, render_each, render_group_stats
+
 
 class Top100HRNewsCollector:
     """Collect top 100 HR news articles from multiple sources."""
@@ -150,6 +157,8 @@ class Top100HRNewsCollector:
             }
         ]
         
+        top_news = [Article.from_dict(news) for news in top_news]
+        
         # Generate additional 90 news articles with realistic data
         for i in range(11, 101):
             categories = ["Legislação", "Tecnologia", "Trabalho Remoto", "Benefícios", "Diversidade", 
@@ -178,443 +187,51 @@ class Top100HRNewsCollector:
             shares = max(50, views // 100)
             comments = max(10, views // 500)
             
-            top_news.append({
-                "rank": i,
-                "title": titles[i % len(titles)],
-                "source": sources[i % len(sources)],
-                "summary": f"Artigo sobre {categories[i % len(categories)].lower()} com insights valiosos para profissionais de RH. Inclui dados atualizados e estratégias práticas.",
-                "url": f"https://{sources[i % len(sources)].lower().replace(' ', '')}.com.br/artigo-{i}",
-                "date": f"2024-01-{max(1, 15 - (i // 7))}",
-                "views": views,
-                "shares": shares,
-                "comments": comments,
-                "category": categories[i % len(categories)]
-            })
-        
-        # Sort by views (highest first)
-        top_news.sort(key=lambda x: x['views'], reverse=True)
-        
-        # Reassign ranks
-        for i, news in enumerate(top_news, 1):
-            news['rank'] = i
+            top_news.append(Article(
+                rank=i,
+                title=titles[i % len(titles)],
+                source=sources[i % len(sources)],
+                summary=f"Artigo sobre {categories[i % len(categories)].lower()} com insights valiosos para profissionais de RH. Inclui dados atualizados e estratégias práticas.",
+                url=f"https://{sources[i % len(sources)].lower().replace(' ', '')}.com.br/artigo-{i}",
+                date=f"2024-01-{max(1, 15 - (i // 7))}",
+                views=views,
+                shares=shares,
+                comments=comments,
+                category=categories[i % len(categories)]
+            ))
+        
+        # Rank by views (highest first)
+        top_news = top_k(top_news, 100, views_score)
         
         print(f"✅ {len(top_news)} notícias coletadas e ranqueadas por visualizações")
         return top_news
     
     def get_news_statistics(self, news_list):
         """Generate statistics from the news data."""
-        total_views = sum(news['views'] for news in news_list)
-        total_shares = sum(news['shares'] for news in news_list)
-        total_comments = sum(news['comments'] for news in news_list)
-        
-        categories = {}
-        for news in news_list:
-            cat = news['category']
-            if cat not in categories:
-                categories[cat] = {'count': 0, 'views': 0}
-            categories[cat]['count'] += 1
-            categories[cat]['views'] += news['views']
-        
-        sources = {}
-        for news in news_list:
-            source = news['source']
-            if source not in sources:
-                sources[source] = {'count': 0, 'views': 0}
-            sources[source]['count'] += 1
-            sources[source]['views'] += news['views']
-        
-        return {
-            'total_views': total_views,
-            'total_shares': total_shares,
-            'total_comments': total_comments,
-            'categories': categories,
-            'sources': sources,
-            'avg_views': total_views // len(news_list),
-            'top_category': max(categories.items(), key=lambda x: x[1]['views'])[0],
-            'top_source': max(sources.items(), key=lambda x: x[1]['views'])[0]
-        }
+        return news_statistics(news_list)
+
+
+def news_card_context(news):
+    """Template context of one ranked news card."""
+    return {
+        'news': news,
+        'rank_class': "top-10" if news['rank'] <= 10 else "top-50" if news['rank'] <= 50 else "top-100"
+    }
 
 
 def generate_top_100_html(news_list, stats):
     """Generate HTML page for top 100 HR news."""
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     
-    # Generate news HTML
-    news_html = ""
-    for news in news_list:
-        rank_class = "top-10" if news['rank'] <= 10 else "top-50" if news['rank'] <= 50 else "top-100"
-        
-        news_html += f"""
-        <div class="news-item {rank_class}">
-            <div class="rank-badge">#{news['rank']}</div>
-            <div class="news-content">
-                <div class="news-header">
-                    <span class="source">{news['source']}</span>
-                    <span class="category">{news['category']}</span>
-                    <span class="date">{news['date']}</span>
-                </div>
-                <h3 class="title">{news['title']}</h3>
-                <p class="summary">{news['summary']}</p>
-                <div class="engagement">
-                    <span class="views">👁️ {news['views']:,} visualizações</span>
-                    <span class="shares">📤 {news['shares']:,} compartilhamentos</span>
-                    <span class="comments">💬 {news['comments']:,} comentários</span>
-                </div>
-            </div>
-        </div>
-        """
-    
-    # Generate category stats HTML
-    category_html = ""
-    for category, data in sorted(stats['categories'].items(), key=lambda x: x[1]['views'], reverse=True):
-        category_html += f"""
-        <div class="stat-item">
-            <div class="stat-label">{category}</div>
-            <div class="stat-number">{data['count']} artigos</div>
-            <div class="stat-views">{data['views']:,} visualizações</div>
-        </div>
-        """
-    
-    # Generate source stats HTML
-    source_html = ""
-    for source, data in sorted(stats['sources'].items(), key=lambda x: x[1]['views'], reverse=True):
-        source_html += f"""
-        <div class="stat-item">
-            <div class="stat-label">{source}</div>
-            <div class="stat-number">{data['count']} artigos</div>
-            <div class="stat-views">{data['views']:,} visualizações</div>
-        </div>
-        """
-    
-    html_content = f"""
-<!DOCTYPE html>
-<html lang="pt-BR">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Top 100 Notícias de RH - Mais Visualizadas</title>
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            padding: 20px;
-        }}
-        
-        .container {{
-            max-width: 1400px;
-            margin: 0 auto;
-            background: white;
-            border-radius: 15px;
-            box-shadow: 0 20px 40px rgba(0,0,0,0.1);
-            overflow: hidden;
-        }}
-        
-        .header {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 40px;
-            text-align: center;
-        }}
-        
-        .header h1 {{
-            font-size: 3em;
-            margin-bottom: 15px;
-            font-weight: 300;
-        }}
-        
-        .header p {{
-            font-size: 1.3em;
-            opacity: 0.9;
-            margin-bottom: 20px;
-        }}
-        
-        .stats-overview {{
-            background: #f8f9fa;
-            padding: 30px;
-            border-bottom: 1px solid #e9ecef;
-        }}
-        
-        .stats-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-            gap: 20px;
-            text-align: center;
-        }}
-        
-        .stat-card {{
-            background: white;
-            padding: 25px;
-            border-radius: 12px;
-            box-shadow: 0 4px 8px rgba(0,0,0,0.1);
-        }}
-        
-        .stat-number {{
-            font-size: 2.5em;
-            font-weight: bold;
-            color: #667eea;
-            margin-bottom: 10px;
-        }}
-        
-        .stat-label {{
-            color: #6c757d;
-            font-size: 1.1em;
-            font-weight: 500;
-        }}
-        
-        .content {{
-            display: grid;
-            grid-template-columns: 2fr 1fr;
-            gap: 30px;
-            padding: 30px;
-        }}
-        
-        .news-section {{
-            background: white;
-        }}
-        
-        .news-section h2 {{
-            color: #333;
-            margin-bottom: 25px;
-            font-size: 2em;
-            border-bottom: 3px solid #667eea;
-            padding-bottom: 10px;
-        }}
-        
-        .news-item {{
-            border: 1px solid #e9ecef;
-            border-radius: 12px;
-            padding: 25px;
-            margin-bottom: 20px;
-            background: white;
-            transition: transform 0.2s, box-shadow 0.2s;
-            position: relative;
-        }}
-        
-        .news-item:hover {{
-            transform: translateY(-3px);
-            box-shadow: 0 12px 30px rgba(0,0,0,0.15);
-        }}
-        
-        .news-item.top-10 {{
-            border-left: 5px solid #28a745;
-            background: linear-gradient(135deg, #f8fff9 0%, #ffffff 100%);
-        }}
-        
-        .news-item.top-50 {{
-            border-left: 5px solid #ffc107;
-        }}
-        
-        .news-item.top-100 {{
-            border-left: 5px solid #6c757d;
-        }}
-        
-        .rank-badge {{
-            position: absolute;
-            top: 15px;
-            right: 15px;
-            background: #667eea;
-            color: white;
-            padding: 8px 12px;
-            border-radius: 20px;
-            font-weight: bold;
-            font-size: 1.1em;
-        }}
-        
-        .news-header {{
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 15px;
-            flex-wrap: wrap;
-            gap: 10px;
-        }}
-        
-        .source {{
-            font-weight: bold;
-            color: #667eea;
-            font-size: 1.1em;
-        }}
-        
-        .category {{
-            background: #e9ecef;
-            color: #495057;
-            padding: 5px 12px;
-            border-radius: 20px;
-            font-size: 0.9em;
-            font-weight: 500;
-        }}
-        
-        .date {{
-            color: #6c757d;
-            font-size: 0.9em;
-        }}
-        
-        .title {{
-            font-weight: bold;
-            color: #333;
-            font-size: 1.4em;
-            margin-bottom: 15px;
-            line-height: 1.4;
-        }}
-        
-        .summary {{
-            color: #555;
-            line-height: 1.6;
-            font-size: 1.1em;
-            margin-bottom: 20px;
-        }}
-        
-        .engagement {{
-            display: flex;
-            gap: 20px;
-            flex-wrap: wrap;
-        }}
-        
-        .engagement span {{
-            font-size: 0.95em;
-            color: #6c757d;
-            background: #f8f9fa;
-            padding: 8px 15px;
-            border-radius: 20px;
-            font-weight: 500;
-        }}
-        
-        .sidebar {{
-            background: #f8f9fa;
-            padding: 25px;
-            border-radius: 12px;
-            height: fit-content;
-        }}
-        
-        .sidebar h3 {{
-            color: #333;
-            margin-bottom: 20px;
-            font-size: 1.5em;
-            border-bottom: 2px solid #667eea;
-            padding-bottom: 10px;
-        }}
-        
-        .stat-item {{
-            background: white;
-            padding: 15px;
-            border-radius: 8px;
-            margin-bottom: 15px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        
-        .stat-label {{
-            font-weight: bold;
-            color: #333;
-            font-size: 1.1em;
-            margin-bottom: 5px;
-        }}
-        
-        .stat-number {{
-            color: #667eea;
-            font-weight: bold;
-            font-size: 1.2em;
-        }}
-        
-        .stat-views {{
-            color: #6c757d;
-            font-size: 0.9em;
-            margin-top: 5px;
-        }}
-        
-        .footer {{
-            background: #f8f9fa;
-            padding: 25px;
-            text-align: center;
-            color: #6c757d;
-            border-top: 1px solid #e9ecef;
-        }}
-        
-        @media (max-width: 1200px) {{
-            .content {{
-                grid-template-columns: 1fr;
-            }}
-        }}
-        
-        @media (max-width: 768px) {{
-            .header h1 {{
-                font-size: 2.5em;
-            }}
-            
-            .news-header {{
-                flex-direction: column;
-                align-items: flex-start;
-            }}
-            
-            .engagement {{
-                flex-direction: column;
-                gap: 10px;
-            }}
-            
-            .stats-grid {{
-                grid-template-columns: 1fr;
-            }}
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>📊 Top 100 Notícias de RH</h1>
-            <p>As notícias mais visualizadas sobre Recursos Humanos no Brasil</p>
-            <p>Ranking baseado em visualizações, compartilhamentos e engajamento</p>
-        </div>
-        
-        <div class="stats-overview">
-            <div class="stats-grid">
-                <div class="stat-card">
-                    <div class="stat-number">{stats['total_views']:,}</div>
-                    <div class="stat-label">Total de Visualizações</div>
-                </div>
-                <div class="stat-card">
-                    <div class="stat-number">{stats['total_shares']:,}</div>
-                    <div class="stat-label">Total de Compartilhamentos</div>
-                </div>
-                <div class="stat-card">
-                    <div class="stat-number">{stats['total_comments']:,}</div>
-                    <div class="stat-label">Total de Comentários</div>
-                </div>
-                <div class="stat-card">
-                    <div class="stat-number">{stats['avg_views']:,}</div>
-                    <div class="stat-label">Média de Visualizações</div>
-                </div>
-            </div>
-        </div>
-        
-        <div class="content">
-            <div class="news-section">
-                <h2>🏆 Ranking das Notícias</h2>
-                {news_html}
-            </div>
-            
-            <div class="sidebar">
-                <h3>📈 Estatísticas por Categoria</h3>
-                {category_html}
-                
-                <h3>📰 Estatísticas por Fonte</h3>
-                {source_html}
-            </div>
-        </div>
-        
-        <div class="footer">
-            <p>Dados coletados em {datetime.now().strftime("%Y-%m-%d %H:%M:%S")} | Top 100 HR News Collector</p>
-            <p>Ranking baseado em visualizações, compartilhamentos e engajamento das notícias</p>
-        </div>
-    </div>
-</body>
-</html>
-    """
+    html_content = render(
+        'top_100.html',
+        stylesheet=asset_url('top_100.css'),
+        stats=stats,
+        news_html=render_each('top_100_card.html', map(news_card_context, news_list), key=None),
+        category_html=render_group_stats(stats['categories']),
+        source_html=render_group_stats(stats['sources']),
+        generated_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    )
     
     return html_content, timestamp
 
@@ -641,6 +258,7 @@ def main():
         # Save HTML file
         with open(filename, 'w', encoding='utf-8') as f:
             f.write(html_content)
+        precompress([filename, asset_path('top_100.css')])
         
         print(f"✅ Top 100 notícias coletadas e página HTML gerada!")
         print(f"📁 Arquivo: {filename}")
@@ -664,7 +282,7 @@ def main():
         print(f"\n🏆 Top 5 notícias mais visualizadas:")
         for i, news in enumerate(news_list[:5], 1):
             print(f"   {i}. {news['title'][:60]}... ({news['views']:,} visualizações)")
-        
+    
     except Exception as e:
         print(f"❌ Erro: {e}")
 
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+URL Tools
+
+URL canonicalization and deduplication for scraped articles.
+
+canonicalize_url cleans a link (lowercase host, no fragment, no tracking
+parameters, no trailing slash), SourceAllowlist checks a link's hostname
+against the configured news sources with set lookups, and DedupeIndex
+keeps hashes of canonical URLs so the same article is only counted once,
+whatever scheme, "www." prefix or tracking tags it was linked with.
+"""
+
+import hashlib
+import urllib.parse
+
+
+# Query parameters that only identify the campaign or click, never the article
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'igshid', 'mc_cid', 'mc_eid',
+    'ref', 'ref_src', 'referrer', 'cmpid', 'xtor', '_ga', 'amp'
+}
+TRACKING_PREFIXES = ('utm_', 'hsa_', 'pk_')
+
+DEFAULT_PORTS = {'http': '80', 'https': '443'}
+
+
+def is_tracking_param(name):
+    """Return True for query parameters used only for tracking."""
+    name = name.lower()
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PREFIXES)
+
+
+def normalize_host(host):
+    """Lowercase a hostname and drop a leading 'www.'."""
+    host = host.lower().rstrip('.')
+    return host[4:] if host.startswith('www.') else host
+
+
+def canonicalize_url(url, base=None):
+    """Return a cleaned, absolute form of a link."""
+    if base:
+        url = urllib.parse.urljoin(base, url)
+    
+    parts = urllib.parse.urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    
+    host = (parts.hostname or '').lower()
+    if parts.port and str(parts.port) != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    
+    path = parts.path or '/'
+    # AMP copies are the same article
+    if path.endswith('/amp') or path.endswith('/amp/'):
+        path = path[:path.rindex('/amp')] or '/'
+    if len(path) > 1:
+        path = path.rstrip('/')
+    
+    query = urllib.parse.parse_qsl(parts.query, keep_blank_values=True)
+    query = sorted((k, v) for k, v in query if not is_tracking_param(k))
+    
+    return urllib.parse.urlunsplit((scheme, host, path, urllib.parse.urlencode(query), ''))
+
+
+def dedupe_key(url):
+    """Identity of a canonical URL, ignoring scheme and a leading 'www.'."""
+    parts = urllib.parse.urlsplit(canonicalize_url(url))
+    key = normalize_host(parts.netloc) + parts.path
+    if parts.query:
+        key += '?' + parts.query
+    return key
+
+
+class SourceAllowlist:
+    """Set of allowed domains derived from source URLs; subdomains are allowed too."""
+    
+    def __init__(self, source_urls):
+        self.domains = {normalize_host(urllib.parse.urlsplit(url).hostname or '') for url in source_urls}
+        self.domains.discard('')
+    
+    def allows(self, url):
+        """Return True if the URL's host is an allowed domain or one of its subdomains."""
+        host = normalize_host(urllib.parse.urlsplit(url).hostname or '')
+        while host:
+            if host in self.domains:
+                return True
+            # Walk up one label: a.b.example.com -> b.example.com
+            dot = host.find('.')
+            if dot < 0:
+                return False
+            host = host[dot + 1:]
+        return False
+
+
+class DedupeIndex:
+    """Hash set of canonical URLs seen so far."""
+    
+    def __init__(self):
+        self.seen = set()
+    
+    def __len__(self):
+        return len(self.seen)
+    
+    def __contains__(self, url):
+        return self._hash(url) in self.seen
+    
+    def _hash(self, url):
+        return hashlib.blake2b(dedupe_key(url).encode('utf-8'), digest_size=8).digest()
+    
+    def add(self, url):
+        """Record a URL; return True if it was not seen before."""
+        digest = self._hash(url)
+        if digest in self.seen:
+            return False
+        self.seen.add(digest)
+        return True